@@ -0,0 +1,72 @@
+"""Benchmark the memory held by a validated ``ROCrateV1_2`` against a ``CompactCrate``.
+
+Synthetic crates from ``synthetic.py`` are validated and kept alive, then compacted;
+``tracemalloc`` reports the bytes each representation retains (the input dicts are
+allocated before tracing starts) and the peak while building it. ``CompactCrate.from_crate``
+shares its strings with the validated crate, so its figure leaves them out;
+``CompactCrate.load`` streams the crate from a file, counting every string, and never
+holds all the full models at once.
+
+    python benchmarks/bench_memory.py --entities 10000 100000
+"""
+import argparse
+import gc
+import pathlib
+import tempfile
+import tracemalloc
+import warnings
+
+from synthetic import DEFAULT_MIX, parse_mix, synthetic_crate
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.compact import CompactCrate
+
+
+def traced(build):
+    """Return (object, retained bytes, peak bytes) of ``build()``."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        value = build()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return value, retained, peak
+
+
+def in_memory(count, mix, seed, path):
+    """Retained and peak bytes of the validated crate and of ``CompactCrate.from_crate``.
+
+    The crate is written to ``path``; it and the input dicts are freed on return.
+    """
+    data = synthetic_crate(count, mix, seed=seed)
+    crate, crate_bytes, crate_peak = traced(lambda data=data: ROCrateV1_2.model_validate(data))
+    _, compact_bytes, compact_peak = traced(lambda crate=crate: CompactCrate.from_crate(crate))
+    crate.write(path)
+    return crate_bytes, crate_peak, compact_bytes, compact_peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", type=int, nargs="+", default=[10000], help="entity counts of the synthetic crates")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="type mix, e.g. dataset=0.7,computation=0.3")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # the models warn about unmapped optional properties; keep the report readable
+    warnings.simplefilter("ignore")
+    for count in args.entities:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "ro-crate-metadata.json"
+            crate_bytes, crate_peak, compact_bytes, compact_peak = in_memory(count, args.mix, args.seed, path)
+            _, loaded_bytes, loaded_peak = traced(lambda path=path: CompactCrate.load(path))
+
+        print(f"{count} entities")
+        print(f"  ROCrateV1_2            retained {crate_bytes / 2**20:9.1f} MiB  peak {crate_peak / 2**20:9.1f} MiB")
+        print(f"  CompactCrate           retained {compact_bytes / 2**20:9.1f} MiB  peak {compact_peak / 2**20:9.1f} MiB"
+              f"  ({compact_bytes / crate_bytes:.0%})")
+        print(f"  CompactCrate.load      retained {loaded_bytes / 2**20:9.1f} MiB  peak {loaded_peak / 2**20:9.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
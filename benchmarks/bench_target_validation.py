@@ -0,0 +1,56 @@
+"""Time ``ROCToTargetConverter._instantiate_models`` with every target object validated on its own
+(``"validate": "each"``) against the objects of a target class validated in one call (``"validate": "end"``).
+
+Runs the Croissant and datasheet preview configurations over a synthetic crate.
+
+    python benchmarks/bench_target_validation.py --entities 20000 --repeat 9
+"""
+import argparse
+import gc
+import time
+import warnings
+
+from synthetic import synthetic_crate
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.conversion.converter import ROCToTargetConverter
+from fairscape_models.conversion.mapping.croissant import MAPPING_CONFIGURATION
+from fairscape_models.conversion.mapping.FairscapeDatasheet import PREVIEW_MAPPING_CONFIGURATION
+
+
+def with_validate(configuration: dict, mode: str) -> dict:
+    entity_map = {key: dict(rule, validate=mode) if rule else rule for key, rule in configuration["entity_map"].items()}
+    return dict(configuration, entity_map=entity_map)
+
+
+def instantiate_time(crate: ROCrateV1_2, configuration: dict) -> float:
+    converter = ROCToTargetConverter(crate, configuration)
+    converter._create_argument_dictionaries()
+    gc.collect()
+    start = time.perf_counter()
+    converter._instantiate_models()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=9)
+    args = parser.parse_args()
+
+    with warnings.catch_warnings():
+        # serializing the synthetic Schema elements warns, and is not what is measured here
+        warnings.simplefilter("ignore")
+        crate = ROCrateV1_2.model_validate_graph(synthetic_crate(args.entities))
+
+    for name, configuration in (("croissant", MAPPING_CONFIGURATION), ("preview", PREVIEW_MAPPING_CONFIGURATION)):
+        timings = {"each": [], "end": []}
+        # interleaved, so drift on a busy machine affects both modes alike
+        for _ in range(args.repeat):
+            for mode, mode_timings in timings.items():
+                mode_timings.append(instantiate_time(crate, with_validate(configuration, mode)))
+        each, end = min(timings["each"]), min(timings["end"])
+        print(f"{name:10} each {each:8.4f} s   end {end:8.4f} s  ({each / end:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark ``ROCrateV1_2.model_validate`` against ``ROCrateV1_2.model_validate_graph``
+and ``ROCrateV1_2.model_validate_parallel``, and reloading a written crate with
+``json.loads`` + ``model_validate_graph`` against ``ROCrateV1_2.model_validate_graph_json``.
+
+The release fixture under ``tests/test_rocrates/release`` is scaled up synthetically
+by cloning its sub-crate entries under fresh ``@id`` values.
+
+    python benchmarks/bench_validation.py --copies 2000 --repeat 5 --workers 8
+"""
+import argparse
+import copy
+import functools
+import json
+import os
+import pathlib
+import time
+
+from fairscape_models.rocrate import ROCrateV1_2
+
+RELEASE_CRATE = pathlib.Path(__file__).parent.parent / "tests" / "test_rocrates" / "release" / "ro-crate-metadata.json"
+
+
+def scaled_release(copies: int) -> dict:
+    """Return the release crate with its sub-crate entries repeated ``copies`` times."""
+    with RELEASE_CRATE.open("r", encoding="utf-8") as f:
+        crate = json.load(f)
+
+    head, entries = crate["@graph"][:2], crate["@graph"][2:]
+    graph = list(head)
+    for n in range(copies):
+        for entry in entries:
+            clone = copy.deepcopy(entry)
+            clone["@id"] = f"{entry['@id'].rstrip('/')}-copy{n}"
+            graph.append(clone)
+    crate["@graph"] = graph
+    return crate
+
+
+def best_of(repeat: int, func, make_input) -> float:
+    timings = []
+    for _ in range(repeat):
+        # validate_metadata_graph rewrites @graph in place, give every run a fresh copy
+        data = make_input()
+        start = time.perf_counter()
+        func(data)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--copies", type=int, default=1000, help="number of times the sub-crate entries are cloned")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes for model_validate_parallel")
+    args = parser.parse_args()
+
+    crate = scaled_release(args.copies)
+    make_input = lambda: {"@context": crate["@context"], "@graph": [dict(item) for item in crate["@graph"]]}
+    print(f"@graph entries: {len(crate['@graph'])}")
+
+    baseline = best_of(args.repeat, ROCrateV1_2.model_validate, make_input)
+    fast = best_of(args.repeat, ROCrateV1_2.model_validate_graph, make_input)
+    parallel = best_of(
+        args.repeat, functools.partial(ROCrateV1_2.model_validate_parallel, workers=args.workers), make_input
+    )
+    print(f"model_validate        {baseline:8.3f} s")
+    print(f"model_validate_graph  {fast:8.3f} s  ({baseline / fast:.2f}x)")
+    print(f"model_validate_parallel ({args.workers} workers) {parallel:8.3f} s  ({baseline / parallel:.2f}x)")
+
+    written = ROCrateV1_2.model_validate_graph(make_input()).model_dump_json(by_alias=True)
+    parsed = best_of(args.repeat, lambda text: ROCrateV1_2.model_validate_graph(json.loads(text)), lambda: written)
+    reloaded = best_of(args.repeat, ROCrateV1_2.model_validate_graph_json, lambda: written)
+    print(f"reload: json.loads + model_validate_graph {parsed:8.3f} s")
+    print(f"reload: model_validate_graph_json         {reloaded:8.3f} s  ({parsed / reloaded:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
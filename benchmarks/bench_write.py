@@ -0,0 +1,54 @@
+"""Compare peak memory and time of ``ROCrateV1_2.write`` against ``model_dump`` + ``json.dump``.
+
+Uses the scaled release crate from ``bench_validation``; memory is the peak traced by
+``tracemalloc`` while serializing, excluding the crate itself.
+
+    python benchmarks/bench_write.py --copies 2000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from bench_validation import scaled_release
+from fairscape_models.rocrate import ROCrateV1_2
+
+
+def measure(func, path):
+    start = time.perf_counter()
+    func(path)
+    elapsed = time.perf_counter() - start
+    # traced separately, tracemalloc slows allocation heavy code down a lot
+    tracemalloc.start()
+    func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--copies", type=int, default=1000, help="number of times the sub-crate entries are cloned")
+    args = parser.parse_args()
+
+    crate = ROCrateV1_2.model_validate(scaled_release(args.copies))
+    print(f"@graph entries: {len(crate.metadataGraph)}")
+
+    def dump(path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(crate.model_dump(by_alias=True), f)
+
+    def write(path):
+        crate.write(path)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ro-crate-metadata.json")
+        for name, func in (("model_dump + json.dump", dump), ("ROCrateV1_2.write", write)):
+            elapsed, peak = measure(func, path)
+            print(f"{name:24s} {elapsed:8.3f} s  peak {peak / 2**10:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
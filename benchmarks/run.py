@@ -0,0 +1,255 @@
+"""Benchmark suite for the model validation, conversion and scoring hot paths.
+
+Every benchmark runs on synthetic crates from ``synthetic.py`` at each requested entity
+count. A benchmark is timed ``--repeat`` times with garbage collection disabled, on
+input prepared outside the timed region, and the best and median times are reported.
+
+Save the results of one release and compare another against them to catch regressions:
+
+    python benchmarks/run.py --entities 1000 10000 --json baseline.json
+    python benchmarks/run.py --entities 1000 10000 --compare baseline.json --threshold 1.25
+
+With ``--compare`` the exit status is 1 when any best time is more than ``--threshold``
+times the baseline.
+"""
+import argparse
+import copy
+import gc
+import json
+import pathlib
+import statistics
+import sys
+import tempfile
+import time
+import types
+import warnings
+from typing import Any, Callable, Dict, List, Tuple
+
+from synthetic import DEFAULT_MIX, parse_mix, synthetic_crate, synthetic_csv
+from fairscape_models._version import __version__
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.dataset import Dataset
+from fairscape_models.conversion.converter import ROCToTargetConverter, TargetToROCrateConverter
+from fairscape_models.conversion.d4d_converter import D4DConverter
+from fairscape_models.conversion.mapping import croissant
+from fairscape_models.conversion.mapping.AIReady import score_rocrate
+from fairscape_models.conversion.mapping.FairscapeDatasheet import (
+    OVERVIEW_MAPPING_CONFIGURATION, USECASES_MAPPING_CONFIGURATION, DISTRIBUTION_MAPPING_CONFIGURATION,
+)
+from fairscape_models.conversion.mapping.d4d_to_rocrate import (
+    DATASET_COLLECTION_TO_RELEASE_MAPPING, DATASET_TO_SUBCRATE_MAPPING,
+)
+from fairscape_models.conversion.mapping.subcrate_utils import build_composition_details
+from fairscape_models.conversion.multi_target import MAPPING_TARGETS, convert_targets
+
+# a benchmark returns (make_input, func): make_input runs untimed before every timed func(input)
+Benchmark = Callable[[dict, pathlib.Path], Tuple[Callable[[], Any], Callable[[Any], Any]]]
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str):
+    def register(func: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def _fresh(data: dict) -> dict:
+    # validate_metadata_graph rewrites @graph in place
+    return {"@context": data["@context"], "@graph": [dict(item) for item in data["@graph"]]}
+
+
+def _validated(data: dict) -> ROCrateV1_2:
+    return ROCrateV1_2.model_validate(_fresh(data))
+
+
+@benchmark("model_validate")
+def bench_model_validate(data, tmp):
+    return lambda: _fresh(data), ROCrateV1_2.model_validate
+
+
+@benchmark("model_validate_graph_json")
+def bench_model_validate_graph_json(data, tmp):
+    written = _validated(data).model_dump_json(by_alias=True)
+    return lambda: written, ROCrateV1_2.model_validate_graph_json
+
+
+@benchmark("cleanIdentifiers")
+def bench_clean_identifiers(data, tmp):
+    return lambda: _validated(data), lambda crate: crate.cleanIdentifiers()
+
+
+@benchmark("getEVIElements")
+def bench_get_evi_elements(data, tmp):
+    crate = _validated(data)
+
+    def cold():
+        # includes building the graph index
+        crate.invalidateIndex()
+        return crate
+    return cold, lambda crate: crate.getEVIElements()
+
+
+@benchmark("to_columns")
+def bench_to_columns(data, tmp):
+    crate = _validated(data)
+    return lambda: crate, lambda crate: crate.to_columns()
+
+
+@benchmark("convert_croissant")
+def bench_convert_croissant(data, tmp):
+    crate = _validated(data)
+    return lambda: crate, lambda crate: ROCToTargetConverter(crate, croissant.MAPPING_CONFIGURATION).convert()
+
+
+@benchmark("convert_datasheet")
+def bench_convert_datasheet(data, tmp):
+    crate = _validated(data)
+    configs = (OVERVIEW_MAPPING_CONFIGURATION, USECASES_MAPPING_CONFIGURATION, DISTRIBUTION_MAPPING_CONFIGURATION)
+
+    def convert(crate):
+        return [ROCToTargetConverter(crate, config).convert() for config in configs]
+    return lambda: crate, convert
+
+
+@benchmark("score_rocrate")
+def bench_score_rocrate(data, tmp):
+    crate = _validated(data)
+    return lambda: crate, score_rocrate
+
+
+@benchmark("build_composition_details")
+def bench_build_composition_details(data, tmp):
+    converter = ROCToTargetConverter(_validated(data), OVERVIEW_MAPPING_CONFIGURATION)
+    return lambda: converter, lambda converter: build_composition_details(converter, converter.root_entity)
+
+
+@benchmark("d4d_convert")
+def bench_d4d_convert(data, tmp):
+    crate = _validated(data)
+    return lambda: D4DConverter(crate), lambda converter: converter.convert()
+
+
+@benchmark("all_targets_separately")
+def bench_all_targets_separately(data, tmp):
+    crate = _validated(data)
+
+    def convert(crate):
+        outputs = [ROCToTargetConverter(crate, config).convert() for config in MAPPING_TARGETS.values()]
+        d4d = D4DConverter(crate)
+        d4d.convert()
+        return outputs + [score_rocrate(crate), d4d.d4dOutput]
+    return lambda: crate, convert
+
+
+@benchmark("convert_targets")
+def bench_convert_targets(data, tmp):
+    crate = _validated(data)
+    return lambda: crate, convert_targets
+
+
+@benchmark("target_to_rocrate")
+def bench_target_to_rocrate(data, tmp):
+    # a D4D collection with one resource per entity
+    resources = [
+        {"id": item["@id"], "title": item.get("name"), "description": item.get("description"),
+         "creators": [item.get("author")], "bytes": 1024, "keywords": item.get("keywords")}
+        for item in data["@graph"]
+    ]
+    collection = types.SimpleNamespace(id="ark:59852/collection", title="Collection", description="Synthetic collection.", resources=resources)
+
+    def convert(collection):
+        return TargetToROCrateConverter(collection, DATASET_TO_SUBCRATE_MAPPING, DATASET_COLLECTION_TO_RELEASE_MAPPING).convert()
+    return lambda: collection, convert
+
+
+@benchmark("add_summary_stats")
+def bench_add_summary_stats(data, tmp):
+    # one row per entity, so the table scales with the crate
+    rows = len(data["@graph"])
+    path = synthetic_csv(tmp / f"table-{rows}.csv", rows=rows)
+    dataset = Dataset.model_validate({
+        "@id": "ark:59852/summary-table", "@type": "https://w3id.org/EVI#Dataset",
+        "name": "Summary table", "author": "Synthetic Author", "datePublished": "2025-01-01",
+        "description": "Table read by add_summary_stats.", "keywords": [], "format": "text/csv",
+        "contentUrl": str(path),
+    })
+    return lambda: dataset.model_copy(), lambda dataset: dataset.add_summary_stats()
+
+
+def measure(repeat: int, make_input: Callable[[], Any], func: Callable[[Any], Any]) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        value = make_input()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func(value)
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return timings
+
+
+def run(entities: List[int], mix: Dict[str, float], names: List[str], repeat: int, seed: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in entities:
+            data = synthetic_crate(count, mix, seed=seed)
+            for name in names:
+                make_input, func = BENCHMARKS[name](copy.deepcopy(data), pathlib.Path(tmp))
+                func(make_input())  # warm up caches shared across runs, e.g. resolvers and plans
+                timings = measure(repeat, make_input, func)
+                key = f"{name}[{count}]"
+                results[key] = {"best": min(timings), "median": statistics.median(timings)}
+                print(f"{key:36s} best {results[key]['best']:9.4f} s  median {results[key]['median']:9.4f} s", flush=True)
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: dict, threshold: float) -> bool:
+    """Print the ratio of every best time to the baseline; return True if none exceeds ``threshold``."""
+    ok = True
+    print(f"\ncompared with {baseline.get('version', 'unknown')} (threshold {threshold:.2f}x)")
+    for key, result in results.items():
+        previous = baseline["results"].get(key)
+        if previous is None:
+            print(f"{key:36s} no baseline")
+            continue
+        ratio = result["best"] / previous["best"]
+        regressed = ratio > threshold
+        ok = ok and not regressed
+        print(f"{key:36s} {ratio:6.2f}x{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", type=int, nargs="+", default=[1000], help="entity counts of the synthetic crates")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="type mix, e.g. dataset=0.7,computation=0.3")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), default=list(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=pathlib.Path, help="write the results to this file")
+    parser.add_argument("--compare", type=pathlib.Path, help="results file of a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    # the mappings warn about unmapped optional properties; keep the report readable
+    warnings.simplefilter("ignore")
+    print(f"fairscape_models {__version__}, Python {sys.version.split()[0]}")
+    results = run(args.entities, args.mix, args.only, args.repeat, args.seed)
+
+    if args.json:
+        with args.json.open("w", encoding="utf-8") as f:
+            json.dump({"version": __version__, "mix": args.mix, "seed": args.seed, "results": results}, f, indent=2)
+    if args.compare:
+        with args.compare.open("r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
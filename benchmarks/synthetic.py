@@ -0,0 +1,189 @@
+"""Synthetic RO-Crates for the benchmarks, parameterized by entity count and type mix.
+
+Crates are generated from a seed, so the same arguments always give the same crate.
+Entities reference each other the way FAIRSCAPE crates do: computations use datasets
+and software and generate datasets, experiments use samples and instruments, datasets
+point to their schema. A share of the references carry the ``https://fairscape.net/``
+prefix so that ``cleanIdentifiers`` has work to do.
+"""
+import csv
+import pathlib
+import random
+from typing import Dict, List, Optional
+
+ROOT_GUID = "ark:59852/synthetic-crate"
+
+DEFAULT_MIX = {
+    "dataset": 0.5,
+    "software": 0.05,
+    "computation": 0.2,
+    "sample": 0.1,
+    "experiment": 0.05,
+    "instrument": 0.05,
+    "schema": 0.05,
+}
+
+FORMATS = ["text/csv", "text/tab-separated-values", "application/parquet", "image/tiff", "application/json"]
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Parse a type mix such as ``dataset=0.7,computation=0.3``."""
+    mix = {}
+    for part in text.split(","):
+        kind, _, weight = part.partition("=")
+        kind = kind.strip()
+        if kind not in DEFAULT_MIX:
+            raise ValueError(f"unknown entity type {kind!r}, expected one of {sorted(DEFAULT_MIX)}")
+        mix[kind] = float(weight)
+    return mix
+
+
+def entity_counts(entities: int, mix: Optional[Dict[str, float]] = None) -> Dict[str, int]:
+    """Split ``entities`` over the types of ``mix`` proportionally to their weights."""
+    mix = mix or DEFAULT_MIX
+    total = sum(mix.values())
+    counts = {kind: int(entities * weight / total) for kind, weight in mix.items()}
+    # hand the rounding remainder to the heaviest type
+    heaviest = max(mix, key=mix.get)
+    counts[heaviest] += entities - sum(counts.values())
+    return counts
+
+
+def _ref(rng: random.Random, guid: str, prefixed: float) -> Dict[str, str]:
+    if rng.random() < prefixed:
+        return {"@id": f"https://fairscape.net/{guid}"}
+    return {"@id": guid}
+
+
+def _refs(rng: random.Random, guids: List[str], k: int, prefixed: float) -> List[Dict[str, str]]:
+    if not guids:
+        return []
+    return [_ref(rng, guid, prefixed) for guid in rng.sample(guids, min(k, len(guids)))]
+
+
+def synthetic_crate(
+    entities: int = 1000,
+    mix: Optional[Dict[str, float]] = None,
+    seed: int = 0,
+    prefixed: float = 0.2,
+) -> dict:
+    """Return a serialized crate with ``entities`` elements besides the descriptor and root.
+
+    :param entities: number of generated elements
+    :param mix: relative weight per entity type, see ``DEFAULT_MIX``
+    :param seed: seed of the generator
+    :param prefixed: share of references written as ``https://fairscape.net/ark:...``
+    """
+    rng = random.Random(seed)
+    counts = entity_counts(entities, mix)
+    guids = {kind: [f"ark:59852/{kind}-{n}" for n in range(count)] for kind, count in counts.items()}
+    for kind in DEFAULT_MIX:
+        guids.setdefault(kind, [])
+    graph = []
+
+    for n, guid in enumerate(guids["schema"]):
+        graph.append({
+            "@id": guid, "@type": "https://w3id.org/EVI#Schema",
+            "name": f"Schema {n}", "description": f"Columns of synthetic table {n}.",
+            "properties": {
+                f"column_{c}": {"description": f"Column {c}", "index": c, "type": rng.choice(["string", "number", "integer"])}
+                for c in range(rng.randint(3, 8))
+            },
+        })
+
+    for n, guid in enumerate(guids["software"]):
+        graph.append({
+            "@id": guid, "@type": "https://w3id.org/EVI#Software",
+            "name": f"Software {n}", "author": "Synthetic Author", "dateModified": "2025-01-01",
+            "description": f"Analysis script number {n}.", "format": "text/x-python",
+            "contentUrl": f"https://github.com/example/tool-{n}", "version": "1.0",
+        })
+
+    for n, guid in enumerate(guids["instrument"]):
+        graph.append({
+            "@id": guid, "@type": "https://w3id.org/EVI#Instrument",
+            "name": f"Instrument {n}", "manufacturer": "Example Instruments", "model": f"X-{n}",
+            "description": f"Synthetic instrument {n}.",
+        })
+
+    for n, guid in enumerate(guids["sample"]):
+        graph.append({
+            "@id": guid, "@type": "https://w3id.org/EVI#Sample",
+            "name": f"Sample {n}", "author": "Synthetic Author", "description": f"Synthetic sample {n}.",
+            "keywords": ["synthetic"],
+        })
+
+    # datasets generated by a computation or experiment point back to it
+    producers = guids["computation"] + guids["experiment"]
+    producer_of: Dict[str, str] = {}
+    for guid in guids["dataset"]:
+        if producers and rng.random() < 0.7:
+            producer_of[guid] = rng.choice(producers)
+    generated: Dict[str, List[str]] = {}
+    for dataset, producer in producer_of.items():
+        generated.setdefault(producer, []).append(dataset)
+    inputs = [guid for guid in guids["dataset"] if guid not in producer_of] or guids["dataset"]
+
+    for n, guid in enumerate(guids["dataset"]):
+        file_format = rng.choice(FORMATS)
+        element = {
+            "@id": guid, "@type": "https://w3id.org/EVI#Dataset",
+            "name": f"Dataset {n}", "author": "Synthetic Author", "datePublished": "2025-01-01",
+            "description": f"Synthetic dataset number {n}.", "keywords": ["synthetic", file_format.split("/")[-1]],
+            "format": file_format, "contentUrl": f"file:///data/dataset-{n}.{file_format.split('/')[-1]}",
+            "contentSize": f"{rng.randint(1, 999)}.{rng.randint(0, 9)} {rng.choice(['KB', 'MB', 'GB'])}",
+            "md5": f"{rng.getrandbits(128):032x}",
+        }
+        if guid in producer_of:
+            element["generatedBy"] = [_ref(rng, producer_of[guid], prefixed)]
+        if guids["schema"]:
+            element["schema"] = _ref(rng, rng.choice(guids["schema"]), prefixed)
+        graph.append(element)
+
+    for n, guid in enumerate(guids["computation"]):
+        graph.append({
+            "@id": guid, "@type": "https://w3id.org/EVI#Computation",
+            "name": f"Computation {n}", "runBy": "Synthetic Author", "dateCreated": "2025-01-01",
+            "description": f"Synthetic computation {n}.",
+            "usedSoftware": _refs(rng, guids["software"], 1, prefixed),
+            "usedDataset": _refs(rng, inputs, rng.randint(1, 3), prefixed),
+            "generated": [_ref(rng, dataset, prefixed) for dataset in generated.get(guid, [])],
+        })
+
+    for n, guid in enumerate(guids["experiment"]):
+        graph.append({
+            "@id": guid, "@type": "https://w3id.org/EVI#Experiment",
+            "name": f"Experiment {n}", "description": f"Synthetic experiment {n}.",
+            "experimentType": rng.choice(["imaging", "sequencing", "mass spectrometry"]),
+            "runBy": "Synthetic Author", "datePerformed": "2025-01-01",
+            "usedSample": _refs(rng, guids["sample"], 2, prefixed),
+            "usedInstrument": _refs(rng, guids["instrument"], 1, prefixed),
+            "generated": [_ref(rng, dataset, prefixed) for dataset in generated.get(guid, [])],
+        })
+
+    head = [
+        {
+            "@id": "ro-crate-metadata.json", "@type": "CreativeWork",
+            "conformsTo": {"@id": "https://w3id.org/ro/crate/1.2"}, "about": {"@id": ROOT_GUID},
+        },
+        {
+            "@id": ROOT_GUID, "@type": ["Dataset", "https://w3id.org/EVI#ROCrate"],
+            "name": "Synthetic Crate", "description": f"A synthetic crate with {entities} entities.",
+            "keywords": ["synthetic", "benchmark"], "version": "1.0", "author": "Synthetic Author",
+            "license": "https://creativecommons.org/licenses/by/4.0/", "datePublished": "2025-01-01",
+            "publisher": "Synthetic Publisher", "principalInvestigator": "Synthetic Investigator",
+            "hasPart": [{"@id": element["@id"]} for element in graph],
+        },
+    ]
+    return {"@context": {"@vocab": "https://schema.org/", "EVI": "https://w3id.org/EVI#"}, "@graph": head + graph}
+
+
+def synthetic_csv(path: pathlib.Path, rows: int, columns: int = 10, seed: int = 0) -> pathlib.Path:
+    """Write a csv table of ``rows`` x ``columns`` random values, for ``Dataset.add_summary_stats``."""
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([f"column_{c}" for c in range(columns)])
+        for _ in range(rows):
+            writer.writerow([f"{rng.random():.6f}" for _ in range(columns)])
+    return path
@@ -0,0 +1,171 @@
+""" Arrow and Parquet tables of RO-Crate graphs
+
+A crate's ``@graph`` is stored as one table per model class (``Dataset``, ``Software``,
+``Computation``, ...) with one column per serialized property, and an ``edges`` table of
+the identifier references between elements. Properties whose values are all strings, all
+integers, all floats or all booleans keep their type; any other column (lists, nested
+objects, mixed types) holds JSON text and is listed in the table metadata. Every table
+carries the crate's ``@context`` and each row its position in the graph, so
+``from_arrow`` rebuilds the crate in its original order.
+
+Requires ``pyarrow`` (``pip install fairscape-models[arrow]``).
+"""
+import json
+import os
+import pathlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type, Union, get_args
+
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+from fairscape_models.graph_index import iter_entity_references
+from fairscape_models.rocrate import ROCrateV1_2
+
+if TYPE_CHECKING:
+    import pyarrow
+
+EDGES_TABLE = "edges"
+POSITION_COLUMN = "_position"
+
+_CONTEXT_KEY = b"fairscape.context"
+_JSON_COLUMNS_KEY = b"fairscape.json_columns"
+_NATIVE_TYPES = (str, bool, int, float)
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError("Arrow and Parquet support requires pyarrow: pip install fairscape-models[arrow]") from error
+    return pyarrow
+
+
+def _graph_classes(crate_class: Type[ROCrateV1_2]) -> Dict[str, Type[BaseModel]]:
+    """ The ``metadataGraph`` member classes of a crate class, by class name """
+    union = get_args(crate_class.model_fields["metadataGraph"].annotation)[0]
+    return {model_class.__name__: model_class for model_class in get_args(union)}
+
+
+def _columns(rows: List[Dict[str, Any]]) -> Tuple[Dict[str, List[Any]], List[str]]:
+    """ Column lists of serialized elements, and the names of the columns encoded as JSON """
+    names: Dict[str, None] = {}
+    for row in rows:
+        names.update(dict.fromkeys(row))
+
+    columns = {}
+    json_columns = []
+    for name in names:
+        values = [row.get(name) for row in rows]
+        kinds = {type(value) for value in values if value is not None}
+        if len(kinds) > 1 or not kinds <= set(_NATIVE_TYPES):
+            values = [None if value is None else to_json(value).decode() for value in values]
+            json_columns.append(name)
+        columns[name] = values
+    return columns, json_columns
+
+
+def _decode_json_column(column: "pyarrow.ChunkedArray") -> List[Any]:
+    # one parse per column instead of one per cell
+    return from_json("[" + ",".join("null" if value is None else value for value in column.to_pylist()) + "]")
+
+
+def to_arrow(crate: ROCrateV1_2) -> Dict[str, "pyarrow.Table"]:
+    """ Tables of a crate's graph: one per model class, named after it, and ``edges``
+
+    The ``edges`` table has one row per identifier reference, with the referencing element
+    (``source``), the property holding the reference (``key``) and the referenced ``@id``
+    (``target``), as returned by ``fairscape_models.graph_index.iter_entity_references``.
+
+    :param crate: the crate to export
+    :return: Arrow tables by name
+    """
+    pa = _pyarrow()
+    context = crate.model_dump(include={"context"}, by_alias=True, mode="json").get("@context")
+    context_json = to_json(context)
+
+    rows_by_class: Dict[str, List[Dict[str, Any]]] = {}
+    edges: Dict[str, List[Any]] = {"source": [], "key": [], "target": []}
+    for position, entity in enumerate(crate.metadataGraph):
+        row = entity.model_dump(by_alias=True, mode="json")
+        row[POSITION_COLUMN] = position
+        rows_by_class.setdefault(type(entity).__name__, []).append(row)
+        for key, ref in iter_entity_references(entity):
+            edges["source"].append(entity.guid)
+            edges["key"].append(key)
+            edges["target"].append(ref)
+
+    tables = {}
+    for name, rows in rows_by_class.items():
+        columns, json_columns = _columns(rows)
+        tables[name] = pa.table(columns).replace_schema_metadata({
+            _CONTEXT_KEY: context_json,
+            _JSON_COLUMNS_KEY: json.dumps(json_columns).encode(),
+        })
+    edges_table = pa.table(edges, schema=pa.schema([("source", pa.string()), ("key", pa.string()), ("target", pa.string())]))
+    tables[EDGES_TABLE] = edges_table.replace_schema_metadata({_CONTEXT_KEY: context_json})
+    return tables
+
+
+def from_arrow(tables: Dict[str, "pyarrow.Table"], crate_class: Type[ROCrateV1_2] = ROCrateV1_2) -> ROCrateV1_2:
+    """ Rebuild a crate from tables written by ``to_arrow``, validating each element
+
+    Null cells are left out of the rebuilt elements, so those properties take their
+    defaults, and extra properties follow the column order of their table. The ``edges``
+    table is not read; references are part of the class tables.
+
+    :param tables: Arrow tables by name, as returned by ``to_arrow``
+    :param crate_class: the crate model, whose ``metadataGraph`` classes name the tables
+    :return: the crate, with its elements in their original graph order
+    """
+    classes = _graph_classes(crate_class)
+    unknown = [name for name in tables if name != EDGES_TABLE and name not in classes]
+    if unknown:
+        raise ValueError(f"Tables {unknown} do not name a {crate_class.__name__} graph class")
+
+    data: Dict[str, Any] = {}
+    positioned = []
+    for name, table in tables.items():
+        metadata = table.schema.metadata or {}
+        if _CONTEXT_KEY in metadata:
+            data["@context"] = json.loads(metadata[_CONTEXT_KEY])
+        if name == EDGES_TABLE:
+            continue
+        model_class = classes[name]
+        json_columns = set(json.loads(metadata.get(_JSON_COLUMNS_KEY, b"[]")))
+        names = table.column_names
+        columns = [
+            _decode_json_column(table.column(column)) if column in json_columns else table.column(column).to_pylist()
+            for column in names
+        ]
+        for values in zip(*columns):
+            item = {key: value for key, value in zip(names, values) if value is not None}
+            position = item.pop(POSITION_COLUMN)
+            positioned.append((position, model_class.model_validate(item)))
+
+    positioned.sort(key=lambda pair: pair[0])
+    return crate_class._from_validated_graph(data, [element for _, element in positioned])
+
+
+def write_parquet(crate: ROCrateV1_2, directory: Union[str, os.PathLike]):
+    """ Write the tables of ``to_arrow`` to ``directory/<table>.parquet``
+
+    :param crate: the crate to export
+    :param directory: created if missing
+    """
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, table in to_arrow(crate).items():
+        pq.write_table(table, directory / f"{name}.parquet")
+
+
+def read_parquet(directory: Union[str, os.PathLike], crate_class: Type[ROCrateV1_2] = ROCrateV1_2) -> ROCrateV1_2:
+    """ Read a crate written by ``write_parquet``; see ``from_arrow``
+    """
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    tables = {path.stem: pq.read_table(path) for path in sorted(pathlib.Path(directory).glob("*.parquet"))}
+    return from_arrow(tables, crate_class)
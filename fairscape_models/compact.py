@@ -0,0 +1,266 @@
+""" Read-only, memory compact views of RO-Crate graphs
+
+``CompactCrate`` holds the elements of a crate as ``CompactEntity`` objects: one slotted
+class per model class, so every element stores its field values in a fixed array
+instead of a ``__dict__``. Identifier references (``usedDataset``, ``generated``,
+``hasPart``, ...) become ``CompactReference`` tuples with an interned ``guid``, lists
+become tuples, and strings are interned so repeated values (formats, authors, dates)
+are stored once. Elements and references keep the attribute names of the models
+(``.guid``, ``.name``, ``.usedDataset[0].guid``) and the crate keeps the query methods
+of ``ROCrateV1_2`` (``getDatasets()``, ``getEntity()``, ...).
+
+Compact elements cannot be modified; ``CompactEntity.to_model`` rebuilds the validated
+model when one is needed.
+"""
+import os
+import sys
+from typing import IO, Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from fairscape_models.fairscape_base import IdentifierValue, extractGUID
+from fairscape_models.graph_index import _field_keys, string_reference_fields
+from fairscape_models.json_stream import MAX_VALUE_SIZE
+from fairscape_models.rocrate import ROCrateV1_2, ROCrateMetadataElem
+from fairscape_models.schema import Schema
+from fairscape_models.dataset import Dataset
+from fairscape_models.software import Software
+from fairscape_models.computation import Computation
+from fairscape_models.annotation import Annotation
+from fairscape_models.experiment import Experiment
+from fairscape_models.mlmodel import MLModel
+from fairscape_models.biochem_entity import BioChemEntity
+from fairscape_models.medical_condition import MedicalCondition
+
+
+class CompactReference(NamedTuple):
+    """ An identifier reference, ``{"@id": guid}`` """
+    guid: str
+
+
+def _compact_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return tuple(_compact_value(item) for item in value)
+    if type(value) is IdentifierValue and not value.__pydantic_extra__:
+        return CompactReference(sys.intern(value.guid))
+    if isinstance(value, dict) and len(value) == 1 and isinstance(value.get("@id"), str):
+        return CompactReference(sys.intern(value["@id"]))
+    return value
+
+
+def _expanded_value(value: Any) -> Any:
+    if isinstance(value, CompactReference):
+        return {"@id": value.guid}
+    if isinstance(value, tuple):
+        return [_expanded_value(item) for item in value]
+    return value
+
+
+class CompactEntity:
+    """ Read-only element of a ``CompactCrate``
+
+    Subclasses are generated per model class by ``compact_class``; ``model_class`` is the
+    model the element was built from. Extra properties are read from ``extra``.
+    """
+    __slots__ = ("extra",)
+    model_class: Type[BaseModel] = BaseModel
+    field_names: Tuple[str, ...] = ()
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            extra = object.__getattribute__(self, "extra")
+        except AttributeError:
+            extra = None
+        if extra and name in extra:
+            return extra[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(guid={getattr(self, 'guid', None)!r})"
+
+    def values(self) -> Iterator[Tuple[str, Any]]:
+        """ Yield ``(attribute, value)`` for every field and extra property """
+        for name in self.field_names:
+            yield name, getattr(self, name)
+        if self.extra:
+            yield from self.extra.items()
+
+    def to_model(self) -> BaseModel:
+        """ Validate the element back into its ``model_class`` """
+        keys = _field_keys(self.model_class)
+        data = {keys[name]: _expanded_value(getattr(self, name)) for name in self.field_names}
+        if self.extra:
+            # extra properties are stored under their serialized keys
+            data.update((key, _expanded_value(value)) for key, value in self.extra.items())
+        return self.model_class.model_validate(data)
+
+
+_COMPACT_CLASSES: Dict[type, Type[CompactEntity]] = {}
+
+
+def compact_class(model_class: Type[BaseModel]) -> Type[CompactEntity]:
+    """ The slotted ``CompactEntity`` subclass storing elements of ``model_class`` """
+    compact = _COMPACT_CLASSES.get(model_class)
+    if compact is None:
+        names = tuple(model_class.model_fields)
+        compact = type(f"Compact{model_class.__name__}", (CompactEntity,), {
+            "__slots__": names, "model_class": model_class, "field_names": names,
+        })
+        _COMPACT_CLASSES[model_class] = compact
+    return compact
+
+
+def compact_entity(entity: BaseModel) -> CompactEntity:
+    """ Copy a model instance into its compact, read-only form """
+    compact = compact_class(type(entity))
+    element = object.__new__(compact)
+    values = entity.__dict__
+    for name in compact.field_names:
+        object.__setattr__(element, name, _compact_value(values.get(name)))
+    extra = entity.__pydantic_extra__
+    object.__setattr__(element, "extra", {sys.intern(key): _compact_value(value) for key, value in extra.items()} if extra else None)
+    return element
+
+
+class CompactCrate:
+    """ Read-only crate of ``CompactEntity`` elements with the query methods of ``ROCrateV1_2``
+
+    Type queries accept the model classes (``getEntitiesByType(Dataset)``) and match
+    subclasses, as on ``ROCrateV1_2``.
+    """
+    __slots__ = ("context", "metadataGraph", "_by_guid", "_by_class", "_instances", "_referenced_by")
+
+    def __init__(self, entities: Iterable[CompactEntity], context: Optional[Dict[str, Any]] = None):
+        self.context = context
+        self.metadataGraph: Tuple[CompactEntity, ...] = tuple(entities)
+        self._by_guid: Dict[str, CompactEntity] = {}
+        self._by_class: Dict[type, List[int]] = {}
+        self._instances: Dict[type, List[CompactEntity]] = {}
+        self._referenced_by: Optional[Dict[str, List[Tuple[CompactEntity, str]]]] = None
+        for position, entity in enumerate(self.metadataGraph):
+            guid = getattr(entity, "guid", None)
+            if isinstance(guid, str):
+                self._by_guid.setdefault(guid, entity)
+            self._by_class.setdefault(entity.model_class, []).append(position)
+
+    @classmethod
+    def from_crate(cls, crate: ROCrateV1_2) -> "CompactCrate":
+        """ Compact copy of a validated crate """
+        return cls((compact_entity(entity) for entity in crate.metadataGraph), crate.context)
+
+    @classmethod
+    def load(
+        cls,
+        source: Union[str, os.PathLike, IO],
+        crate_class: Type[ROCrateV1_2] = ROCrateV1_2,
+        max_value_size: int = MAX_VALUE_SIZE,
+    ) -> "CompactCrate":
+        """ Stream an ``ro-crate-metadata.json`` into a compact crate
+
+        Elements are validated one at a time with ``crate_class.iter_entities`` and compacted
+        right away, so the full models of the crate are never held together. The
+        ``@context`` is not read.
+
+        :param source: path to the metadata file, or an open text or binary file object
+        :param crate_class: the crate model dispatching ``@type`` to element classes
+        :param max_value_size: characters a single element may span, as in ``iter_entities``
+        """
+        return cls(compact_entity(entity) for entity in crate_class.iter_entities(source, max_value_size))
+
+    def getEntity(self, guid: str) -> Optional[CompactEntity]:
+        """ The first element with the given ``@id``, or None """
+        return self._by_guid.get(guid)
+
+    def getEntitiesByType(self, model_class: Type[BaseModel]) -> List[CompactEntity]:
+        """ Elements built from ``model_class`` or a subclass of it, in graph order """
+        instances = self._instances.get(model_class)
+        if instances is None:
+            positions = sorted(
+                position for entity_class, positions in self._by_class.items()
+                if issubclass(entity_class, model_class) for position in positions
+            )
+            instances = self._instances[model_class] = [self.metadataGraph[position] for position in positions]
+        return list(instances)
+
+    def getReferencingEntities(self, guid: str) -> List[CompactEntity]:
+        """ Elements holding a reference to ``guid``, in graph order, without duplicates """
+        if self._referenced_by is None:
+            self._referenced_by = self._build_reverse_edges()
+        referencing = []
+        seen = set()
+        for entity, _ in self._referenced_by.get(extractGUID(guid), []):
+            if id(entity) not in seen:
+                seen.add(id(entity))
+                referencing.append(entity)
+        return referencing
+
+    def _build_reverse_edges(self) -> Dict[str, List[Tuple[CompactEntity, str]]]:
+        edges: Dict[str, List[Tuple[CompactEntity, str]]] = {}
+        for entity in self.metadataGraph:
+            keys = _field_keys(entity.model_class)
+            string_fields = string_reference_fields(entity.model_class)
+            values = [(name, getattr(entity, name), name in string_fields) for name in entity.field_names]
+            if entity.extra:
+                values.extend((name, value, False) for name, value in entity.extra.items())
+            for name, value, strings in values:
+                refs = value if isinstance(value, tuple) and not isinstance(value, CompactReference) else (value,)
+                for ref in refs:
+                    if isinstance(ref, CompactReference):
+                        edges.setdefault(extractGUID(ref.guid), []).append((entity, keys.get(name, name)))
+                    elif strings and isinstance(ref, str):
+                        edges.setdefault(extractGUID(ref), []).append((entity, keys.get(name, name)))
+        return edges
+
+    def getCrateMetadata(self) -> CompactEntity:
+        """ The element describing the top level crate, as in ``ROCrateV1_2.getCrateMetadata`` """
+        found = self.getEntitiesByType(ROCrateMetadataElem)
+        if not found:
+            raise Exception
+        return found[0]
+
+    def getSchemas(self) -> List[CompactEntity]:
+        return self.getEntitiesByType(Schema)
+
+    def getDatasets(self) -> List[CompactEntity]:
+        return self.getEntitiesByType(Dataset)
+
+    def getSoftware(self) -> List[CompactEntity]:
+        return self.getEntitiesByType(Software)
+
+    def getComputations(self) -> List[CompactEntity]:
+        return self.getEntitiesByType(Computation)
+
+    def getAnnotations(self) -> List[CompactEntity]:
+        return self.getEntitiesByType(Annotation)
+
+    def getExperiments(self) -> List[CompactEntity]:
+        return self.getEntitiesByType(Experiment)
+
+    def getMLModels(self) -> List[CompactEntity]:
+        return self.getEntitiesByType(MLModel)
+
+    def getBioChemEntities(self) -> List[CompactEntity]:
+        return self.getEntitiesByType(BioChemEntity)
+
+    def getMedicalConditions(self) -> List[CompactEntity]:
+        return self.getEntitiesByType(MedicalCondition)
+
+    def getEVIElements(self) -> List[CompactEntity]:
+        """ Elements which require minting identifiers, grouped as in ``ROCrateV1_2.getEVIElements`` """
+        elements = []
+        for model_class in (Dataset, Software, MLModel, Computation, Annotation, Experiment, Schema):
+            elements.extend(self.getEntitiesByType(model_class))
+        return elements
+
+    def to_crate(self) -> ROCrateV1_2:
+        """ Validate the elements back into a ``ROCrateV1_2`` """
+        data = {} if self.context is None else {"@context": self.context}
+        return ROCrateV1_2._from_validated_graph(data, [entity.to_model() for entity in self.metadataGraph])
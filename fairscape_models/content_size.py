@@ -0,0 +1,75 @@
+""" Parsing and formatting of ``contentSize`` strings
+
+Every size in this library uses binary multiples: ``KB``, ``KiB`` and ``kilobytes`` all
+mean 1024 bytes, as the strings written by ``Dataset.add_summary_stats`` and the D4D
+conversion do. A bare number is a count of bytes.
+"""
+import functools
+import math
+import re
+from typing import Any, Optional
+
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d*)?|\.\d+)(?:e([+-]?\d+))?\s*([a-z]*)\s*$", re.IGNORECASE)
+
+_MULTIPLIERS = {"": 1, "b": 1, "byte": 1, "bytes": 1}
+for _power, _prefix, _name in ((1, "k", "kilo"), (2, "m", "mega"), (3, "g", "giga"), (4, "t", "tera"), (5, "p", "peta")):
+    for _unit in (_prefix, _prefix + "b", _prefix + "ib", _name + "byte", _name + "bytes"):
+        _MULTIPLIERS[_unit] = 1024 ** _power
+
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_size_string(size: str) -> Optional[int]:
+    match = _SIZE_PATTERN.match(size.replace(",", ""))
+    if match is None:
+        return None
+    number, exponent, unit = match.groups()
+    multiplier = _MULTIPLIERS.get(unit.lower())
+    if multiplier is None:
+        return None
+    # one float() parse, so a huge exponent gives inf instead of an exact power of ten
+    value = float(f"{number}e{exponent}" if exponent else number) * multiplier
+    if not math.isfinite(value):
+        return None
+    return round(value)
+
+
+def parse_content_size(size: Any) -> Optional[int]:
+    """ Bytes of a ``contentSize`` value such as ``"2.4 GB"``, ``"150MB"``, ``"1,024 bytes"`` or ``2048``
+
+    Strings are parsed once and cached.
+
+    :param size: a size string, or a byte count as int or float
+    :return: the size in bytes, or None for None, unparseable and infinite values
+    """
+    if isinstance(size, str):
+        return _parse_size_string(size)
+    if isinstance(size, bool):
+        return None
+    if isinstance(size, int):
+        return size
+    if isinstance(size, float):
+        return round(size) if math.isfinite(size) else None
+    return None
+
+
+def format_content_size(size_bytes: float, precision: int = 1) -> str:
+    """ Human-readable size, ``"512 B"``, ``"2.0 KB"``, ... up to ``TB``
+
+    :param size_bytes: the size in bytes
+    :param precision: decimals shown for ``KB`` and larger
+    """
+    size = size_bytes
+    for unit in _UNITS:
+        if size < 1024 or unit == _UNITS[-1]:
+            return f"{int(size)} {unit}" if unit == "B" else f"{size:.{precision}f} {unit}"
+        size /= 1024
+
+
+def content_size_bytes(entity: Any) -> Optional[int]:
+    """ ``contentSizeBytes`` of a model instance, or its ``contentSize`` parsed when that is unset """
+    size_bytes = getattr(entity, "contentSizeBytes", None)
+    if size_bytes is not None:
+        return size_bytes
+    return parse_content_size(getattr(entity, "contentSize", None))
@@ -0,0 +1,88 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from fairscape_models.rocrate import ROCrateV1_2, ROCrateMetadataElem
+from fairscape_models.conversion.mapping.AIReady import ScoringAccumulator, root_guid
+from fairscape_models.conversion.subcrate_loader import PathLike, SubcrateLoader, SubcrateLoadError
+
+# ROCrateMetadataElem field holding each roll-up, by serialized key
+AGGREGATE_FIELDS = {
+    "evi:datasetCount": "evi_dataset_count",
+    "evi:computationCount": "evi_computation_count",
+    "evi:softwareCount": "evi_software_count",
+    "evi:schemaCount": "evi_schema_count",
+    "evi:totalContentSizeBytes": "evi_total_content_size_bytes",
+    "evi:entitiesWithSummaryStats": "evi_entities_with_summary_stats",
+    "evi:entitiesWithChecksums": "evi_entities_with_checksums",
+    "evi:totalEntities": "evi_total_entities",
+    "evi:formats": "evi_formats",
+    "evi:processed": "evi_proccesed",
+}
+
+
+def aggregate_release(
+    crate: ROCrateV1_2,
+    loader: Optional[SubcrateLoader] = None,
+    base_dir: Optional[PathLike] = None,
+) -> Tuple[Dict[str, Any], List[SubcrateLoadError]]:
+    """ Compute the ``evi:`` roll-ups of a release over its own elements and all its sub-crates
+
+    The totals are the ones AI-Ready scoring computes when they are absent, so a release
+    scored with them gives the same scores as one scored by walking its sub-crates.
+    ``evi:formats`` lists every format, sorted. ``evi:processed`` is only set when every
+    sub-crate loaded, since scoring trusts a processed release's roll-ups over its sub-crates.
+
+    :param crate: the release
+    :param loader: reads the sub-crates concurrently; a new ``SubcrateLoader`` when None
+    :param base_dir: directory relative sub-crate paths are read from, the working directory when None
+    :return: the roll-up values by serialized key, e.g. ``{"evi:datasetCount": 12, ...}``, and
+        the sub-crates left out of them because they failed to load
+    """
+    accumulator = ScoringAccumulator(root_id=root_guid(crate))
+    for entity in crate.metadataGraph:
+        accumulator.add_entity(entity)
+    # read the sub-crates even when the release was aggregated before
+    load = (loader or SubcrateLoader()).load_subcrates(crate, base_dir)
+    for subcrate in load.subcrates:
+        for entity in subcrate.crate.metadataGraph:
+            accumulator.add_entity(entity)
+
+    aggregates = {
+        "evi:datasetCount": accumulator.datasets,
+        "evi:computationCount": accumulator.transformations,
+        "evi:softwareCount": accumulator.software,
+        "evi:schemaCount": accumulator.schemas,
+        "evi:totalContentSizeBytes": accumulator.total_size,
+        "evi:entitiesWithSummaryStats": accumulator.with_summary_stats,
+        "evi:entitiesWithChecksums": accumulator.with_checksum,
+        "evi:totalEntities": accumulator.checksum_candidates,
+        "evi:formats": sorted(accumulator.formats),
+    }
+    if not load.errors:
+        aggregates["evi:processed"] = True
+    return aggregates, load.errors
+
+
+def write_release_aggregates(
+    crate: ROCrateV1_2,
+    loader: Optional[SubcrateLoader] = None,
+    base_dir: Optional[PathLike] = None,
+) -> Tuple[Dict[str, Any], List[SubcrateLoadError]]:
+    """ Compute the ``evi:`` roll-ups of a release and set them on its root entity
+
+    Scoring a release marked ``evi:processed`` reads the roll-ups and skips its sub-crates.
+    Run it again after a sub-crate changes, or after fixing one that failed to load; while
+    any sub-crate fails, the root's ``evi:processed`` is cleared.
+
+    :param crate: the release, modified in place
+    :param loader: as in ``aggregate_release``
+    :param base_dir: as in ``aggregate_release``
+    :return: as in ``aggregate_release``
+    """
+    root = crate.getEntity(root_guid(crate))
+    if not isinstance(root, ROCrateMetadataElem):
+        raise ValueError("The release root must be a ROCrateMetadataElem to hold evi: roll-ups")
+
+    aggregates, errors = aggregate_release(crate, loader, base_dir)
+    for key, field in AGGREGATE_FIELDS.items():
+        setattr(root, field, aggregates.get(key))
+    return aggregates, errors
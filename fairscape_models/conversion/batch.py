@@ -0,0 +1,138 @@
+import json
+import os
+import pathlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+import yaml
+
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.conversion.converter import ROCToTargetConverter
+from fairscape_models.conversion.d4d_converter import D4DConverter
+from fairscape_models.conversion.mapping.croissant import MAPPING_CONFIGURATION as CROISSANT_MAPPING_CONFIGURATION
+from fairscape_models.conversion.mapping.FairscapeDatasheet import PREVIEW_MAPPING_CONFIGURATION
+
+PathLike = Union[str, os.PathLike]
+
+
+class BatchTarget(NamedTuple):
+    """ How one output format is produced from a crate and written next to it """
+    convert: Callable[[ROCrateV1_2], Any]
+    filename: str
+    write: Callable[[Any, pathlib.Path], None]
+
+
+def _convert_croissant(crate: ROCrateV1_2):
+    return ROCToTargetConverter(crate, CROISSANT_MAPPING_CONFIGURATION).convert()
+
+
+def _convert_datasheet_preview(crate: ROCrateV1_2):
+    return ROCToTargetConverter(crate, PREVIEW_MAPPING_CONFIGURATION).convert()
+
+
+def _convert_d4d(crate: ROCrateV1_2):
+    converter = D4DConverter(crate)
+    converter.convert()
+    return converter.d4dOutput
+
+
+def _write_model_json(result, path: pathlib.Path):
+    with path.open("w", encoding="utf-8") as f:
+        f.write(result.model_dump_json(by_alias=True, exclude_none=True, indent=2))
+
+
+def _write_yaml(result, path: pathlib.Path):
+    with path.open("w", encoding="utf-8") as f:
+        yaml.dump(result, f)
+
+
+# targets are looked up by name in the workers, as mapping configurations hold lambdas and cannot be pickled
+BATCH_TARGETS: Dict[str, BatchTarget] = {
+    "croissant": BatchTarget(_convert_croissant, "croissant.json", _write_model_json),
+    "datasheet": BatchTarget(_convert_datasheet_preview, "ro-crate-preview.json", _write_model_json),
+    "d4d": BatchTarget(_convert_d4d, "ro-crate-linkml.yaml", _write_yaml),
+}
+
+
+def convert_crate(path: PathLike, target: str, write: bool = False) -> Any:
+    """ Convert the crate at ``path`` to one of the ``BATCH_TARGETS`` formats
+
+    :param path: an ``ro-crate-metadata.json`` file
+    :param target: ``"croissant"``, ``"datasheet"`` (the datasheet preview) or ``"d4d"``
+    :param write: write the output next to ``path`` instead of returning it
+    :return: the converted output, or the path written when ``write`` is set
+    """
+    batch_target = BATCH_TARGETS[target]
+    path = pathlib.Path(path)
+    with path.open("r", encoding="utf-8") as f:
+        crate = ROCrateV1_2.model_validate_graph(json.load(f))
+    result = batch_target.convert(crate)
+    if result is None:
+        raise ValueError(f"Conversion of {path} to {target} produced no output")
+    if not write:
+        return result
+    output_path = path.parent / batch_target.filename
+    batch_target.write(result, output_path)
+    return output_path
+
+
+def _convert_or_error(path: PathLike, target: str, write: bool) -> Any:
+    try:
+        return convert_crate(path, target, write)
+    except Exception as e:
+        return e
+
+
+def convert_batch(
+    paths: Iterable[PathLike],
+    target: str,
+    workers: Optional[int] = None,
+    write: bool = False,
+    max_pending: Optional[int] = None,
+) -> Iterator[Tuple[pathlib.Path, Any]]:
+    """ Convert many crates in a process pool, yielding ``(path, result)`` as each completes
+
+    Results arrive in completion order, not input order. A crate that fails to load or
+    convert yields its exception as the result instead of stopping the batch. ``paths`` is
+    consumed lazily and at most ``max_pending`` crates are queued or converting at once,
+    so memory is bounded by that many crates and results regardless of the catalog size.
+
+    :param paths: ``ro-crate-metadata.json`` files
+    :param target: a key of ``BATCH_TARGETS``
+    :param workers: number of processes, ``os.cpu_count()`` when None; 1 converts in process
+    :param write: write each output next to its crate and yield the written path
+    :param max_pending: crates in flight, twice the number of workers when None
+    :return: an iterator of ``(path, converted output | written path | exception)``
+    """
+    if target not in BATCH_TARGETS:
+        raise ValueError(f"Unknown batch target {target!r}, expected one of {sorted(BATCH_TARGETS)}")
+    workers = workers or os.cpu_count() or 1
+
+    if workers <= 1:
+        for path in paths:
+            yield pathlib.Path(path), _convert_or_error(path, target, write)
+        return
+
+    max_pending = max(1, max_pending or workers * 2)
+    paths = iter(paths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < max_pending:
+                path = next(paths, None)
+                if path is None:
+                    exhausted = True
+                    break
+                pending[executor.submit(_convert_or_error, path, target, write)] = pathlib.Path(path)
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # e.g. a worker killed by the OS, or a result that cannot be pickled
+                    result = e
+                yield path, result
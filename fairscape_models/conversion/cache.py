@@ -0,0 +1,107 @@
+import functools
+import hashlib
+import os
+import pathlib
+import pickle
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Union
+
+from pydantic_core import to_json
+
+from fairscape_models._version import __version__
+
+if TYPE_CHECKING:
+    from fairscape_models.conversion.converter import CompiledMapping
+
+PathLike = Union[str, os.PathLike]
+
+# the target arguments mapped from one entity
+Entry = Dict[str, Any]
+
+# bump when the layout of keys or entries changes
+CACHE_FORMAT = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_fingerprint(target_class: type) -> bytes:
+    """ The fields of a target class, so entries built for an older definition of the class miss """
+    fields = [
+        (name, repr(field.annotation), field.alias, repr(field.default))
+        for name, field in target_class.model_fields.items()
+    ]
+    return to_json([__version__, CACHE_FORMAT, fields])
+
+
+class ConversionCache:
+    """ Target arguments of ``ROCToTargetConverter``, keyed by the content the mapping read
+
+    A key hashes the target class, the mapping's target and source keys, and the values of the
+    source keys of one entity, so an entity is only re-mapped when a property its mapping reads
+    changes. Target objects are instantiated from the arguments on every conversion, so no two
+    outputs share an object and changing one never changes the cache. Root entities are always rebuilt, as their builder functions read
+    the whole crate. The fields of the target class and the library version are part of the key,
+    parsers are not: use a new ``namespace`` (or clear the cache) after changing a mapping's
+    functions. Caches are pickled, so only load files you wrote.
+
+    Only mapping is cached; assembly instructions still build their lists from all target objects
+    on every conversion.
+    """
+
+    def __init__(self, namespace: str = ""):
+        self.namespace = namespace
+        self.entries: Dict[bytes, Entry] = {}
+        self.used: Set[bytes] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def rule_key(self, rule: Dict[str, Any], compiled: "CompiledMapping") -> bytes:
+        """ The part of the keys shared by all entities of one rule """
+        target_class = rule["target_class"]
+        name = f"{self.namespace}\0{target_class.__module__}.{target_class.__qualname__}\0".encode()
+        return name + _schema_fingerprint(target_class) + compiled.fingerprint
+
+    def key(self, rule_key: bytes, compiled: "CompiledMapping", source_dict: Dict[str, Any]) -> bytes:
+        values = to_json([source_dict.get(key) for key in compiled.hashed_keys], serialize_unknown=True)
+        return hashlib.blake2b(rule_key + values, digest_size=20).digest()
+
+    def get(self, key: bytes) -> Optional[Entry]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.used.add(key)
+        return dict(entry)
+
+    def put(self, key: bytes, args: Dict[str, Any]):
+        self.entries[key] = dict(args)
+        self.used.add(key)
+
+    def save(self, path: PathLike, prune: bool = True):
+        """ Pickle the cache to ``path``
+
+        :param path: file to write
+        :param prune: keep only the entries hit or stored since the cache was loaded
+        """
+        entries = {key: entry for key, entry in self.entries.items() if key in self.used} if prune else self.entries
+        with pathlib.Path(path).open("wb") as f:
+            pickle.dump({"version": __version__, "format": CACHE_FORMAT, "namespace": self.namespace, "entries": entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: PathLike, namespace: str = "") -> "ConversionCache":
+        """ Load a cache written by ``save``, or start an empty one
+
+        The cache is empty when ``path`` does not exist or was written by another version
+        of fairscape_models, another cache format or with another ``namespace``.
+        """
+        cache = cls(namespace)
+        path = pathlib.Path(path)
+        if path.exists():
+            with path.open("rb") as f:
+                stored = pickle.load(f)
+            if (
+                stored.get("version") == __version__
+                and stored.get("format") == CACHE_FORMAT
+                and stored.get("namespace") == namespace
+            ):
+                cache.entries = stored["entries"]
+        return cache
@@ -1,10 +1,89 @@
-from typing import Dict, Any, Optional, Type, List, Callable
-from pydantic import BaseModel
+from typing import TYPE_CHECKING, Dict, Any, FrozenSet, Iterable, Iterator, Optional, List, Callable, Tuple
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.serialization import dump_subset
+from pydantic_core import to_json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import collections
 import dataclasses
+import itertools
+import os
+
+if TYPE_CHECKING:
+    from fairscape_models.conversion.cache import ConversionCache
+
+Extractor = Callable[[Dict[str, Any]], Any]
+
+
+def _fixed_extractor(value: Any) -> Extractor:
+    return lambda source_dict: value
+
+
+def _source_extractor(spec: Dict[str, Any]) -> Extractor:
+    source_key = spec["source_key"]
+    parser = spec.get("parser")
+    fallback_key = spec.get("fallback_source_key")
+    fallback_parser = spec.get("fallback_parser")
+
+    def extract(source_dict: Dict[str, Any]) -> Any:
+        value = source_dict.get(source_key)
+        if parser is not None and value is not None:
+            value = parser(value)
+        # Backward compat fallback (e.g., additionalProperty)
+        if value is None and fallback_key is not None:
+            fallback_value = source_dict.get(fallback_key)
+            if fallback_value is not None:
+                value = fallback_parser(fallback_value) if fallback_parser is not None else fallback_value
+        return value
+    return extract
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(target_class: type) -> TypeAdapter:
+    return TypeAdapter(List[target_class])
+
+
+class CompiledMapping:
+    """A mapping_def turned into one extractor per target key, so specs are read once per mapping, not per entity."""
+    __slots__ = ("source_keys", "extractors", "builders", "hashed_keys", "fingerprint")
+
+    def __init__(self, mapping_def: Dict[str, Any]):
+        self.extractors: List[Tuple[str, Extractor]] = []
+        self.builders: List[Tuple[str, Callable]] = []
+        source_keys = set()
+        fixed_values = {}
+        for target_key, spec in mapping_def.items():
+            #fancy build handled later
+            if "builder_func" in spec:
+                if spec["builder_func"]:
+                    self.builders.append((target_key, spec["builder_func"]))
+                continue
+            if "fixed_value" in spec:
+                self.extractors.append((target_key, _fixed_extractor(spec["fixed_value"])))
+                fixed_values[target_key] = spec["fixed_value"]
+            elif "source_key" in spec:
+                self.extractors.append((target_key, _source_extractor(spec)))
+                source_keys.add(spec["source_key"])
+                if "fallback_source_key" in spec:
+                    source_keys.add(spec["fallback_source_key"])
+        # serialized source keys read by the mapping, so only those are dumped
+        self.source_keys: FrozenSet[str] = frozenset(source_keys)
+        # what a ConversionCache key is computed from: the mapping's shape and the values of hashed_keys
+        self.hashed_keys: Tuple[str, ...] = tuple(sorted(source_keys))
+        self.fingerprint: bytes = to_json([list(mapping_def), self.hashed_keys, fixed_values], serialize_unknown=True)
+
+    def apply(self, source_dict: Dict[str, Any]) -> Dict[str, Any]:
+        target_args = {}
+        for target_key, extract in self.extractors:
+            value = extract(source_dict)
+            if value is not None:
+                target_args[target_key] = value
+        return target_args
+
 
 class ROCToTargetConverter:
-    def __init__(self, source_crate: ROCrateV1_2, mapping_configuration: Dict[str, Any], global_index: Optional[Dict[str, Any]] = None ):
+    def __init__(self, source_crate: ROCrateV1_2, mapping_configuration: Dict[str, Any], global_index: Optional[Dict[str, Any]] = None, cache: Optional["ConversionCache"] = None):
         self.source_crate = source_crate
         self.mapping_config = mapping_configuration
         self.root_entity = self._find_root_entity()
@@ -13,19 +92,33 @@ class ROCToTargetConverter:
         self.target_args_cache: Dict[str, Dict[str, Any]] = {}
         self.target_objects_cache: Dict[str, BaseModel] = {}
         self.final_object: Optional[BaseModel] = None
+        # guid -> entity_map rule matched while building target_args_cache
+        self.target_rules: Dict[str, Dict[str, Any]] = {}
+        # target objects grouped by exact class, in target_objects_cache order
+        self.target_objects_by_type: Dict[type, List[BaseModel]] = {}
+        self._partitions: Dict[Tuple[type, str], Dict[Any, List[BaseModel]]] = {}
+        # unchanged entities reuse their arguments from the cache; misses are stored after instantiation
+        self.cache = cache
+        self._cache_keys: Dict[str, bytes] = {}
+        self._cache_rule_keys: Dict[int, bytes] = {}
+        self._compiled_mappings: Dict[int, Tuple[Dict[str, Any], CompiledMapping]] = {}
 
         if not self.root_entity:
             raise ValueError("Could not find the root dataset entity in the RO-Crate.")
 
     def _find_root_entity(self) -> Optional[BaseModel]:
-        metadata_descriptor = next((e for e in self.source_crate.metadataGraph if e.guid == "ro-crate-metadata.json"), None)
+        metadata_descriptor = self.source_crate.getEntity("ro-crate-metadata.json")
         if metadata_descriptor and hasattr(metadata_descriptor, "about") and metadata_descriptor.about:
-            root_id = metadata_descriptor.about.guid
-            return next((e for e in self.source_crate.metadataGraph if e.guid == root_id), None)
+            return self.source_crate.getEntity(metadata_descriptor.about.guid)
         return None
 
-    def convert(self) -> Optional[BaseModel]:
-        self._create_argument_dictionaries()
+    def convert(self, entity_dumps: Optional[List[Dict[str, Any]]] = None) -> Optional[BaseModel]:
+        """Convert the source crate to the target model.
+
+        entity_dumps are serialized @graph elements in metadataGraph order, holding at least the keys the
+        mappings read, for sharing one serialization pass between converters (see multi_target.py).
+        """
+        self._create_argument_dictionaries(entity_dumps)
         self._instantiate_models()
         self._build_and_assemble_final_object()
         return self.final_object
@@ -35,56 +128,132 @@ class ROCToTargetConverter:
             return "ROOT"
         return "COMPONENT"
 
-    def _create_argument_dictionaries(self):
-        for source_entity in self.source_crate.metadataGraph:
-            if source_entity.guid == "ro-crate-metadata.json": continue
-            
-            entity_type_name = type(source_entity).__name__
-            context_hint = self._get_context_hint(source_entity.guid)
-            rule = self.mapping_config.get("entity_map", {}).get((entity_type_name, context_hint))
+    def _get_rule(self, source_entity: BaseModel) -> Optional[Dict[str, Any]]:
+        if source_entity.guid == "ro-crate-metadata.json":
+            return None
+        context_hint = self._get_context_hint(source_entity.guid)
+        return self.mapping_config.get("entity_map", {}).get((type(source_entity).__name__, context_hint))
+
+    def source_keys(self, source_entity: BaseModel) -> FrozenSet[str]:
+        """Keys of the serialized entity read by the mapping rule it matches, empty when it matches none."""
+        rule = self._get_rule(source_entity)
+        if not rule:
+            return frozenset()
+        return self._compile_mapping(rule["mapping_def"]).source_keys
+
+    def _create_argument_dictionaries(self, entity_dumps: Optional[List[Dict[str, Any]]] = None):
+        for position, source_entity in enumerate(self.source_crate.metadataGraph):
+            rule = self._get_rule(source_entity)
             
             if rule:
-                target_args = self._map_source_to_args(
-                    source_entity.model_dump(by_alias=True),
-                    rule["mapping_def"]
-                )
-                self.target_args_cache[source_entity.guid] = target_args
+                compiled = self._compile_mapping(rule["mapping_def"])
+                if entity_dumps is not None:
+                    source_dict = entity_dumps[position]
+                else:
+                    source_dict = dump_subset(source_entity, compiled.source_keys)
+                self.target_rules[source_entity.guid] = rule
+                if self.cache is not None and self._get_context_hint(source_entity.guid) != "ROOT":
+                    key = self.cache.key(self._cache_rule_key(rule, compiled), compiled, source_dict)
+                    args = self.cache.get(key)
+                    if args is not None:
+                        self.target_args_cache[source_entity.guid] = args
+                        continue
+                    self._cache_keys[source_entity.guid] = key
+                self.target_args_cache[source_entity.guid] = compiled.apply(source_dict)
+
+    def _cache_rule_key(self, rule: Dict[str, Any], compiled: CompiledMapping) -> bytes:
+        rule_key = self._cache_rule_keys.get(id(rule))
+        if rule_key is None:
+            rule_key = self._cache_rule_keys[id(rule)] = self.cache.rule_key(rule, compiled)
+        return rule_key
+
+    def _compile_mapping(self, mapping_def: Dict[str, Any]) -> CompiledMapping:
+        cached = self._compiled_mappings.get(id(mapping_def))
+        if cached is None or cached[0] is not mapping_def:
+            cached = (mapping_def, CompiledMapping(mapping_def))
+            self._compiled_mappings[id(mapping_def)] = cached
+        return cached[1]
 
     def _map_source_to_args(self, source_dict: Dict[str, Any], mapping_def: Dict[str, Any]) -> Dict[str, Any]:
-        target_args = {}
-        for target_key, spec in mapping_def.items():
-            #fancy build handled later
-            if "builder_func" in spec: continue
-            value = None
-            if "fixed_value" in spec:
-                value = spec["fixed_value"]
-            elif "source_key" in spec:
-                value = source_dict.get(spec["source_key"])
-                if "parser" in spec and value is not None:
-                    value = spec["parser"](value)
-                # Backward compat fallback (e.g., additionalProperty)
-                if value is None and "fallback_source_key" in spec:
-                    fallback_value = source_dict.get(spec["fallback_source_key"])
-                    if fallback_value is not None and "fallback_parser" in spec:
-                        value = spec["fallback_parser"](fallback_value)
-                    elif fallback_value is not None:
-                        value = fallback_value
-            if value is not None:
-                target_args[target_key] = value
-        return target_args
+        return self._compile_mapping(mapping_def).apply(source_dict)
 
     def _instantiate_models(self):
+        """Build the target objects, validating each one unless its rule sets "validate": "end".
+
+        Objects of such rules are validated together, in one TypeAdapter call per target class once the others
+        are built, which is cheaper than one call per object. The objects and their order are the same either way.
+        """
+        deferred: Dict[type, List[str]] = {}
         for source_guid, args in self.target_args_cache.items():
-            entity_type_name = type(next(e for e in self.source_crate.metadataGraph if e.guid == source_guid)).__name__
-            context_hint = self._get_context_hint(source_guid)
-            rule = self.mapping_config.get("entity_map", {}).get((entity_type_name, context_hint))
-            if rule:
-                try:
-                    self.target_objects_cache[source_guid] = rule["target_class"](**args)
-                except Exception as e:
-                    print(f"Error instantiating {rule['target_class'].__name__} for source GUID {source_guid}")
-                    print(f"With arguments: {args}")
-                    raise e
+            rule = self.target_rules.get(source_guid)
+            if not rule:
+                continue
+            if rule.get("validate") == "end":
+                # placeholder keeping target_objects_cache in graph order
+                self.target_objects_cache[source_guid] = None
+                deferred.setdefault(rule["target_class"], []).append(source_guid)
+                continue
+            self.target_objects_cache[source_guid] = self._validate_target(rule, source_guid, args)
+
+        for target_class, source_guids in deferred.items():
+            try:
+                target_objects = _list_adapter(target_class).validate_python(
+                    [self.target_args_cache[source_guid] for source_guid in source_guids]
+                )
+            except ValidationError:
+                # report the first invalid object as validating one at a time would
+                target_objects = [
+                    self._validate_target(self.target_rules[source_guid], source_guid, self.target_args_cache[source_guid])
+                    for source_guid in source_guids
+                ]
+            self.target_objects_cache.update(zip(source_guids, target_objects))
+
+        for source_guid, key in self._cache_keys.items():
+            self.cache.put(key, self.target_args_cache[source_guid])
+
+        # bucketed once the cache is final, a repeated guid replaces its earlier object
+        for target_object in self.target_objects_cache.values():
+            self.target_objects_by_type.setdefault(type(target_object), []).append(target_object)
+
+    def _validate_target(self, rule: Dict[str, Any], source_guid: str, args: Dict[str, Any]) -> BaseModel:
+        try:
+            return rule["target_class"](**args)
+        except Exception as e:
+            print(f"Error instantiating {rule['target_class'].__name__} for source GUID {source_guid}")
+            print(f"With arguments: {args}")
+            raise e
+
+    def _children_of(self, child_type: type) -> List[BaseModel]:
+        buckets = [objects for cls, objects in self.target_objects_by_type.items() if issubclass(cls, child_type)]
+        if len(buckets) == 1:
+            return buckets[0]
+        if not buckets:
+            return []
+        # several classes match, keep instantiation order across them
+        return [o for o in self.target_objects_cache.values() if isinstance(o, child_type)]
+
+    def _partition(self, child_type: type, attribute: str) -> Dict[Any, List[BaseModel]]:
+        """Children of child_type grouped by the value of attribute, computed once for all instructions using it."""
+        partitions = self._partitions.get((child_type, attribute))
+        if partitions is None:
+            partitions = {}
+            for child_object in self._children_of(child_type):
+                partitions.setdefault(getattr(child_object, attribute, None), []).append(child_object)
+            self._partitions[(child_type, attribute)] = partitions
+        return partitions
+
+    def _assembled_children(self, instruction: Dict[str, Any]) -> Iterator[Any]:
+        child_type = instruction["child_type"]
+        if "partition_by" in instruction:
+            children = self._partition(child_type, instruction["partition_by"]).get(instruction.get("partition_value"), [])
+        else:
+            children = self._children_of(child_type)
+        child_filter = instruction.get("child_filter")
+        link_attr = instruction.get("child_attribute_to_link")
+        for child_object in children:
+            if child_filter is not None and not child_filter(child_object):
+                continue
+            yield getattr(child_object, link_attr) if link_attr is not None else child_object
     
     def _build_and_assemble_final_object(self):
         if not self.root_entity: return
@@ -94,31 +263,17 @@ class ROCToTargetConverter:
 
         root_rule = self.mapping_config.get("entity_map", {}).get((type(self.root_entity).__name__, "ROOT"))
         if root_rule:
-            mapping_def = root_rule["mapping_def"]
-            for target_key, spec in mapping_def.items():
-                if "builder_func" in spec and spec["builder_func"]:
-                    builder_func: Callable = spec["builder_func"]
-                    value = builder_func(converter_instance=self, source_entity_model=self.root_entity)
-                    if value is not None:
-                        python_attr_name = self._get_python_attribute_name(parent_object, target_key)
-                        setattr(parent_object, python_attr_name, value)
+            for target_key, builder_func in self._compile_mapping(root_rule["mapping_def"]).builders:
+                value = builder_func(converter_instance=self, source_entity_model=self.root_entity)
+                if value is not None:
+                    python_attr_name = self._get_python_attribute_name(parent_object, target_key)
+                    setattr(parent_object, python_attr_name, value)
         
         for instruction in self.mapping_config.get("assembly_instructions", []):
             if not isinstance(parent_object, instruction["parent_type"]): continue
             
             parent_attr = instruction["parent_attribute"]
-            child_type = instruction["child_type"]
-            parent_list = []
-            
-            for child_object in self.target_objects_cache.values():
-                if isinstance(child_object, child_type):
-                    if "child_filter" in instruction:
-                        if not instruction["child_filter"](child_object):
-                            continue
-                    item_to_link = child_object
-                    if "child_attribute_to_link" in instruction:
-                        item_to_link = getattr(child_object, instruction["child_attribute_to_link"])
-                    parent_list.append(item_to_link)
+            parent_list = list(self._assembled_children(instruction))
             
             python_attr_name = self._get_python_attribute_name(parent_object, parent_attr)
             setattr(parent_object, python_attr_name, parent_list)
@@ -146,9 +301,70 @@ class ROCToTargetConverter:
         return self._map_source_to_args(source_dict, mapping_def)
 
 
+def _source_dict(source: Any) -> Dict[str, Any]:
+    if hasattr(source, 'model_dump'):
+        return source.model_dump()
+    elif hasattr(source, '__dict__'):
+        return source.__dict__
+    elif isinstance(source, dict):
+        return source
+    else:
+        return {}
+
+
+# required ROCrateMetadataElem fields a source may not map, left empty so every element validates
+_EMPTY_REQUIRED_FIELDS: Dict[str, Callable[[], Any]] = {
+    "name": str, "description": str, "keywords": list, "version": str,
+    "hasPart": list, "author": str, "license": lambda: None,
+}
+
+
+def _apply_source_mapping(compiled: CompiledMapping, source_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Target args of a TargetToROCrateConverter mapping, whose builder_func reads the source dict."""
+    target_args = compiled.apply(source_dict)
+    for target_key, builder in compiled.builders:
+        value = builder(source_dict)
+        if value is not None:
+            target_args[target_key] = value
+    return target_args
+
+
+def _rocrate_element(args: Dict[str, Any]) -> Any:
+    """A ROCrateMetadataElem of mapped args; values the model rejects are kept as mapped, unvalidated."""
+    from fairscape_models.rocrate import ROCrateMetadataElem
+
+    for key, empty in _EMPTY_REQUIRED_FIELDS.items():
+        if key not in args:
+            args[key] = empty()
+    try:
+        return ROCrateMetadataElem.model_validate(args)
+    except ValidationError:
+        return ROCrateMetadataElem.model_construct(**args)
+
+
+def _map_resources(mapping: Dict[str, Any], start: int, resources: List[Any]) -> List[Any]:
+    """Subcrate elements of a chunk of collection resources; start is the position of the first one."""
+    compiled = CompiledMapping(mapping)
+    chunk = []
+    for offset, resource in enumerate(resources):
+        source_dict = _source_dict(resource)
+        subcrate_args = _apply_source_mapping(compiled, source_dict)
+        subcrate_args["@type"] = ["Dataset", "https://w3id.org/EVI#ROCrate"]
+        if "@id" not in subcrate_args:
+            subcrate_args["@id"] = source_dict.get("id", f"subcrate-{start + offset}")
+        chunk.append(_rocrate_element(subcrate_args))
+    return chunk
+
+
 class TargetToROCrateConverter:
     """Converts from various formats (D4D, Croissant, etc.) to ROCrate format."""
 
+    context: Dict[str, str] = {
+        "@vocab": "https://schema.org/",
+        "evi": "https://w3id.org/EVI#",
+        "rai": "http://mlcommons.org/croissant/RAI/"
+    }
+
     def __init__(self, source_collection: Any, dataset_mappings: Dict[str, Any], collection_mapping: Dict[str, Any]):
         self.source = source_collection
         self.dataset_mappings = dataset_mappings
@@ -156,104 +372,129 @@ class TargetToROCrateConverter:
         self.converted_datasets: List[Any] = []
         self.release_rocrate: Optional[Any] = None
         self.is_single_dataset = not hasattr(source_collection, 'resources')
+        self._compiled_mappings: Dict[int, Tuple[Dict[str, Any], CompiledMapping]] = {}
 
     def _get_source_dict(self, source: Any) -> Dict[str, Any]:
-        if hasattr(source, 'model_dump'):
-            return source.model_dump()
-        elif hasattr(source, '__dict__'):
-            return source.__dict__
-        elif isinstance(source, dict):
-            return source
-        else:
-            return {}
+        return _source_dict(source)
+
+    def convert(self, workers: Optional[int] = 1, chunk_size: int = 256):
+        """Main conversion method that orchestrates the entire conversion process.
 
-    def convert(self):
-        """Main conversion method that orchestrates the entire conversion process."""
+        workers and chunk_size are passed to iter_subcrates for collections.
+        """
         if self.is_single_dataset:
             self._convert_single_dataset()
         else:
             self._convert_collection_to_release()
-            self._convert_datasets_to_subcrates()
+            self._convert_datasets_to_subcrates(workers, chunk_size)
         return self._assemble_rocrate()
 
+    def write(self, destination: Any, workers: Optional[int] = 1, chunk_size: int = 256, indent: Optional[int] = None, **dump_kwargs: Any):
+        """Convert and stream the ROCrate to destination without keeping the subcrate elements.
+
+        destination is a path or file object as in fairscape_models.rocrate.write_graph, which
+        serializes each element as it is produced.
+        """
+        from fairscape_models.rocrate import write_graph
+
+        if self.is_single_dataset:
+            self._convert_single_dataset()
+            subcrates = iter(())
+        else:
+            self._convert_collection_to_release()
+            subcrates = self.iter_subcrates(workers=workers, chunk_size=chunk_size)
+        elements = itertools.chain([self._metadata_descriptor(), self.release_rocrate], subcrates)
+        write_graph(destination, elements, context=self.context, indent=indent, **dump_kwargs)
+
     def _convert_single_dataset(self):
         """Converts a single dataset to a ROCrate release."""
-        from fairscape_models.rocrate import ROCrateMetadataElem
-
         source_dict = self._get_source_dict(self.source)
         release_args = self._apply_mapping(source_dict, self.dataset_mappings)
         release_args["@type"] = ["Dataset", "https://w3id.org/EVI#ROCrate"]
         release_args["@id"] = release_args.get("@id", "./")
-        self.release_rocrate = ROCrateMetadataElem.model_construct(**release_args)
+        self.release_rocrate = _rocrate_element(release_args)
 
     def _convert_collection_to_release(self):
         """Converts a collection/dataset collection to a ROCrate release."""
-        from fairscape_models.rocrate import ROCrateMetadataElem
-
         source_dict = self._get_source_dict(self.source)
         release_args = self._apply_mapping(source_dict, self.collection_mapping)
         release_args["@type"] = ["Dataset", "https://w3id.org/EVI#ROCrate"]
         release_args["@id"] = release_args.get("@id", "./")
-        self.release_rocrate = ROCrateMetadataElem.model_construct(**release_args)
+        self.release_rocrate = _rocrate_element(release_args)
 
-    def _convert_datasets_to_subcrates(self):
+    def _convert_datasets_to_subcrates(self, workers: Optional[int] = 1, chunk_size: int = 256):
         """Converts individual datasets within a collection to subcrate elements."""
-        from fairscape_models.rocrate import ROCrateMetadataElem
-
-        resources = getattr(self.source, 'resources', [])
-        if not resources:
+        self.converted_datasets.extend(self.iter_subcrates(workers=workers, chunk_size=chunk_size))
+
+    def iter_subcrates(self, resources: Optional[Iterable[Any]] = None, workers: Optional[int] = 1, chunk_size: int = 256, max_pending: Optional[int] = None) -> Iterator[Any]:
+        """Yield the subcrate element of every collection resource, in order.
+
+        Resources are mapped in chunks of chunk_size with the dataset mapping compiled once per
+        chunk. With workers > 1 the chunks are mapped in a process pool, at most max_pending
+        (twice the workers by default) at a time, so resources may be a lazy iterable and memory
+        is bounded by the chunks in flight; the mapping and resources must then be picklable.
+        Workers also build the elements, which is most of the cost of a resource.
+
+        resources defaults to the collection's resources.
+        """
+        if resources is None:
+            resources = getattr(self.source, 'resources', None) or []
+        chunks = self._chunks(resources, max(1, chunk_size))
+        workers = workers or os.cpu_count() or 1
+
+        if workers <= 1:
+            for start, chunk in chunks:
+                yield from _map_resources(self.dataset_mappings, start, chunk)
             return
 
-        for dataset in resources:
-            source_dict = self._get_source_dict(dataset)
-            subcrate_args = self._apply_mapping(source_dict, self.dataset_mappings)
-            subcrate_args["@type"] = ["Dataset", "https://w3id.org/EVI#ROCrate"]
-            if "@id" not in subcrate_args:
-                subcrate_args["@id"] = source_dict.get("id", f"subcrate-{len(self.converted_datasets)}")
-
-            self.converted_datasets.append(ROCrateMetadataElem.model_construct(**subcrate_args))
+        max_pending = max(1, max_pending or workers * 2)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = collections.deque()
+            for start, chunk in chunks:
+                pending.append(executor.submit(_map_resources, self.dataset_mappings, start, chunk))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    @staticmethod
+    def _chunks(resources: Iterable[Any], chunk_size: int) -> Iterator[Tuple[int, List[Any]]]:
+        iterator = iter(resources)
+        start = 0
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield start, chunk
+            start += len(chunk)
 
     def _apply_mapping(self, source_dict: Dict[str, Any], mapping: Dict[str, Any]) -> Dict[str, Any]:
         """Applies a mapping configuration to source data to produce target arguments."""
-        result = {}
-        for target_key, spec in mapping.items():
-            value = None
-
-            if "fixed_value" in spec:
-                value = spec["fixed_value"]
-            elif "source_key" in spec:
-                value = source_dict.get(spec["source_key"])
-                if "parser" in spec and value is not None:
-                    value = spec["parser"](value)
-            elif "builder_func" in spec:
-                value = spec["builder_func"](source_dict)
-
-            if value is not None:
-                result[target_key] = value
-
-        return result
+        cached = self._compiled_mappings.get(id(mapping))
+        if cached is None or cached[0] is not mapping:
+            cached = (mapping, CompiledMapping(mapping))
+            self._compiled_mappings[id(mapping)] = cached
+        return _apply_source_mapping(cached[1], source_dict)
+
+    def _metadata_descriptor(self):
+        from fairscape_models.rocrate import ROCrateMetadataFileElem
+
+        return ROCrateMetadataFileElem.model_validate({
+            "@id": "ro-crate-metadata.json",
+            "@type": "CreativeWork",
+            "conformsTo": {"@id": "https://w3id.org/ro/crate/1.2"},
+            "about": {"@id": self.release_rocrate.guid}
+        })
 
     def _assemble_rocrate(self):
         """Assembles the final ROCrate object with all metadata elements."""
-        from fairscape_models.rocrate import ROCrateV1_2, ROCrateMetadataElem
-
-        metadata_graph = [
-            ROCrateMetadataElem.model_construct(**{
-                "@id": "ro-crate-metadata.json",
-                "@type": "CreativeWork",
-                "conformsTo": {"@id": "https://w3id.org/ro/crate/1.2"},
-                "about": {"@id": self.release_rocrate.guid}
-            }),
-            self.release_rocrate
-        ]
+        from fairscape_models.rocrate import ROCrateV1_2
+
+        metadata_graph = [self._metadata_descriptor(), self.release_rocrate]
 
         metadata_graph.extend(self.converted_datasets)
 
         return ROCrateV1_2.model_construct(
-            context={
-                "@vocab": "https://schema.org/",
-                "evi": "https://w3id.org/EVI#",
-                "rai": "http://mlcommons.org/croissant/RAI/"
-            },
+            context=dict(self.context),
             metadataGraph=metadata_graph
-        )
\ No newline at end of file
+        )
@@ -1,4 +1,5 @@
 from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.serialization import dump_subset
 from fairscape_models.conversion.mapping.d4d import ROCRATE_TO_D4D_MAPPING
 from typing import Optional, Dict, Any
 import pathlib
@@ -20,34 +21,23 @@ class D4DConverter():
         self,
     ) -> Optional[dict]:
         """Find the root dataset entity in the RO-Crate."""
-        rocrate_data = self.crate.model_dump(
-            by_alias=True
-        )
-        graph = rocrate_data.get("@graph", [])
-
-        # Find the metadata descriptor to get root ID
-        metadata_descriptor = None
-        for entity in graph:
-            if entity.get("@id") == "ro-crate-metadata.json":
-                metadata_descriptor = entity
-                break
-
-        if not metadata_descriptor:
+        # only the root is serialized, the rest of the graph is looked up by guid
+        metadata_descriptor = self.crate.getEntity("ro-crate-metadata.json")
+        if metadata_descriptor is None:
             return None
 
         # Get the root ID from about field
-        about = metadata_descriptor.get("about", {})
+        about = dump_subset(metadata_descriptor, ("about",)).get("about", {})
         root_id = about.get("@id") if isinstance(about, dict) else about
 
         if not root_id:
             return None
 
         # Find and return the root entity
-        for entity in graph:
-            if entity.get("@id") == root_id:
-                return entity
-
-        return None
+        root = self.crate.getEntity(root_id)
+        if root is None:
+            return None
+        return root.model_dump(by_alias=True)
 
 
     def apply_mapping(
@@ -76,10 +66,14 @@ class D4DConverter():
         return result
 
 
-    def convert(self):
-        """Convert RO-Crate dictionary to D4D format."""
+    def convert(self, root_entity: Optional[Dict[str, Any]] = None):
+        """Convert RO-Crate dictionary to D4D format.
+
+        root_entity optionally supplies the root already serialized with model_dump(by_alias=True).
+        """
         # Apply the mapping
-        root_entity = self.find_root_entity()
+        if root_entity is None:
+            root_entity = self.find_root_entity()
 
         d4d_flat = self.apply_mapping(root_entity, ROCRATE_TO_D4D_MAPPING)
 
@@ -0,0 +1,248 @@
+import os
+import pathlib
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Type
+
+from fairscape_models._version import __version__
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.conversion.mapping.subcrate_utils import _get_ref_id, _normalize_type
+from fairscape_models.conversion.subcrate_loader import PathLike, SubcrateLoadError, _read_subcrate, subcrate_paths
+
+# bump when the layout of IndexEntry or of the saved index changes
+INDEX_FORMAT = 2
+
+# extra properties listing the outputs of a sub-crate root
+OUTPUT_KEYS = ("https://w3id.org/EVI#outputs", "EVI:outputs", "outputs")
+
+
+class IndexEntry(NamedTuple):
+    """ What datasheet generation reads about one element of a sub-crate """
+    types: Tuple[str, ...]
+    normalizedType: str
+    name: Optional[str]
+    fileFormat: Optional[str]
+    rocrateName: Optional[str]
+    organism: Optional[str]
+    outputs: Tuple[str, ...]
+
+    def info(self) -> Dict[str, Any]:
+        """ The entry as the dict ``subcrate_utils.build_composition_details`` reads, without unset keys """
+        info: Dict[str, Any] = {"@type": list(self.types), "normalizedType": self.normalizedType}
+        if self.name is not None:
+            info["name"] = self.name
+        if self.fileFormat is not None:
+            info["fileFormat"] = self.fileFormat
+        if self.rocrateName is not None:
+            info["rocrateName"] = self.rocrateName
+        if self.organism is not None:
+            info["organism"] = {"name": self.organism}
+        if self.outputs:
+            info["outputs"] = [{"@id": output} for output in self.outputs]
+        return info
+
+
+def _intern(value: Any) -> Optional[str]:
+    return None if value is None else sys.intern(str(value))
+
+
+def _organism_name(organism: Any) -> Optional[str]:
+    if isinstance(organism, dict):
+        return organism.get("name")
+    if isinstance(organism, str):
+        return organism
+    return getattr(organism, "name", None)
+
+
+def index_entry(entity: Any, rocrate_name: Optional[str] = None) -> IndexEntry:
+    """ The ``IndexEntry`` of a model instance from a crate named ``rocrate_name`` """
+    types = getattr(entity, "metadataType", None) or []
+    if not isinstance(types, list):
+        types = [types]
+    extra = entity.__pydantic_extra__ or {}
+    outputs = next((extra[key] for key in OUTPUT_KEYS if extra.get(key)), [])
+    if not isinstance(outputs, list):
+        outputs = [outputs]
+    return IndexEntry(
+        types=tuple(_intern(value) for value in types),
+        normalizedType=_normalize_type(entity),
+        name=_intern(getattr(entity, "name", None)),
+        fileFormat=_intern(getattr(entity, "fileFormat", None)),
+        rocrateName=_intern(rocrate_name),
+        organism=_intern(_organism_name(getattr(entity, "organism", None))),
+        outputs=tuple(_intern(ref_id) for ref_id in map(_get_ref_id, outputs) if ref_id),
+    )
+
+
+def crate_entries(crate: ROCrateV1_2) -> List[Tuple[str, IndexEntry]]:
+    """ ``(guid, IndexEntry)`` of every element of a crate, named after the crate's root """
+    try:
+        rocrate_name = crate.getCrateMetadata().name
+    except Exception:
+        rocrate_name = None
+    return [
+        (entity.guid, index_entry(entity, rocrate_name))
+        for entity in crate.metadataGraph
+        if isinstance(getattr(entity, "guid", None), str) and entity.guid != "ro-crate-metadata.json"
+    ]
+
+
+def _index_subcrate(path: str, crate_class: Type[ROCrateV1_2]) -> Tuple[Tuple[int, int], List[Tuple[str, IndexEntry]]]:
+    """ Read one sub-crate and return its entries; module level so it can run in a process pool """
+    stat_key, crate = _read_subcrate(path, crate_class)
+    return stat_key, crate_entries(crate)
+
+
+class GlobalIndex(Mapping[str, Dict[str, Any]]):
+    """ Elements of the sub-crates of a release by guid, the ``global_index`` of ``ROCToTargetConverter``
+
+    Every element is stored as an ``IndexEntry`` tuple of interned strings, with its type
+    already normalized; looking up a guid returns the dict ``build_composition_details``
+    reads (``@type``, ``normalizedType``, ``name``, ``fileFormat``, ``rocrateName``,
+    ``organism``, ``outputs``).
+    Each sub-crate is remembered with its file's modification time and size, so
+    ``update`` only reads the sub-crates that changed since the index was built or loaded.
+    An element listed by several sub-crates stays indexed until the last of them is dropped.
+    Indexes are pickled, so only load files you wrote.
+    """
+
+    def __init__(self, crate_class: Type[ROCrateV1_2] = ROCrateV1_2):
+        self.crate_class = crate_class
+        self.entries: Dict[str, IndexEntry] = {}
+        # sub-crate path -> (mtime_ns, size) and the guids it contributed
+        self.sources: Dict[str, Tuple[Tuple[int, int], Tuple[str, ...]]] = {}
+        # guid -> number of sub-crates and added crates listing it
+        self.owners: Dict[str, int] = {}
+        self.errors: List[SubcrateLoadError] = []
+
+    def __getitem__(self, guid: str) -> Dict[str, Any]:
+        return self.entries[guid].info()
+
+    def __contains__(self, guid: object) -> bool:
+        return guid in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def build(
+        cls,
+        crate: ROCrateV1_2,
+        base_dir: Optional[PathLike] = None,
+        workers: Optional[int] = None,
+        processes: bool = False,
+        crate_class: Type[ROCrateV1_2] = ROCrateV1_2,
+    ) -> "GlobalIndex":
+        """ Index the sub-crates of a release; see ``update`` for the arguments """
+        index = cls(crate_class)
+        index.update(crate, base_dir, workers, processes)
+        return index
+
+    def add_crate(self, crate: ROCrateV1_2):
+        """ Index the elements of a crate that is not read from a sub-crate file """
+        self._add(crate_entries(crate))
+
+    def update(
+        self,
+        crate: ROCrateV1_2,
+        base_dir: Optional[PathLike] = None,
+        workers: Optional[int] = None,
+        processes: bool = False,
+    ):
+        """ Read the sub-crates of a release that are new or changed, and drop the ones it no longer lists
+
+        Sub-crates that fail to load are skipped and listed in ``errors``, which is reset on every call.
+
+        :param crate: the release whose elements point to sub-crate metadata files
+        :param base_dir: directory relative sub-crate paths are read from, the working directory when None
+        :param workers: threads or processes reading sub-crates, ``os.cpu_count()`` when None
+        :param processes: use a process pool; workers return index entries, not crates
+        """
+        self.errors = []
+        guids = {}
+        for guid, path in subcrate_paths(crate, base_dir):
+            guids.setdefault(path, guid)
+
+        for path in [path for path in self.sources if path not in guids]:
+            self._drop(path)
+        changed = [path for path in guids if self._changed(path)]
+
+        workers = min(workers or os.cpu_count() or 1, len(changed))
+        if workers <= 1:
+            results = [self._result(path, lambda path=path: _index_subcrate(path, self.crate_class)) for path in changed]
+        else:
+            executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+            with executor_class(max_workers=workers) as executor:
+                futures = [executor.submit(_index_subcrate, path, self.crate_class) for path in changed]
+                results = [self._result(path, future.result) for path, future in zip(changed, futures)]
+
+        for path, result in zip(changed, results):
+            self._drop(path)
+            if isinstance(result, BaseException):
+                self.errors.append(SubcrateLoadError(guids[path], path, type(result).__name__, str(result)))
+                continue
+            stat_key, entries = result
+            self._add(entries)
+            self.sources[path] = (stat_key, tuple(guid for guid, _ in entries))
+
+    def _changed(self, path: str) -> bool:
+        source = self.sources.get(path)
+        if source is None:
+            return True
+        try:
+            stat = pathlib.Path(path).stat()
+        except OSError:
+            return True
+        return source[0] != (stat.st_mtime_ns, stat.st_size)
+
+    def _add(self, entries: List[Tuple[str, IndexEntry]]):
+        for guid, entry in entries:
+            self.entries[guid] = entry
+            self.owners[guid] = self.owners.get(guid, 0) + 1
+
+    def _drop(self, path: str):
+        source = self.sources.pop(path, None)
+        if source is None:
+            return
+        for guid in source[1]:
+            owners = self.owners.get(guid, 0) - 1
+            if owners > 0:
+                self.owners[guid] = owners
+            else:
+                self.owners.pop(guid, None)
+                self.entries.pop(guid, None)
+
+    @staticmethod
+    def _result(path: str, result: Any) -> Any:
+        try:
+            return result()
+        except Exception as error:
+            return error
+
+    def save(self, path: PathLike):
+        """ Pickle the index to ``path`` """
+        with pathlib.Path(path).open("wb") as f:
+            pickle.dump({"version": __version__, "format": INDEX_FORMAT, "entries": self.entries, "sources": self.sources, "owners": self.owners}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: PathLike, crate_class: Type[ROCrateV1_2] = ROCrateV1_2) -> "GlobalIndex":
+        """ Load an index written by ``save``, or start an empty one
+
+        The index is empty when ``path`` does not exist or was written by another version
+        of fairscape_models or with another ``INDEX_FORMAT``. Call ``update`` to bring it
+        up to date with the release.
+        """
+        index = cls(crate_class)
+        path = pathlib.Path(path)
+        if path.exists():
+            with path.open("rb") as f:
+                stored = pickle.load(f)
+            if stored.get("version") == __version__ and stored.get("format") == INDEX_FORMAT:
+                index.entries = stored["entries"]
+                index.sources = stored["sources"]
+                index.owners = stored["owners"]
+        return index
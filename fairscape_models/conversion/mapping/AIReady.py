@@ -1,68 +1,265 @@
-from typing import Any, Dict, List, Union
-from pathlib import Path
-import json
+from typing import IO, Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+import os
 from fairscape_models.conversion.models.AIReady import AIReadyScore, FairnessScore, ProvenanceScore, CharacterizationScore, PreModelExplainabilityScore, EthicsScore, SustainabilityScore, ComputabilityScore, SubCriterionScore
 from fairscape_models.rocrate import ROCrateV1_2
-
-def score_rocrate(crate_data: Union[Dict[str, Any], ROCrateV1_2]) -> AIReadyScore:
+from fairscape_models.serialization import dump_subset
+from fairscape_models.content_size import format_content_size, parse_content_size
+from fairscape_models.conversion.subcrate_loader import SubcrateLoader, SubcrateLoadError, entity_subcrate_paths
+
+# properties of non-root entities read by the _score_* functions
+SCORED_ENTITY_KEYS = frozenset({
+    "@id", "@type", "metadataType", "about", "format", "contentSize", "contentSizeBytes",
+    "hasSummaryStatistics", "md5", "MD5", "sha256", "SHA256", "hash",
+})
+
+class ScoringResult(NamedTuple):
+    """An AI-Ready score and the sub-crates left out of it because they failed to load."""
+    score: AIReadyScore
+    errors: List[SubcrateLoadError]
+
+def score_rocrate(crate_data: Union[Dict[str, Any], ROCrateV1_2], loader: Optional[SubcrateLoader] = None) -> AIReadyScore:
     """
     Score a single RO-Crate or a release (RO-Crate of RO-Crates).
     
     Args:
         crate_data: Either a parsed RO-Crate dict or ROCrateV1_2 model
+        loader: SubcrateLoader reading the release's sub-crates, whose cache is reused across calls;
+            a new loader for this call when None. Sub-crates that fail to load are skipped, see
+            score_rocrate_with_errors. A release whose root is marked evi:processed (see
+            conversion.aggregation) is scored from its evi: roll-ups without reading its sub-crates.
     
     Returns:
         AIReadyScore with all criteria evaluated
     """
+    return score_rocrate_with_errors(crate_data, loader).score
+
+def score_rocrate_with_errors(crate_data: Union[Dict[str, Any], ROCrateV1_2], loader: Optional[SubcrateLoader] = None) -> ScoringResult:
+    """
+    Score a crate as score_rocrate does, and list the sub-crates that failed to load.
+
+    Returns:
+        ScoringResult with the AIReadyScore and a SubcrateLoadError per skipped sub-crate
+    """
     if isinstance(crate_data, dict):
         crate = ROCrateV1_2.model_validate(crate_data)
     else:
         crate = crate_data
     
-    metadata_graph = []
-    
-    for entity in crate.metadataGraph:
-        entity_dict = entity.model_dump(by_alias=True)
-        metadata_graph.append(entity_dict)
-    
+    accumulator = ScoringAccumulator(root_id=root_guid(crate))
     for entity in crate.metadataGraph:
-        if hasattr(entity, 'ro-crate-metadata'):
-            metadata_path = Path(getattr(entity, 'ro-crate-metadata'))
-            try:
-                with metadata_path.open("r") as f:
-                    sub_crate_dict = json.load(f)
-                sub_rocrate = ROCrateV1_2.model_validate(sub_crate_dict)
-                
-                for sub_item in sub_rocrate.metadataGraph:
-                    sub_dict = sub_item.model_dump(by_alias=True)
-                    metadata_graph.append(sub_dict)
-            except:
-                pass
-    root_data = None
-    for entity_dict in metadata_graph:
-        if entity_dict.get("@id") == "ro-crate-metadata.json":
-            about_ref = entity_dict.get("about", {})
-            root_id = about_ref.get("@id") if isinstance(about_ref, dict) else about_ref
-            if root_id:
-                for e in metadata_graph:
-                    if e.get("@id") == root_id:
-                        root_data = e
-                        break
-                break
-    
-    if not root_data:
-        raise ValueError("Root entity not found in RO-Crate metadata graph.")
-    
-    score = AIReadyScore(name=f"AI-Ready Score for {root_data.get('name')}")
-    _score_fairness(score.fairness, root_data)
-    _score_provenance(score.provenance, root_data, metadata_graph)
-    _score_characterization(score.characterization, root_data, metadata_graph)
-    _score_pre_model(score.pre_model_explainability, root_data, metadata_graph)
-    _score_ethics(score.ethics, root_data)
-    _score_sustainability(score.sustainability, root_data)
-    _score_computability(score.computability, root_data, metadata_graph)
-    
-    return score
+        accumulator.add_entity(entity)
+    errors = _add_subcrates(accumulator, loader, crate=crate)
+    return ScoringResult(accumulator.score(), errors)
+
+def score_rocrate_file(source: Union[str, os.PathLike, IO], loader: Optional[SubcrateLoader] = None) -> AIReadyScore:
+    """
+    Score an ro-crate-metadata.json streamed one @graph element at a time, with its sub-crates.
+
+    The crate is never held in memory as a whole: every element is validated, added to a
+    ScoringAccumulator and dropped. Scores equal those of score_rocrate.
+
+    Args:
+        source: path to the metadata file, or an open text or binary file object
+        loader: as in score_rocrate
+
+    Returns:
+        AIReadyScore with all criteria evaluated
+    """
+    return score_rocrate_file_with_errors(source, loader).score
+
+def score_rocrate_file_with_errors(source: Union[str, os.PathLike, IO], loader: Optional[SubcrateLoader] = None) -> ScoringResult:
+    """
+    Score a metadata file as score_rocrate_file does, and list the sub-crates that failed to load.
+
+    Returns:
+        ScoringResult with the AIReadyScore and a SubcrateLoadError per skipped sub-crate
+    """
+    accumulator = ScoringAccumulator()
+    paths = []
+    for entity in ROCrateV1_2.iter_entities(source):
+        accumulator.add_entity(entity)
+        paths.extend(entity_subcrate_paths(entity))
+    errors = _add_subcrates(accumulator, loader, paths=paths)
+    return ScoringResult(accumulator.score(), errors)
+
+def score_metadata_graph(metadata_graph: Iterable[Dict[str, Any]]) -> AIReadyScore:
+    """
+    Score an already serialized metadata graph.
+
+    Args:
+        metadata_graph: @graph elements as model_dump(by_alias=True) dicts, sub-crate elements included,
+            in one pass. The root needs every key; other elements need at least SCORED_ENTITY_KEYS.
+
+    Returns:
+        AIReadyScore with all criteria evaluated
+    """
+    accumulator = ScoringAccumulator()
+    accumulator.update(metadata_graph)
+    return accumulator.score()
+
+class ScoringAccumulator:
+    """
+    Running totals of the @graph properties the AI-Ready criteria read, updated in one pass.
+
+    Elements are added one at a time, release and sub-crate elements alike, and only the root
+    element's dict is kept: it is the element the first "ro-crate-metadata.json" descriptor is
+    about. Elements seen before that descriptor are kept until it arrives.
+    """
+
+    def __init__(self, root_id: Any = None):
+        """
+        Args:
+            root_id: guid of the root, which add_entity dumps in full; taken from the descriptor when None
+        """
+        self.root_id = root_id
+        self.root_data: Optional[Dict[str, Any]] = None
+        self.datasets = 0
+        self.transformations = 0
+        self.software = 0
+        self.schemas = 0
+        self.total_size = 0
+        self.with_summary_stats = 0
+        self.checksum_candidates = 0
+        self.with_checksum = 0
+        self.formats = set()
+        self._descriptor_seen = False
+        self._about = None
+        self._pending: Dict[Any, Dict[str, Any]] = {}
+
+    def add_entity(self, entity: Any):
+        """Add a model instance, serialized as far as scoring reads it."""
+        root_id = self.root_id
+        if root_id is None:
+            # until the descriptor names the root, any element may be it
+            root_id = self._about if self._descriptor_seen else getattr(entity, "guid", None)
+        self.add(dump_for_scoring(entity, root_id))
+
+    def update(self, entities: Iterable[Dict[str, Any]]):
+        for entity in entities:
+            self.add(entity)
+
+    def add(self, entity: Dict[str, Any]):
+        """Add one serialized @graph element."""
+        self._track_root(entity)
+        entity_type = _get_type(entity)
+        is_dataset = "Dataset" in entity_type
+        is_software = "Software" in entity_type
+        is_crate = "ROCrate" in entity_type
+
+        if is_dataset:
+            self.datasets += 1
+        if "Computation" in entity_type or "Experiment" in entity_type:
+            self.transformations += 1
+        if is_software:
+            self.software += 1
+        if "Schema" in entity_type:
+            self.schemas += 1
+
+        if is_dataset or is_crate:
+            size = entity.get("contentSizeBytes")
+            if size is None:
+                size = parse_content_size(entity.get("contentSize"))
+            if size:
+                self.total_size += size
+            if entity.get("hasSummaryStatistics"):
+                self.with_summary_stats += 1
+
+        if is_dataset or is_software or is_crate:
+            self.checksum_candidates += 1
+            if entity.get("md5") or entity.get("MD5") or entity.get("sha256") or entity.get("SHA256") or entity.get("hash"):
+                self.with_checksum += 1
+
+        if is_dataset or is_software:
+            fmt = _get_format(entity)
+            if fmt:
+                self.formats.add(str(fmt))
+
+    def _track_root(self, entity: Dict[str, Any]):
+        if self._descriptor_seen:
+            if self.root_data is None and self._about and entity.get("@id") == self._about:
+                self.root_data = entity
+            return
+        entity_id = entity.get("@id")
+        if entity_id == "ro-crate-metadata.json":
+            about_ref = entity.get("about", {})
+            self._about = about_ref.get("@id") if isinstance(about_ref, dict) else about_ref
+            self._descriptor_seen = True
+            if self._about:
+                self.root_data = self._pending.get(self._about)
+            self._pending = {}
+        else:
+            self._pending.setdefault(entity_id, entity)
+
+    @property
+    def aggregated(self) -> bool:
+        """True when the root carries the evi: roll-ups of its sub-crates (evi:processed)."""
+        return bool(self.root_data and self.root_data.get("evi:processed"))
+
+    def score(self, score: Optional[AIReadyScore] = None) -> AIReadyScore:
+        """
+        Evaluate every criterion from the root and the totals.
+
+        Args:
+            score: the AIReadyScore to fill, a new one named after the root when None
+        """
+        root_data = self.root_data
+        if not root_data:
+            raise ValueError("Root entity not found in RO-Crate metadata graph.")
+
+        if score is None:
+            score = AIReadyScore(name=f"AI-Ready Score for {root_data.get('name')}")
+        _score_fairness(score.fairness, root_data)
+        _score_provenance(score.provenance, root_data, self)
+        _score_characterization(score.characterization, root_data, self)
+        _score_pre_model(score.pre_model_explainability, root_data, self)
+        _score_ethics(score.ethics, root_data)
+        _score_sustainability(score.sustainability, root_data)
+        _score_computability(score.computability, root_data, self)
+        return score
+
+def _add_subcrates(accumulator: ScoringAccumulator, loader: Optional[SubcrateLoader], crate: Optional[ROCrateV1_2] = None, paths: Optional[List[Tuple[Any, str]]] = None) -> List[SubcrateLoadError]:
+    """Add the elements of the sub-crates of a release, one sub-crate at a time; skipped once the root is aggregated.
+
+    Returns the sub-crates that failed to load.
+    """
+    if accumulator.aggregated:
+        return []
+    loader = loader or SubcrateLoader()
+    load = loader.load_subcrates(crate) if crate is not None else loader.load_paths(paths or [])
+    for subcrate in load.subcrates:
+        for sub_item in subcrate.crate.metadataGraph:
+            accumulator.add_entity(sub_item)
+    return load.errors
+
+def dump_subcrates(crate: ROCrateV1_2, root_id: Any, loader: Optional[SubcrateLoader] = None) -> Tuple[Iterator[Dict[str, Any]], List[SubcrateLoadError]]:
+    """Serialized elements of the sub-crates referenced through a 'ro-crate-metadata' path, and the sub-crates that failed to load.
+
+    The sub-crates are loaded by the call, with a new SubcrateLoader when loader is None; their
+    elements are serialized as the iterator is consumed.
+    """
+    load = (loader or SubcrateLoader()).load_subcrates(crate)
+    dumps = (dump_for_scoring(sub_item, root_id) for subcrate in load.subcrates for sub_item in subcrate.crate.metadataGraph)
+    return dumps, load.errors
+
+def root_guid(crate: ROCrateV1_2) -> Any:
+    """Guid of the root entity, as referenced by the crate's metadata descriptor."""
+    descriptor = crate.getEntity("ro-crate-metadata.json")
+    if descriptor is None:
+        return None
+    about = dump_subset(descriptor, ("about",)).get("about", {})
+    return about.get("@id") if isinstance(about, dict) else about
+
+def dump_for_scoring(entity: Any, root_id: Any) -> Dict[str, Any]:
+    """Serialize the root entity fully and other entities only as far as scoring reads them."""
+    if getattr(entity, "guid", None) == root_id:
+        data = entity.model_dump(by_alias=True)
+    else:
+        data = dump_subset(entity, SCORED_ENTITY_KEYS)
+    # contentSizeBytes is excluded from serialization, scoring reads it from the model
+    size_bytes = getattr(entity, "contentSizeBytes", None)
+    if size_bytes is not None:
+        data["contentSizeBytes"] = size_bytes
+    return data
 
 def _get_type(entity: Dict[str, Any]) -> List[str]:
     """Get type from either @type or metadataType field."""
@@ -100,7 +297,7 @@ def _score_fairness(fairness: FairnessScore, root_data: Dict[str, Any]):
             details=f"License: {license_val}"
         )
 
-def _score_provenance(provenance: ProvenanceScore, root_data: Dict[str, Any], metadata_graph: List[Dict]):
+def _score_provenance(provenance: ProvenanceScore, root_data: Dict[str, Any], totals: "ScoringAccumulator"):
     """Score Provenance criteria - simplified to just count entities."""
     actors = []
     author = root_data.get("author")
@@ -138,22 +335,10 @@ def _score_provenance(provenance: ProvenanceScore, root_data: Dict[str, Any], me
         transformations_count = computation_count
         software_count = software_count
     else:
-        # Fall back to counting in metadata_graph (for backwards compatibility)
-        datasets_count = 0
-        transformations_count = 0
-        software_count = 0
-
-        for entity in metadata_graph:
-            entity_type = _get_type(entity)
-
-            if "Dataset" in entity_type:
-                datasets_count += 1
-
-            if "Computation" in entity_type or "Experiment" in entity_type:
-                transformations_count += 1
-
-            if "Software" in entity_type:
-                software_count += 1
+        # Fall back to the counts over the metadata graph (for backwards compatibility)
+        datasets_count = totals.datasets
+        transformations_count = totals.transformations
+        software_count = totals.software
     
     if datasets_count > 0:
         provenance.transparent = SubCriterionScore(
@@ -173,7 +358,7 @@ def _score_provenance(provenance: ProvenanceScore, root_data: Dict[str, Any], me
             details=f"{software_count} software instances documented"
         )
 
-def _score_characterization(characterization: CharacterizationScore, root_data: Dict[str, Any], metadata_graph: List[Dict]):
+def _score_characterization(characterization: CharacterizationScore, root_data: Dict[str, Any], totals: "ScoringAccumulator"):
     """Score Characterization criteria."""
     bias = root_data.get("rai:dataBiases", "")
     if bias and str(bias).strip():
@@ -194,14 +379,8 @@ def _score_characterization(characterization: CharacterizationScore, root_data:
     if schema_count is not None:
        pass
     else:
-        # Fall back to counting in metadata_graph (for backwards compatibility)
-        schema_count = 0
-
-        for entity in metadata_graph:
-            entity_type = _get_type(entity)
-
-            if "Schema" in entity_type:
-                schema_count += 1
+        # Fall back to the count over the metadata graph (for backwards compatibility)
+        schema_count = totals.schemas
     
     if schema_count > 0:
         characterization.standards = SubCriterionScore(
@@ -218,38 +397,13 @@ def _score_characterization(characterization: CharacterizationScore, root_data:
         total_size = total_size_bytes
         stats_count = stats_count_agg
     else:
-        # Fall back to iterating metadata_graph
-        total_size = 0
-        stats_count = 0
-
-        for entity in metadata_graph:
-            entity_type = _get_type(entity)
-
-            if "Dataset" in entity_type or "ROCrate" in entity_type:
-                size = entity.get("contentSize", "")
-                if size:
-                    try:
-                        if isinstance(size, str):
-                            if "TB" in size:
-                                total_size += float(size.replace("TB", "").strip()) * 1e12
-                            elif "GB" in size:
-                                total_size += float(size.replace("GB", "").strip()) * 1e9
-                            elif "MB" in size:
-                                total_size += float(size.replace("MB", "").strip()) * 1e6
-                    except:
-                        pass
-
-                if entity.get("hasSummaryStatistics"):
-                    stats_count += 1
+        # Fall back to the totals over the metadata graph
+        total_size = totals.total_size
+        stats_count = totals.with_summary_stats
     
     details = []
     if total_size > 0:
-        if total_size >= 1e12:
-            details.append(f"Total size: {total_size/1e12:.1f} TB")
-        elif total_size >= 1e9:
-            details.append(f"Total size: {total_size/1e9:.1f} GB")
-        else:
-            details.append(f"Total size: {total_size/1e6:.1f} MB")
+        details.append(f"Total size: {format_content_size(total_size)}")
     
     if stats_count > 0:
         details.append(f"Summary statistics available for {stats_count} dataset(s)")
@@ -260,7 +414,7 @@ def _score_characterization(characterization: CharacterizationScore, root_data:
             details=", ".join(details)
         )
 
-def _score_pre_model(pre_model: PreModelExplainabilityScore, root_data: Dict[str, Any], metadata_graph: List[Dict]):
+def _score_pre_model(pre_model: PreModelExplainabilityScore, root_data: Dict[str, Any], totals: "ScoringAccumulator"):
     """Score Pre-Model Explainability criteria."""
     use_cases = root_data.get("rai:dataUseCases", "")
     limitations = root_data.get("rai:dataLimitations", "")
@@ -290,17 +444,9 @@ def _score_pre_model(pre_model: PreModelExplainabilityScore, root_data: Dict[str
         else:
             with_checksum = 0
     else:
-        # Fall back to counting in metadata_graph
-        total = 0
-        with_checksum = 0
-
-        for entity in metadata_graph:
-            entity_type = _get_type(entity)
-
-            if "Dataset" in entity_type or "Software" in entity_type or "ROCrate" in entity_type:
-                total += 1
-                if entity.get("md5") or entity.get("MD5" or "") or entity.get("sha256") or entity.get("SHA256" or "") or entity.get("hash") or entity.get("hash" or ""):
-                    with_checksum += 1
+        # Fall back to the counts over the metadata graph
+        total = totals.checksum_candidates
+        with_checksum = totals.with_checksum
     
     if total > 0 and with_checksum > 0:
         percentage = (with_checksum / total) * 100
@@ -415,7 +561,7 @@ def _score_sustainability(sustainability: SustainabilityScore, root_data: Dict[s
             details=f"Governance committee: {gov_val}"
         )
 
-def _score_computability(computability: ComputabilityScore, root_data: Dict[str, Any], metadata_graph: List[Dict]):
+def _score_computability(computability: ComputabilityScore, root_data: Dict[str, Any], totals: "ScoringAccumulator"):
     """Score Computability criteria."""
     # Check for aggregated metrics first
     formats_agg = root_data.get("evi:formats")
@@ -424,16 +570,8 @@ def _score_computability(computability: ComputabilityScore, root_data: Dict[str,
         # Use pre-aggregated formats
         formats = set(formats_agg)
     else:
-        # Fall back to collecting from metadata_graph
-        formats = set()
-
-        for entity in metadata_graph:
-            entity_type = _get_type(entity)
-
-            if "Dataset" in entity_type or "Software" in entity_type:
-                fmt = _get_format(entity)
-                if fmt:
-                    formats.add(str(fmt))
+        # Fall back to the formats collected over the metadata graph
+        formats = set(totals.formats)
     
     if formats:
         fmt_list = sorted(list(formats))[:5]
@@ -452,51 +590,11 @@ def _score_computability(computability: ComputabilityScore, root_data: Dict[str,
 def _build_ai_ready_score(value: Any, *, converter_instance) -> AIReadyScore:
     """Builder function for use with ROCToTargetConverter."""
     crate = converter_instance.source_crate
-    metadata_graph = []
-    
+    accumulator = ScoringAccumulator(root_id=root_guid(crate))
     for entity in crate.metadataGraph:
-        entity_dict = entity.model_dump(by_alias=True)
-        metadata_graph.append(entity_dict)
-    
-    for entity in crate.metadataGraph:
-        if hasattr(entity, 'ro-crate-metadata'):
-            metadata_path = Path(getattr(entity, 'ro-crate-metadata'))
-            try:
-                with metadata_path.open("r") as f:
-                    sub_crate_dict = json.load(f)
-                sub_rocrate = ROCrateV1_2.model_validate(sub_crate_dict)
-                
-                for sub_item in sub_rocrate.metadataGraph:
-                    sub_dict = sub_item.model_dump(by_alias=True)
-                    metadata_graph.append(sub_dict)
-            except:
-                pass
-    
-    root_data = None
-    for entity_dict in metadata_graph:
-        if entity_dict.get("@id") == "ro-crate-metadata.json":
-            about_ref = entity_dict.get("about", {})
-            root_id = about_ref.get("@id") if isinstance(about_ref, dict) else about_ref
-            if root_id:
-                for e in metadata_graph:
-                    if e.get("@id") == root_id:
-                        root_data = e
-                        break
-                break
-    
-    if not root_data:
-        raise ValueError("Root entity not found in RO-Crate metadata graph.")
-    
-    score = AIReadyScore()
-    _score_fairness(score.fairness, root_data)
-    _score_provenance(score.provenance, root_data, metadata_graph)
-    _score_characterization(score.characterization, root_data, metadata_graph)
-    _score_pre_model(score.pre_model_explainability, root_data, metadata_graph)
-    _score_ethics(score.ethics, root_data)
-    _score_sustainability(score.sustainability, root_data)
-    _score_computability(score.computability, root_data, metadata_graph)
-    
-    return score
+        accumulator.add_entity(entity)
+    _add_subcrates(accumulator, None, crate=crate)
+    return accumulator.score(AIReadyScore())
 
 AIREADY_MAPPING_CONFIGURATION = {
     "entity_map": {
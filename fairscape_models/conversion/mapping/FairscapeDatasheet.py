@@ -2,6 +2,7 @@ from typing import Any, Dict, List, Optional, Union
 from fairscape_models.conversion.models.FairscapeDatasheet import OverviewSection, UseCasesSection, DistributionSection, SubCrateItem, Preview, PreviewItem
 from fairscape_models.conversion.mapping.subcrate_utils import build_composition_details
 from fairscape_models.conversion.converter import ROCToTargetConverter
+from fairscape_models.serialization import dump_subset
 
 def _as_list_str(value: Any) -> List[str]:
     if value is None:
@@ -307,38 +308,27 @@ def _schema_properties_compact(v: Any) -> Union[Dict[str, Dict[str, Union[str, i
             }
     return compact or None
 
-def _summary_stats_name_builder(*, converter_instance, source_entity_model):
-    root = source_entity_model.model_dump(by_alias=True)
-    ref = root.get("hasSummaryStatistics")
+def _summary_stats_entity(converter_instance, source_entity_model):
+    ref = dump_subset(source_entity_model, ("hasSummaryStatistics",)).get("hasSummaryStatistics")
     if isinstance(ref, dict):
         ref_id = ref.get("@id")
     else:
         ref_id = str(ref or "")
     if not ref_id:
         return None
+    return converter_instance.source_crate.getEntity(ref_id)
 
-    for e in converter_instance.source_crate.metadataGraph:
-        sd = e.model_dump(by_alias=True)
-        if sd.get("@id") == ref_id or getattr(e, "guid", None) == ref_id:
-            return sd.get("name") or "Quality Control Report"
-    return None
+def _summary_stats_name_builder(*, converter_instance, source_entity_model):
+    e = _summary_stats_entity(converter_instance, source_entity_model)
+    if e is None:
+        return None
+    return dump_subset(e, ("name",)).get("name") or "Quality Control Report"
 
 def _summary_stats_url_builder(*, converter_instance, source_entity_model):
-    root = source_entity_model.model_dump(by_alias=True)
-    ref = root.get("hasSummaryStatistics")
-    if isinstance(ref, dict):
-        ref_id = ref.get("@id")
-    else:
-        ref_id = str(ref or "")
-    if not ref_id:
+    e = _summary_stats_entity(converter_instance, source_entity_model)
+    if e is None:
         return None
-
-    for e in converter_instance.source_crate.metadataGraph:
-        sd = e.model_dump(by_alias=True)
-        if sd.get("@id") == ref_id or getattr(e, "guid", None) == ref_id:
-            cu = sd.get("contentUrl")
-            return _first_url(cu)
-    return None
+    return _first_url(dump_subset(e, ("contentUrl",)).get("contentUrl"))
 
 
 
@@ -402,15 +392,15 @@ PREVIEW_MAPPING_CONFIGURATION: Dict[str, Any] = {
             "mapping_def": PREVIEW_ROOT_MAPPING,
         },
 
-        # Components -> PreviewItem (same mapping def; bucketed later)
-        ("Dataset", "COMPONENT"):     {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING},
-        ("Software", "COMPONENT"):    {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING},
-        ("Computation", "COMPONENT"): {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING},
-        ("Sample", "COMPONENT"):      {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING},
-        ("Experiment", "COMPONENT"):  {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING},
-        ("Instrument", "COMPONENT"):  {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING},
-        ("Schema", "COMPONENT"):      {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING},
-        ("GenericMetadataElem", "COMPONENT"):       {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING},
+        # Components -> PreviewItem (same mapping def; bucketed later), validated together after the root
+        ("Dataset", "COMPONENT"):     {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING, "validate": "end"},
+        ("Software", "COMPONENT"):    {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING, "validate": "end"},
+        ("Computation", "COMPONENT"): {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING, "validate": "end"},
+        ("Sample", "COMPONENT"):      {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING, "validate": "end"},
+        ("Experiment", "COMPONENT"):  {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING, "validate": "end"},
+        ("Instrument", "COMPONENT"):  {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING, "validate": "end"},
+        ("Schema", "COMPONENT"):      {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING, "validate": "end"},
+        ("GenericMetadataElem", "COMPONENT"):       {"target_class": PreviewItem, "mapping_def": PREVIEW_ITEM_MAPPING, "validate": "end"},
     },
 
     "sub_mappings": {},
@@ -420,43 +410,50 @@ PREVIEW_MAPPING_CONFIGURATION: Dict[str, Any] = {
             "parent_type": Preview,
             "parent_attribute": "datasets",
             "child_type": PreviewItem,
-            "child_filter": lambda o: (getattr(o, "type", "") or "") == "dataset",
+            "partition_by": "type",
+            "partition_value": "dataset",
         },
         {
             "parent_type": Preview,
             "parent_attribute": "software",
             "child_type": PreviewItem,
-            "child_filter": lambda o: (getattr(o, "type", "") or "") == "software",
+            "partition_by": "type",
+            "partition_value": "software",
         },
         {
             "parent_type": Preview,
             "parent_attribute": "computations",
             "child_type": PreviewItem,
-            "child_filter": lambda o: (getattr(o, "type", "") or "") == "computation",
+            "partition_by": "type",
+            "partition_value": "computation",
         },
         {
             "parent_type": Preview,
             "parent_attribute": "samples",
             "child_type": PreviewItem,
-            "child_filter": lambda o: (getattr(o, "type", "") or "") == "sample",
+            "partition_by": "type",
+            "partition_value": "sample",
         },
         {
             "parent_type": Preview,
             "parent_attribute": "experiments",
             "child_type": PreviewItem,
-            "child_filter": lambda o: (getattr(o, "type", "") or "") == "experiment",
+            "partition_by": "type",
+            "partition_value": "experiment",
         },
         {
             "parent_type": Preview,
             "parent_attribute": "instruments",
             "child_type": PreviewItem,
-            "child_filter": lambda o: (getattr(o, "type", "") or "") == "instrument",
+            "partition_by": "type",
+            "partition_value": "instrument",
         },
         {
             "parent_type": Preview,
             "parent_attribute": "schemas",
             "child_type": PreviewItem,
-            "child_filter": lambda o: (getattr(o, "type", "") or "") == "schema",
+            "partition_by": "type",
+            "partition_value": "schema",
         },
         {
             "parent_type": Preview,
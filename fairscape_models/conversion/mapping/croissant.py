@@ -3,6 +3,7 @@ from pydantic import BaseModel
 from functools import partial
 
 from fairscape_models.rocrate import ROCrateV1_2, Dataset as ROCrateDataset, Schema as ROCrateSchema
+from fairscape_models.serialization import dump_subset
 from fairscape_models.conversion.models import (
     CroissantDataset, CroissantFileObject, CroissantRecordSet, CroissantField,
     CroissantSource, CroissantIdentifier, DEFAULT_CROISSANT_CONTEXT
@@ -129,7 +130,7 @@ def _build_rai_property(
     additional_prop_name: Union[str, List[str]],
     is_list: bool = True
 ) -> Optional[Union[str, List[str]]]:
-    source_dict = source_entity_model.model_dump(by_alias=True)
+    source_dict = dump_subset(source_entity_model, (rai_key, "additionalProperty"))
 
     if rai_key in source_dict and source_dict[rai_key] is not None:
         value = source_dict[rai_key]
@@ -149,9 +150,9 @@ def _build_rai_property(
 def _build_personal_sensitive_info(
     converter_instance: 'ROCToTargetConverter', source_entity_model: BaseModel
 ) -> Optional[List[str]]:
-    source_dict = source_entity_model.model_dump(by_alias=True)
-    
     rai_key = "rai:personalSensitiveInformation"
+    source_dict = dump_subset(source_entity_model, (rai_key, "additionalProperty"))
+
     if rai_key in source_dict and source_dict[rai_key] is not None:
         value = source_dict[rai_key]
         return value if isinstance(value, list) else [value]
@@ -339,7 +340,7 @@ MAPPING_CONFIGURATION = {
             "target_class": CroissantDataset, "mapping_def": CROISSANT_DATASET_MAPPING
         },
         ("Dataset", "COMPONENT"): {
-            "target_class": CroissantFileObject, "mapping_def": CROISSANT_FILE_OBJECT_MAPPING
+            "target_class": CroissantFileObject, "mapping_def": CROISSANT_FILE_OBJECT_MAPPING, "validate": "end"
         },
         ("Schema", "COMPONENT"): None,
     },
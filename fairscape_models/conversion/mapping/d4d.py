@@ -7,6 +7,7 @@ to convert ROCrate format data to D4D (Data Sheets for Datasets) format.
 
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from fairscape_models.content_size import parse_content_size
 import re
 
 
@@ -42,31 +43,7 @@ def _parse_keywords_to_list(keywords: Any) -> Optional[List[str]]:
 
 def _parse_size_to_bytes(size_value: Any) -> Optional[int]:
     """Convert human-readable size strings to bytes."""
-    if size_value is None:
-        return None
-    if isinstance(size_value, int):
-        return size_value
-    if isinstance(size_value, str):
-        size_str = size_value.strip().lower()
-        if size_str.isdigit():
-            return int(size_str)
-
-        units = {
-            'b': 1, 'byte': 1, 'bytes': 1,
-            'kb': 1024, 'kilobyte': 1024, 'kilobytes': 1024,
-            'mb': 1024**2, 'megabyte': 1024**2, 'megabytes': 1024**2,
-            'gb': 1024**3, 'gigabyte': 1024**3, 'gigabytes': 1024**3,
-            'tb': 1024**4, 'terabyte': 1024**4, 'terabytes': 1024**4
-        }
-
-        for unit, multiplier in units.items():
-            if size_str.endswith(unit):
-                try:
-                    number = float(size_str[:-len(unit)].strip())
-                    return int(number * multiplier)
-                except ValueError:
-                    continue
-    return None
+    return parse_content_size(size_value)
 
 
 def _string_to_list(value: Any) -> Optional[List[str]]:
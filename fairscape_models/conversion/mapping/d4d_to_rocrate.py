@@ -7,6 +7,7 @@ to convert D4D pydantic classes to ROCrate v1.2.
 
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from fairscape_models.content_size import format_content_size
 
 
 # ============================================================================
@@ -39,17 +40,10 @@ def _parse_bytes_to_size_string(value: Any) -> Optional[str]:
         return None
     if isinstance(value, str):
         return value
-
     bytes_val = int(value)
-    if bytes_val >= 1024**4:
-        return f"{bytes_val / (1024**4):.2f} TB"
-    elif bytes_val >= 1024**3:
-        return f"{bytes_val / (1024**3):.2f} GB"
-    elif bytes_val >= 1024**2:
-        return f"{bytes_val / (1024**2):.2f} MB"
-    elif bytes_val >= 1024:
-        return f"{bytes_val / 1024:.2f} KB"
-    return f"{bytes_val} bytes"
+    if bytes_val < 1024:
+        return f"{bytes_val} bytes"
+    return format_content_size(bytes_val, precision=2)
 
 
 def _format_enum_value(value: Any) -> Optional[str]:
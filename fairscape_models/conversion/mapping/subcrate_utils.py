@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Set
+import functools
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from fairscape_models.conversion.models.FairscapeDatasheet import CompositionDetails
 from collections import Counter
 
@@ -79,33 +80,39 @@ def build_composition_details(converter_instance, source_entity_model) -> Compos
     return details
 
 
+# first matching substring of the joined types wins; "SoftwareSourceCode" and the EVI IRIs contain these
+_NORMALIZED_TYPES = ("Dataset", "Software", "Instrument", "Sample", "Experiment", "Computation", "Schema")
+
+
 def _normalize_type(item) -> str:
     type_field = getattr(item, 'metadataType', None) or getattr(item, '@type', None)
-    
+    return _normalize_type_field(type_field)
+
+
+def _index_type(entity_info: Dict[str, Any]) -> str:
+    """Normalized type of a global_index entry: precomputed by GlobalIndex, else from its @type."""
+    normalized = entity_info.get('normalizedType')
+    if normalized:
+        return normalized
+    return _normalize_type_field(entity_info.get('@type', entity_info.get('metadataType')))
+
+
+def _normalize_type_field(type_field) -> str:
     if not type_field:
         return "Other"
     
     if isinstance(type_field, list):
-        type_str = " ".join(type_field)
-    else:
-        type_str = str(type_field)
-    
-    if "Dataset" in type_str or "EVI:Dataset" in type_str or "https://w3id.org/EVI#Dataset" in type_str:
-        return "Dataset"
-    elif "Software" in type_str or "EVI:Software" in type_str or "https://w3id.org/EVI#Software" in type_str or "SoftwareSourceCode" in type_str:
-        return "Software"
-    elif "Instrument" in type_str or "https://w3id.org/EVI#Instrument" in type_str or "EVI:Instrument" in type_str:
-        return "Instrument"
-    elif "Sample" in type_str or "https://w3id.org/EVI#Sample" in type_str or "EVI:Sample" in type_str:
-        return "Sample"
-    elif "Experiment" in type_str or "https://w3id.org/EVI#Experiment" in type_str or "EVI:Experiment" in type_str:
-        return "Experiment"
-    elif "Computation" in type_str or "https://w3id.org/EVI#Computation" in type_str or "EVI:Computation" in type_str:
-        return "Computation"
-    elif "Schema" in type_str or "EVI:Schema" in type_str or "https://w3id.org/EVI#Schema" in type_str:
-        return "Schema"
-    else:
-        return "Other"
+        return _normalize_type_name(tuple(str(value) for value in type_field))
+    return _normalize_type_name(str(type_field))
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_type_name(type_field: Union[str, Tuple[str, ...]]) -> str:
+    type_str = type_field if isinstance(type_field, str) else " ".join(type_field)
+    for name in _NORMALIZED_TYPES:
+        if name in type_str:
+            return name
+    return "Other"
 
 
 def _process_dataset(item, formats: List[str], access_types: List[str]):
@@ -293,7 +300,9 @@ def _calculate_input_datasets(root_dataset, global_index: Dict[str, Any]) -> Dic
             else:
                 format_val = entity_info.get('fileFormat', 'unknown')
                 if format_val == 'unknown':
-                    format_val = 'Sample'
+                    # inputs without a format are labelled by type; untyped ones are taken to be samples
+                    entity_type = _index_type(entity_info)
+                    format_val = 'Sample' if entity_type == "Other" else entity_type
                     
                 rocrate_name = entity_info.get('rocrateName', '')
                 
@@ -0,0 +1,110 @@
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.serialization import dump_subset
+from fairscape_models.conversion.converter import ROCToTargetConverter
+from fairscape_models.conversion.d4d_converter import D4DConverter
+from fairscape_models.conversion.subcrate_loader import SubcrateLoader
+from fairscape_models.conversion.mapping.croissant import MAPPING_CONFIGURATION as CROISSANT_MAPPING_CONFIGURATION
+from fairscape_models.conversion.mapping.FairscapeDatasheet import PREVIEW_MAPPING_CONFIGURATION
+from fairscape_models.conversion.mapping.AIReady import (
+    SCORED_ENTITY_KEYS, ScoringAccumulator, ScoringResult, dump_subcrates, root_guid,
+)
+
+# mapping configurations run through ROCToTargetConverter, by target name
+MAPPING_TARGETS: Dict[str, Dict[str, Any]] = {
+    "croissant": CROISSANT_MAPPING_CONFIGURATION,
+    "datasheet": PREVIEW_MAPPING_CONFIGURATION,
+}
+
+MULTI_TARGETS = ("croissant", "datasheet", "ai_ready", "d4d")
+
+
+def dump_graph(
+    crate: ROCrateV1_2,
+    converters: Sequence[ROCToTargetConverter] = (),
+    root_id: Optional[str] = None,
+    entity_keys: FrozenSet[str] = frozenset(),
+) -> List[Dict[str, Any]]:
+    """ Serialize every ``@graph`` element once, with the keys all the given consumers read
+
+    :param crate: the crate to serialize
+    :param converters: converters whose mappings read the dumps; each element gets the source keys of
+        the rule it matches in any of them
+    :param root_id: guid of the root element, which is dumped in full when given
+    :param entity_keys: keys added for every element, e.g. ``SCORED_ENTITY_KEYS``
+    :return: ``model_dump(by_alias=True)`` subsets in ``metadataGraph`` order
+    """
+    # the keys only depend on the element class and whether it is the root
+    keys_by_kind: Dict[Tuple[type, bool], FrozenSet[str]] = {}
+    dumps = []
+    for entity in crate.metadataGraph:
+        if root_id is not None and entity.guid == root_id:
+            dumps.append(_with_content_size_bytes(entity, entity.model_dump(by_alias=True), entity_keys))
+            continue
+        # every converter reads the same crate, so they share its root entity
+        kind = (type(entity), bool(converters) and entity.guid == converters[0].root_entity.guid)
+        keys = keys_by_kind.get(kind)
+        if keys is None:
+            keys = keys_by_kind[kind] = entity_keys.union(*(converter.source_keys(entity) for converter in converters))
+        dumps.append(_with_content_size_bytes(entity, dump_subset(entity, keys), entity_keys))
+    return dumps
+
+
+def _with_content_size_bytes(entity: BaseModel, dump: Dict[str, Any], entity_keys: FrozenSet[str]) -> Dict[str, Any]:
+    # contentSizeBytes is excluded from serialization, add it back when a consumer reads it
+    if "contentSizeBytes" in entity_keys and getattr(entity, "contentSizeBytes", None) is not None:
+        dump["contentSizeBytes"] = entity.contentSizeBytes
+    return dump
+
+
+def convert_targets(
+    crate: ROCrateV1_2,
+    targets: Sequence[str] = MULTI_TARGETS,
+    loader: Optional[SubcrateLoader] = None,
+) -> Dict[str, Any]:
+    """ Convert one crate to several output formats, serializing its graph once
+
+    Every element is dumped a single time with the union of the keys read by the requested
+    targets, and the same dicts are handed to each mapping, to the AI-Ready scoring and, for
+    the root, to the D4D mapping. The outputs equal those of converting separately.
+
+    :param crate: the crate to convert
+    :param targets: any of ``"croissant"``, ``"datasheet"`` (the datasheet preview),
+        ``"ai_ready"`` (the ``ScoringResult`` of ``score_rocrate_with_errors``) and ``"d4d"``
+    :param loader: reads the sub-crates for ``"ai_ready"``; a new ``SubcrateLoader`` when None
+    :return: the output of every requested target, by target name
+    """
+    unknown = [target for target in targets if target not in MULTI_TARGETS]
+    if unknown:
+        raise ValueError(f"Unknown conversion targets {unknown}, expected any of {list(MULTI_TARGETS)}")
+
+    converters = {
+        target: ROCToTargetConverter(crate, MAPPING_TARGETS[target])
+        for target in targets if target in MAPPING_TARGETS
+    }
+    root_id = root_guid(crate)
+    full_root = "ai_ready" in targets or "d4d" in targets
+    entity_keys = SCORED_ENTITY_KEYS if "ai_ready" in targets else frozenset()
+    dumps = dump_graph(crate, list(converters.values()), root_id if full_root else None, entity_keys)
+
+    outputs: Dict[str, Any] = {}
+    for target in targets:
+        if target in converters:
+            outputs[target] = converters[target].convert(entity_dumps=dumps)
+        elif target == "ai_ready":
+            accumulator = ScoringAccumulator()
+            accumulator.update(dumps)
+            errors = []
+            if not accumulator.aggregated:
+                subcrate_dumps, errors = dump_subcrates(crate, root_id, loader)
+                accumulator.update(subcrate_dumps)
+            outputs[target] = ScoringResult(accumulator.score(), errors)
+        elif target == "d4d":
+            root_dump = next((dump for dump in dumps if dump.get("@id") == root_id), None) if root_id else None
+            d4d_converter = D4DConverter(crate)
+            d4d_converter.convert(root_entity=root_dump)
+            outputs[target] = d4d_converter.d4dOutput
+    return outputs
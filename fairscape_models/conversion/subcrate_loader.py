@@ -0,0 +1,194 @@
+import collections
+import json
+import os
+import pathlib
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type, Union
+
+from fairscape_models.rocrate import ROCrateV1_2
+
+PathLike = Union[str, os.PathLike]
+
+# extra property of a release element pointing to its sub-crate's metadata file
+SUBCRATE_METADATA_KEY = "ro-crate-metadata"
+
+
+class SubcrateLoadError(NamedTuple):
+    """ A sub-crate that could not be read or validated """
+    guid: Optional[str]
+    path: str
+    error_type: str
+    message: str
+
+
+class LoadedSubcrate(NamedTuple):
+    guid: Optional[str]
+    path: str
+    crate: ROCrateV1_2
+
+
+class SubcrateLoad(NamedTuple):
+    """ The sub-crates one call loaded, in graph order, and the ones it could not """
+    subcrates: List[LoadedSubcrate]
+    errors: List[SubcrateLoadError]
+
+
+def entity_subcrate_paths(entity: Any, base_dir: Optional[PathLike] = None) -> List[Tuple[Optional[str], str]]:
+    """ ``[(guid, path)]`` when the element has a ``ro-crate-metadata`` path, else an empty list
+
+    Relative paths are joined to ``base_dir`` when given, and otherwise read from the working directory.
+    """
+    extra = entity.__pydantic_extra__
+    path = extra.get(SUBCRATE_METADATA_KEY) if extra else None
+    if path is None:
+        return []
+    if base_dir is not None:
+        path = pathlib.Path(base_dir) / path
+    return [(getattr(entity, "guid", None), str(path))]
+
+
+def subcrate_paths(crate: ROCrateV1_2, base_dir: Optional[PathLike] = None) -> List[Tuple[Optional[str], str]]:
+    """ ``(guid, path)`` of every element with a ``ro-crate-metadata`` path, in graph order; see ``entity_subcrate_paths`` """
+    paths = []
+    for entity in crate.metadataGraph:
+        paths.extend(entity_subcrate_paths(entity, base_dir))
+    return paths
+
+
+def _stat_key(path: pathlib.Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_subcrate(path: str, crate_class: Type[ROCrateV1_2]) -> Tuple[Tuple[int, int], ROCrateV1_2]:
+    """ Stat, parse and validate one sub-crate; module level so it can run in a process pool """
+    metadata_path = pathlib.Path(path)
+    stat_key = _stat_key(metadata_path)
+    with metadata_path.open("r") as f:
+        data = json.load(f)
+    return stat_key, crate_class.model_validate_graph(data)
+
+
+class SubcrateLoader:
+    """ Loads the sub-crates of a release concurrently and caches them by path and mtime
+
+    A cached sub-crate is reused while its file keeps the same modification time and
+    size. The cache keeps the ``max_entries`` most recently used sub-crates, for as long
+    as the loader is referenced: keep one loader to reuse sub-crates across calls.
+
+    Failures do not stop a load: each call returns the sub-crates it skipped as
+    ``SubcrateLoadError`` entries next to the ones it loaded, so concurrent calls on one
+    loader do not share errors.
+
+    Threads overlap reading the files, but validation holds the GIL, so with threads the
+    gain is limited to I/O. ``processes=True`` validates sub-crates in parallel at the
+    cost of pickling every crate back to the caller.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        processes: bool = False,
+        max_entries: int = 256,
+        crate_class: Type[ROCrateV1_2] = ROCrateV1_2,
+    ):
+        """
+        :param workers: threads or processes reading sub-crates, ``os.cpu_count()`` when None;
+            1 reads them in the calling thread
+        :param processes: use a process pool, which parallelizes validation but pickles every crate back
+        :param max_entries: sub-crates kept in the cache
+        :param crate_class: the model sub-crates are validated with
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.processes = processes
+        self.max_entries = max_entries
+        self.crate_class = crate_class
+        self.cache: "collections.OrderedDict[str, Tuple[Tuple[int, int], ROCrateV1_2]]" = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # guards the cache and counters between concurrent calls
+        self._lock = threading.Lock()
+
+    def _cached(self, path: str) -> Optional[ROCrateV1_2]:
+        entry = self.cache.get(path)
+        if entry is None:
+            return None
+        try:
+            current = _stat_key(pathlib.Path(path))
+        except OSError:
+            current = None
+        if current != entry[0]:
+            del self.cache[path]
+            return None
+        self.cache.move_to_end(path)
+        return entry[1]
+
+    def _store(self, path: str, stat_key: Tuple[int, int], crate: ROCrateV1_2):
+        self.cache[path] = (stat_key, crate)
+        self.cache.move_to_end(path)
+        while len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
+
+    def _executor(self, tasks: int) -> Executor:
+        workers = min(self.workers, tasks)
+        return ProcessPoolExecutor(max_workers=workers) if self.processes else ThreadPoolExecutor(max_workers=workers)
+
+    def load_subcrates(self, crate: ROCrateV1_2, base_dir: Optional[PathLike] = None) -> SubcrateLoad:
+        """ Load the sub-crates referenced by ``crate``, in graph order
+
+        :param crate: the release whose elements point to sub-crate metadata files
+        :param base_dir: directory relative sub-crate paths are read from, the working directory when None
+        :return: the sub-crates that loaded and the errors of those that did not
+        """
+        return self.load_paths(subcrate_paths(crate, base_dir))
+
+    def load_paths(self, paths: List[Tuple[Optional[str], str]]) -> SubcrateLoad:
+        """ Load sub-crates from ``(guid, path)`` pairs as returned by ``subcrate_paths``, in order """
+        crates: Dict[str, ROCrateV1_2] = {}
+        missing = []
+        with self._lock:
+            for _, path in paths:
+                if path in crates or path in missing:
+                    continue
+                cached = self._cached(path)
+                if cached is None:
+                    missing.append(path)
+                else:
+                    crates[path] = cached
+            self.hits += len(crates)
+            self.misses += len(missing)
+
+        failures: Dict[str, BaseException] = {}
+        if self.workers <= 1 or len(missing) <= 1:
+            for path in missing:
+                self._collect(path, lambda: _read_subcrate(path, self.crate_class), crates, failures)
+        else:
+            with self._executor(len(missing)) as executor:
+                futures = [(path, executor.submit(_read_subcrate, path, self.crate_class)) for path in missing]
+                for path, future in futures:
+                    self._collect(path, future.result, crates, failures)
+
+        loaded = []
+        errors = []
+        for guid, path in paths:
+            if path in crates:
+                loaded.append(LoadedSubcrate(guid, path, crates[path]))
+            else:
+                error = failures[path]
+                errors.append(SubcrateLoadError(guid, path, type(error).__name__, str(error)))
+        return SubcrateLoad(loaded, errors)
+
+    def _collect(self, path: str, result: Any, crates: Dict[str, ROCrateV1_2], failures: Dict[str, BaseException]):
+        try:
+            stat_key, subcrate = result()
+        except Exception as error:
+            failures[path] = error
+        else:
+            with self._lock:
+                self._store(path, stat_key, subcrate)
+            crates[path] = subcrate
+
+    def clear(self):
+        with self._lock:
+            self.cache.clear()
@@ -1,11 +1,12 @@
 import csv
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, AliasChoices, model_validator
+from pydantic import BaseModel, Field, ConfigDict, AliasChoices, PrivateAttr, model_validator
 from typing import Optional, List, Union, Tuple
 from enum import Enum
 
 from fairscape_models.fairscape_base import IdentifierValue, DATASET_TYPE
 from fairscape_models.digital_object import DigitalObject
+from fairscape_models.content_size import format_content_size, parse_content_size
 
 
 TABULAR_FORMATS = {"csv", "tsv", "text/csv", "text/tab-separated-values"}
@@ -25,13 +26,6 @@ def _count_csv(path: Path, delimiter: str) -> Tuple[int, int]:
     return rows, cols
 
 
-def _human_size(n: int) -> str:
-    for unit in ("B", "KB", "MB", "GB", "TB"):
-        if n < 1024 or unit == "TB":
-            return f"{n:.1f} {unit}" if unit != "B" else f"{n} {unit}"
-        n /= 1024
-
-
 class SplitType(str, Enum):
     """Croissant-aligned split type semantics.
 
@@ -89,6 +83,8 @@ class Dataset(DigitalObject):
 
     # statistics support AI-Ready rubric 2.b Statistics).
     contentSize: Optional[str] = Field(default=None, description="Total size of the dataset content (e.g. '2.4 GB', '150 MB').")
+    givenContentSizeBytes: Optional[int] = Field(default=None, alias="contentSizeBytes", exclude=True, description="contentSize in bytes; parsed from contentSize when not given or after contentSize changes. Not serialized.")
+    _contentSizeBytesOf: Optional[str] = PrivateAttr(default=None)
     rowCount: Optional[int] = Field(default=None, description="Number of rows / records for tabular datasets.")
     columnCount: Optional[int] = Field(default=None, description="Number of columns / fields for tabular datasets.")
     sampleSize: Optional[int] = Field(default=None, description="Number of samples represented by the dataset (often == rowCount for tabular data, but may differ).")
@@ -116,11 +112,12 @@ class Dataset(DigitalObject):
         delimiter = "\t" if resolved.suffix.lower() == ".tsv" or "tab" in (self.fileFormat or "").lower() else ","
         rows, cols = _count_csv(resolved, delimiter)
         size_bytes = resolved.stat().st_size
-        size_str = _human_size(size_bytes)
+        size_str = format_content_size(size_bytes)
 
         self.rowCount = rows
         self.columnCount = cols
         self.contentSize = size_str
+        self.contentSizeBytes = size_bytes
         if self.sampleSize is None:
             self.sampleSize = rows
 
@@ -136,6 +133,7 @@ class Dataset(DigitalObject):
             rowCount=rows,
             columnCount=cols,
             contentSize=size_str,
+            contentSizeBytes=size_bytes,
             sampleSize=rows,
             derivedFrom=[IdentifierValue(**{"@id": self.guid})],
         )
@@ -191,6 +189,23 @@ class Dataset(DigitalObject):
             f"extension={ext!r}); use the CLI augment summary-stats command for richer formats."
         )
 
+    @model_validator(mode='after')
+    def record_content_size_bytes(self):
+        self._contentSizeBytesOf = self.contentSize
+        return self
+
+    @property
+    def contentSizeBytes(self) -> Optional[int]:
+        """contentSize in bytes: the given byte count while contentSize is unchanged, else contentSize parsed."""
+        if self.givenContentSizeBytes is not None and self._contentSizeBytesOf == self.contentSize:
+            return self.givenContentSizeBytes
+        return parse_content_size(self.contentSize)
+
+    @contentSizeBytes.setter
+    def contentSizeBytes(self, size_bytes: Optional[int]):
+        self.givenContentSizeBytes = size_bytes
+        self._contentSizeBytesOf = self.contentSize
+
     @model_validator(mode='after')
     def populate_prov_fields(self):
         """Auto-populate PROV-O fields from EVI fields"""
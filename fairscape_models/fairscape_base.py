@@ -10,15 +10,20 @@ from typing import (
     List,
     Optional,
     Dict,
+    Iterable,
+    Mapping,
+    Tuple,
     Union,
     Any
 )
+from functools import lru_cache
 import re
 from typing_extensions import Annotated
 from enum import Enum
 
 
 IdentifierPattern = "^ark:[0-9]{5}\\/[a-zA-Z0-9_\\-]+.$"
+ARKPattern = re.compile("ark:[0-9]{5}/.+$")
 
 DATASET_TYPE = "Dataset"
 DATASET_CONTAINER_TYPE = "DatasetContainer"
@@ -70,18 +75,20 @@ DEFAULT_CONTEXT = {
     }
 }
 
+@lru_cache(maxsize=65536)
+def _extractARK(inputString: str) -> str:
+    match = ARKPattern.search(inputString)
+    return match.group() if match else inputString
+
+
 def extractGUID(inputString: str | None) -> str|None:
     """
     Given an input ARK extract the normalized ARK, if validation fails return the input.
+
+    Results for string inputs are memoized, as the same ARK is typically referenced
+    from many elements of a crate.
     """
-    try:
-        match = re.search(
-            pattern="ark:[0-9]{5}/.+$",
-            string=inputString
-        )
-        return match.group()
-    except AttributeError:
-        return inputString
+    return _extractARK(inputString)
 
 
 class ClassType(str, Enum):
@@ -192,3 +199,50 @@ class Identifier(BaseModel):
         #else:
         #    return value
         return value
+
+
+def cleanGUID(inputString: Any) -> Any:
+    """
+    Trim a full URL pointing to an ARK (e.g. `https://fairscape.net/ark:59852/x`) to the bare ARK.
+    Values that are not URLs, or hold no ARK, are returned unchanged.
+    """
+    if isinstance(inputString, str) and "http" in inputString:
+        return _extractARK(inputString)
+    return inputString
+
+
+def _normalizeGUID(model: Any) -> None:
+    guid = getattr(model, "guid", None)
+    if type(guid) is str and "http" in guid:
+        model.guid = _extractARK(guid)
+
+
+def normalizeIdentifiers(elements: Iterable[BaseModel], identifierFields: Mapping[type, Tuple[str, ...]]) -> None:
+    """
+    Rewrite the guid of every element, and of the references held in its identifier fields, from a full URL to the bare ARK.
+
+    `identifierFields` maps a model class to the names of its fields holding an `IdentifierValue`
+    or a list of them; an element is cleaned on the fields of every class it is an instance of.
+    Nested models outside those fields are left untouched. Values are rewritten in place.
+    """
+    resolved: Dict[type, Tuple[str, ...]] = {}
+    for element in elements:
+        _normalizeGUID(element)
+
+        elementClass = type(element)
+        names = resolved.get(elementClass)
+        if names is None:
+            names = resolved[elementClass] = tuple(
+                name
+                for modelClass, fields in identifierFields.items() if issubclass(elementClass, modelClass)
+                for name in fields
+            )
+
+        attributes = element.__dict__
+        for name in names:
+            value = attributes.get(name)
+            if type(value) is list:
+                for item in value:
+                    _normalizeGUID(item)
+            elif value is not None:
+                _normalizeGUID(value)
@@ -0,0 +1,250 @@
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Type, get_args
+from pydantic import BaseModel
+
+from fairscape_models.fairscape_base import IdentifierValue, extractGUID
+from fairscape_models.provenance import ProvenanceIndex
+
+
+class GraphList(list):
+    """ List of ``@graph`` elements that counts its own mutations
+
+    ``ROCrateV1_2`` stores its ``metadataGraph`` as a ``GraphList`` so a ``GraphIndex``
+    built over it can tell in O(1) whether the graph changed since it was built.
+    """
+    __slots__ = ("version",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+    def __reduce__(self):
+        # unpickling would otherwise extend the list before __init__ sets version
+        return type(self), (list(self),)
+
+    def _mutated(self):
+        self.version += 1
+
+    def append(self, item):
+        super().append(item)
+        self._mutated()
+
+    def extend(self, items):
+        super().extend(items)
+        self._mutated()
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._mutated()
+
+    def pop(self, *args):
+        item = super().pop(*args)
+        self._mutated()
+        return item
+
+    def remove(self, item):
+        super().remove(item)
+        self._mutated()
+
+    def clear(self):
+        super().clear()
+        self._mutated()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._mutated()
+
+    def reverse(self):
+        super().reverse()
+        self._mutated()
+
+    def __setitem__(self, index, item):
+        super().__setitem__(index, item)
+        self._mutated()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._mutated()
+
+    def __iadd__(self, items):
+        result = super().__iadd__(items)
+        self._mutated()
+        return result
+
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        self._mutated()
+        return result
+
+
+def _iter_references(value: Any, strings: bool = False) -> Iterator[str]:
+    """ Yield the ``@id`` of every identifier reference held by a field value
+
+    With ``strings`` plain string values are references too, as in fields declared
+    ``Union[str, IdentifierValue]``.
+    """
+    if isinstance(value, IdentifierValue):
+        yield value.guid
+    elif isinstance(value, dict):
+        ref = value.get("@id")
+        if isinstance(ref, str):
+            yield ref
+    elif isinstance(value, str):
+        if strings:
+            yield value
+    elif isinstance(value, list):
+        for item in value:
+            if isinstance(item, IdentifierValue):
+                yield item.guid
+            elif isinstance(item, dict) and isinstance(item.get("@id"), str):
+                yield item["@id"]
+            elif strings and isinstance(item, str):
+                yield item
+
+
+def _admits_string_references(annotation: Any) -> bool:
+    args = get_args(annotation)
+    if str in args and IdentifierValue in args:
+        return True
+    return any(_admits_string_references(arg) for arg in args)
+
+
+_STRING_REFERENCE_FIELDS: Dict[type, FrozenSet[str]] = {}
+
+
+def string_reference_fields(model_class: type) -> FrozenSet[str]:
+    """ Names of the fields of a model class declared ``Union[str, IdentifierValue]``, alone or in a list
+
+    Plain strings in these fields are identifier references written without ``{"@id": ...}``.
+    """
+    fields = _STRING_REFERENCE_FIELDS.get(model_class)
+    if fields is None:
+        fields = frozenset(
+            name for name, field in model_class.model_fields.items()
+            if _admits_string_references(field.annotation)
+        )
+        _STRING_REFERENCE_FIELDS[model_class] = fields
+    return fields
+
+
+_FIELD_KEYS: Dict[type, Dict[str, str]] = {}
+
+
+def _field_keys(model_class: type) -> Dict[str, str]:
+    """ Map attribute names of a model class to their serialized (alias) keys
+    """
+    keys = _FIELD_KEYS.get(model_class)
+    if keys is None:
+        keys = {
+            name: (field.serialization_alias or field.alias or name)
+            for name, field in model_class.model_fields.items()
+        }
+        _FIELD_KEYS[model_class] = keys
+    return keys
+
+
+def iter_entity_references(entity: BaseModel) -> Iterator[Tuple[str, str]]:
+    """ Yield ``(key, @id)`` for every identifier reference held by an element's fields
+
+    ``key`` is the serialized property name; extra properties are included. Plain strings
+    count as references in the fields listed by ``string_reference_fields``.
+    """
+    keys = _field_keys(type(entity))
+    string_fields = string_reference_fields(type(entity))
+    for name, value in entity.__dict__.items():
+        for ref in _iter_references(value, name in string_fields):
+            yield keys.get(name, name), ref
+    if entity.__pydantic_extra__:
+        for name, value in entity.__pydantic_extra__.items():
+            for ref in _iter_references(value):
+                yield name, ref
+
+
+class GraphIndex:
+    """ Lookup tables over the elements of a crate's ``@graph``
+
+    Built lazily by ``ROCrateV1_2`` and rebuilt whenever the graph list is mutated.
+    Lookups by ``@id`` and by exact class are O(1); ``instances_of`` results are
+    cached per queried class. Reverse edges (which elements reference a given ``@id``)
+    are only computed on first use. Reference targets are normalized with
+    ``extractGUID`` so a reference written as a full URL matches an element whose
+    guid is the bare ARK.
+
+    Editing an element in place (e.g. changing its ``guid``) does not mutate the
+    graph list; call ``ROCrateV1_2.invalidateIndex`` afterwards.
+    """
+
+    def __init__(self, graph: List[BaseModel]):
+        self.source = graph
+        if isinstance(graph, GraphList):
+            self.version = graph.version
+            self._snapshot = None
+        else:
+            self.version = None
+            self._snapshot = list(graph)
+
+        self.by_guid: Dict[str, BaseModel] = {}
+        self.by_type: Dict[type, List[BaseModel]] = {}
+        self._positions: Dict[type, List[int]] = {}
+        self._instances: Dict[type, List[BaseModel]] = {}
+        self._referenced_by: Optional[Dict[str, List[Tuple[BaseModel, str]]]] = None
+        self._provenance: Optional[ProvenanceIndex] = None
+
+        for position, entity in enumerate(graph):
+            guid = getattr(entity, "guid", None)
+            if isinstance(guid, str):
+                self.by_guid.setdefault(guid, entity)
+            entity_type = type(entity)
+            self.by_type.setdefault(entity_type, []).append(entity)
+            self._positions.setdefault(entity_type, []).append(position)
+
+    def matches(self, graph: List[BaseModel]) -> bool:
+        """ Whether this index still describes ``graph``
+        """
+        if self._snapshot is None:
+            return graph is self.source and graph.version == self.version
+        # list equality short-circuits on identity, so this is a C level scan
+        return graph is self.source and graph == self._snapshot
+
+    def get(self, guid: str) -> Optional[BaseModel]:
+        """ Return the first element with the given ``@id``
+        """
+        return self.by_guid.get(guid)
+
+    def instances_of(self, model_class: Type[BaseModel]) -> List[BaseModel]:
+        """ Return all elements that are instances of ``model_class``, in graph order
+
+        The returned list is shared with the index and must not be mutated.
+        """
+        instances = self._instances.get(model_class)
+        if instances is None:
+            matching = [t for t in self.by_type if issubclass(t, model_class)]
+            if len(matching) == 1:
+                instances = self.by_type[matching[0]]
+            else:
+                positions = sorted(p for t in matching for p in self._positions[t])
+                instances = [self.source[p] for p in positions]
+            self._instances[model_class] = instances
+        return instances
+
+    def referenced_by(self, guid: str) -> List[Tuple[BaseModel, str]]:
+        """ Return ``(element, key)`` pairs for every element field referencing ``guid``
+
+        ``key`` is the serialized property name, e.g. ``usedDataset`` or ``evi:Schema``.
+        """
+        if self._referenced_by is None:
+            self._referenced_by = self._build_reverse_edges()
+        return self._referenced_by.get(extractGUID(guid), [])
+
+    def provenance(self) -> ProvenanceIndex:
+        """ Return the provenance adjacency of the graph, building it on first use
+        """
+        if self._provenance is None:
+            self._provenance = ProvenanceIndex(self.source)
+        return self._provenance
+
+    def _build_reverse_edges(self) -> Dict[str, List[Tuple[BaseModel, str]]]:
+        edges: Dict[str, List[Tuple[BaseModel, str]]] = {}
+        for entity in self.source:
+            for key, ref in iter_entity_references(entity):
+                edges.setdefault(extractGUID(ref), []).append((entity, key))
+        return edges
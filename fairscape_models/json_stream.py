@@ -0,0 +1,140 @@
+import codecs
+import json
+import re
+from typing import Any, IO, Iterator
+
+CHUNK_SIZE = 1 << 16
+# characters a single value may span before ValueTooLargeError is raised
+MAX_VALUE_SIZE = 1 << 26
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# longest token that fails to decode when cut short (-Infinity, a \uXXXX escape), so an
+# error this close to the end of the window may be fixed by reading more
+_TOKEN_SIZE = 10
+
+
+class ValueTooLargeError(ValueError):
+    """A JSON value spans more than ``max_value_size`` characters without being malformed so far."""
+
+
+def _may_continue(error: json.JSONDecodeError, window_size: int) -> bool:
+    """Whether more input could make the decoding that raised ``error`` succeed."""
+    return error.msg.startswith("Unterminated string") or error.pos >= window_size - _TOKEN_SIZE
+
+
+class _StreamBuffer:
+    """Sliding text window over a stream, decoding one JSON value at a time.
+
+    Only the value currently being decoded (plus one read chunk) is held in memory.
+    When a value runs past the end of the window the read size grows with the
+    window, so re-decoding a large value costs amortized linear time. Input that
+    cannot decode whatever follows it is reported as malformed right away; a value
+    that is still incomplete once it spans ``max_value_size`` characters raises
+    ``ValueTooLargeError`` instead of reading the rest of the stream.
+    """
+
+    def __init__(self, stream: IO, chunk_size: int, max_value_size: int = MAX_VALUE_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.max_value_size = max_value_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")() if isinstance(stream.read(0), bytes) else None
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read more input, dropping the consumed prefix. Return False at end of input."""
+        if self.eof:
+            return False
+        if self.pos:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        while True:
+            raw = self.stream.read(max(self.chunk_size, len(self.text)))
+            chunk = raw if self.decoder is None else self.decoder.decode(raw, final=not raw)
+            # a read ending inside a multi-byte character decodes to nothing yet
+            if chunk or not raw:
+                break
+        if not chunk:
+            self.eof = True
+            return False
+        self.text += chunk
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or '' at end of input."""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of input"
+            raise ValueError(f"Expected one of {chars!r} in JSON stream, found {found}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError as error:
+                if not _may_continue(error, len(self.text)):
+                    raise ValueError(f"Malformed JSON value: {error}") from error
+                if len(self.text) - self.pos > self.max_value_size:
+                    raise ValueTooLargeError(
+                        f"JSON value at character {self.pos} is longer than max_value_size ({self.max_value_size} characters)"
+                    ) from error
+                if self.fill():
+                    continue
+                raise
+            # a number near the end of the window may continue in the next chunk ("1.5" of "1.5e-3")
+            if end > len(self.text) - _TOKEN_SIZE and isinstance(obj, (int, float)) and self.fill():
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_json_array(stream: IO, key: str, chunk_size: int = CHUNK_SIZE, max_value_size: int = MAX_VALUE_SIZE) -> Iterator[Any]:
+    """Yield the items of the array stored under ``key`` in a top-level JSON object.
+
+    The stream is read incrementally, so memory stays bounded by the largest single
+    item rather than the document. Members before ``key`` are decoded and discarded,
+    members after it are never read.
+
+    :param stream: text or binary file object; binary input is decoded as UTF-8
+    :param key: name of the top-level member holding the array, e.g. ``"@graph"``
+    :param chunk_size: number of characters read from the stream at a time
+    :param max_value_size: characters a single value may span
+    :raises ValueTooLargeError: when a value spans more than ``max_value_size`` characters
+    :raises ValueError: on malformed JSON, or when ``key`` is missing or not an array
+    """
+    buffer = _StreamBuffer(stream, chunk_size, max_value_size)
+    buffer.expect("{")
+    if buffer.peek() == "}":
+        raise ValueError(f"JSON object has no {key!r} member")
+
+    while True:
+        name = buffer.value()
+        if not isinstance(name, str):
+            raise ValueError("Expected a member name in JSON object")
+        buffer.expect(":")
+
+        if name == key:
+            buffer.expect("[")
+            if buffer.peek() == "]":
+                return
+            while True:
+                yield buffer.value()
+                if buffer.expect(",]") == "]":
+                    return
+
+        buffer.value()
+        if buffer.expect(",}") == "}":
+            raise ValueError(f"JSON object has no {key!r} member")
@@ -0,0 +1,142 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from pydantic import BaseModel
+
+from fairscape_models.fairscape_base import IdentifierValue, extractGUID
+from fairscape_models.dataset import Dataset
+from fairscape_models.computation import Computation
+from fairscape_models.experiment import Experiment
+from fairscape_models.annotation import Annotation
+from fairscape_models.mlmodel import MLModel
+from fairscape_models.annotated_computation import AnnotatedComputation
+from fairscape_models.annotated_evidence_graph import AnnotatedEvidenceGraph
+
+PROVENANCE_TYPES = (
+    Dataset, Computation, Experiment, Annotation, MLModel,
+    AnnotatedComputation, AnnotatedEvidenceGraph,
+)
+
+# properties whose targets are inputs of (upstream from) the element holding them,
+# as (attribute name, serialized keys checked among extra fields)
+INPUT_PROPERTIES = (
+    ("usedDataset", ()),
+    ("usedSoftware", ()),
+    ("usedMLModel", ()),
+    ("used", ("prov:used",)),
+    ("generatedBy", ()),
+    ("wasGeneratedBy", ("prov:wasGeneratedBy",)),
+    ("derivedFrom", ()),
+    ("wasDerivedFrom", ("prov:wasDerivedFrom",)),
+    ("annotates", ("evi:annotates", "EVI:annotates")),
+)
+
+# properties whose targets are outputs of (downstream from) the element holding them
+OUTPUT_PROPERTIES = (
+    ("generated", ()),
+)
+
+
+def _property_values(entity: BaseModel, attribute: str, extra_keys: Iterable[str]) -> Iterator[Any]:
+    value = entity.__dict__.get(attribute)
+    if value is not None:
+        yield value
+    extra = entity.__pydantic_extra__
+    if extra:
+        for key in (attribute, *extra_keys):
+            if extra.get(key) is not None:
+                yield extra[key]
+
+
+def _reference_guids(value: Any) -> Iterator[str]:
+    for item in (value if isinstance(value, list) else [value]):
+        if isinstance(item, IdentifierValue):
+            ref = item.guid
+        elif isinstance(item, dict):
+            ref = item.get("@id")
+        else:
+            ref = item
+        if isinstance(ref, str) and ref:
+            yield extractGUID(ref)
+
+
+class ProvenanceIndex:
+    """ Upstream / downstream adjacency over the provenance properties of a crate
+
+    Built in a single pass over the ``Dataset``, ``Computation``, ``Experiment``,
+    ``Annotation`` and ``MLModel`` elements of a graph (plus the LLM annotation
+    documents, which carry ``evi:annotates``). An edge ``a -> b`` means ``a``
+    is upstream of ``b``: ``b`` used, was generated by, was derived from or annotates
+    ``a``, or ``b`` appears in ``a.generated``. Edges are deduplicated, so the PROV-O
+    mirrors of the EVI properties do not add weight. All guids are normalized with
+    ``extractGUID``.
+    """
+
+    def __init__(self, entities: Iterable[BaseModel]):
+        self._upstream: Dict[str, Dict[str, None]] = {}
+        self._downstream: Dict[str, Dict[str, None]] = {}
+
+        for entity in entities:
+            if not isinstance(entity, PROVENANCE_TYPES) or not isinstance(entity.guid, str):
+                continue
+            guid = extractGUID(entity.guid)
+            for attribute, extra_keys in INPUT_PROPERTIES:
+                for value in _property_values(entity, attribute, extra_keys):
+                    for ref in _reference_guids(value):
+                        self._add_edge(ref, guid)
+            for attribute, extra_keys in OUTPUT_PROPERTIES:
+                for value in _property_values(entity, attribute, extra_keys):
+                    for ref in _reference_guids(value):
+                        self._add_edge(guid, ref)
+
+    def _add_edge(self, source: str, target: str):
+        if source == target:
+            return
+        self._downstream.setdefault(source, {})[target] = None
+        self._upstream.setdefault(target, {})[source] = None
+
+    def parents(self, guid: str) -> List[str]:
+        """ Return the guids directly upstream of ``guid``
+        """
+        return list(self._upstream.get(extractGUID(guid), ()))
+
+    def children(self, guid: str) -> List[str]:
+        """ Return the guids directly downstream of ``guid``
+        """
+        return list(self._downstream.get(extractGUID(guid), ()))
+
+    def upstream(self, guid: str, depth: Optional[int] = None) -> List[str]:
+        """ Return everything ``guid`` was derived from, nearest first
+
+        :param guid: the element to start from; not included in the result
+        :param depth: number of hops to follow, unlimited when None
+        :return: guids in breadth-first order, each at most once
+        """
+        return self._traverse(self._upstream, guid, depth)
+
+    def downstream(self, guid: str, depth: Optional[int] = None) -> List[str]:
+        """ Return everything derived from ``guid``, nearest first
+
+        :param guid: the element to start from; not included in the result
+        :param depth: number of hops to follow, unlimited when None
+        :return: guids in breadth-first order, each at most once
+        """
+        return self._traverse(self._downstream, guid, depth)
+
+    @staticmethod
+    def _traverse(adjacency: Dict[str, Dict[str, None]], guid: str, depth: Optional[int]) -> List[str]:
+        start = extractGUID(guid)
+        seen = {start}
+        order: List[str] = []
+        frontier = [start]
+        hops = 0
+        # every edge is followed at most once; the seen set stops cycles
+        while frontier and (depth is None or hops < depth):
+            hops += 1
+            next_frontier = []
+            for node in frontier:
+                for neighbour in adjacency.get(node, ()):
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        order.append(neighbour)
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+        return order
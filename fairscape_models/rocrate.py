@@ -1,9 +1,17 @@
-import urllib.parse
-from typing import Any, Dict, List, Literal, Optional, Union
-import re
-from pydantic import BaseModel, Field, ConfigDict, model_validator
-
-from fairscape_models.fairscape_base import IdentifierValue, DEFAULT_CONTEXT
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import IO, Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Type, Union
+from pydantic import AliasChoices, BaseModel, Field, ConfigDict, Discriminator, PrivateAttr, Tag, TypeAdapter, ValidationError, model_validator
+from pydantic_core import PydanticCustomError, to_json
+from typing_extensions import Annotated, TypedDict
+
+from fairscape_models.fairscape_base import IdentifierValue, DEFAULT_CONTEXT, normalizeIdentifiers
+from fairscape_models.json_stream import MAX_VALUE_SIZE, iter_json_array
+from fairscape_models.graph_index import GraphIndex, GraphList, iter_entity_references
+from fairscape_models.provenance import ProvenanceIndex
 from fairscape_models.schema import Schema
 from fairscape_models.biochem_entity import BioChemEntity
 from fairscape_models.medical_condition import MedicalCondition
@@ -19,6 +27,7 @@ from fairscape_models.model_card import ModelCard
 from fairscape_models.sample import Sample
 from fairscape_models.activity import Activity
 from fairscape_models.digital_object import DigitalObject
+from fairscape_models.content_size import content_size_bytes, parse_content_size
 from fairscape_models.person import Person, Organization
 from fairscape_models.defined_term import DefinedTerm
 from fairscape_models._version import __version__
@@ -153,6 +162,8 @@ class ROCrateMetadataElem(BaseModel):
 
     # Content info
     contentSize: Optional[str] = Field(default=None, description="Total size of the dataset content (e.g. '2.4 GB', '150 MB'). Used in AI-Ready Characterization scoring.")
+    givenContentSizeBytes: Optional[int] = Field(default=None, alias="contentSizeBytes", exclude=True, description="contentSize in bytes; parsed from contentSize when not given or after contentSize changes. Not serialized.")
+    _contentSizeBytesOf: Optional[str] = PrivateAttr(default=None)
     usageInfo: Optional[str] = Field(default=None, description="Additional usage information or instructions for working with this dataset.")
     hasSummaryStatistics: Optional[Union[str, IdentifierValue]] = Field(default=None, description="Reference to a summary statistics entity describing distributions, counts, and key statistics for this dataset.")
     additionalProperty: Optional[List[Dict[str, Any]]] = Field(default=None, description="Additional schema.org PropertyValue entries for metadata not covered by other fields (e.g. [{\"name\": \"Human Subject\", \"value\": \"Yes\"}]).")
@@ -275,6 +286,23 @@ class ROCrateMetadataElem(BaseModel):
     informedConsent: Optional[str] = Field(alias="d4d:informedConsent", default=None, description="Details about informed consent procedures used in human subjects research — consent type, documentation, withdrawal mechanisms, and scope. (D4D_Human: InformedConsent)")
     atRiskPopulations: Optional[str] = Field(alias="d4d:atRiskPopulations", default=None, description="Information about protections for at-risk populations (e.g. children, pregnant women, prisoners, cognitively impaired individuals) included in human subjects research. (D4D_Human: AtRiskPopulations)")
 
+    @model_validator(mode="after")
+    def record_content_size_bytes(self):
+        self._contentSizeBytesOf = self.contentSize
+        return self
+
+    @property
+    def contentSizeBytes(self) -> Optional[int]:
+        """contentSize in bytes: the given byte count while contentSize is unchanged, else contentSize parsed."""
+        if self.givenContentSizeBytes is not None and self._contentSizeBytesOf == self.contentSize:
+            return self.givenContentSizeBytes
+        return parse_content_size(self.contentSize)
+
+    @contentSizeBytes.setter
+    def contentSizeBytes(self, size_bytes: Optional[int]):
+        self.givenContentSizeBytes = size_bytes
+        self._contentSizeBytesOf = self.contentSize
+
     def generateFileElem(self) -> ROCrateMetadataFileElem:
         """ Given an ROCrate Element create an appropriate ROCrateMetadataFileElem
         """
@@ -337,6 +365,286 @@ class ROCrateDistribution(BaseModel):
     archivedObjectPath: Optional[str] = Field(default=None)
 
 
+GRAPH_TYPE_MAP: Dict[str, Type[BaseModel]] = {
+    "Dataset": Dataset,
+    "Software": Software,
+    "MLModel": MLModel,
+    "Computation": Computation,
+    "Annotation": Annotation,
+    "Experiment": Experiment,
+    "Activity": Activity,
+    "CreativeWork": ROCrateMetadataFileElem,
+    "Schema": Schema,
+    "BioChemEntity": BioChemEntity,
+    "MedicalCondition": MedicalCondition,
+    "ROCrate": ROCrateMetadataElem,
+    "Person": Person,
+    "Organization": Organization,
+    "DefinedTerm": DefinedTerm,
+}
+
+
+# identifier reference fields rewritten by ``ROCrateV1_2.cleanIdentifiers``
+IDENTIFIER_FIELDS: Dict[Type[BaseModel], Tuple[str, ...]] = {
+    Dataset: ("usedByComputation", "derivedFrom", "generatedBy", "wasGeneratedBy", "wasDerivedFrom", "wasAttributedTo"),
+    Software: ("usedByComputation", "wasAttributedTo"),
+    MLModel: ("usedByComputation", "trainedOn", "wasAttributedTo"),
+    Computation: ("usedDataset", "generated", "usedSoftware", "usedMLModel", "used", "wasAssociatedWith"),
+    Annotation: ("usedDataset", "generated", "used", "wasAssociatedWith"),
+    Experiment: ("usedInstrument", "usedSample", "usedTreatment", "usedStain", "generated", "used", "wasAssociatedWith"),
+}
+
+
+def normalize_graph_type(type_str: str) -> str:
+    """ Strip an IRI or CURIE prefix from an ``@type`` value, e.g. ``https://w3id.org/EVI#Dataset`` -> ``Dataset``
+    """
+    if "#" in type_str:
+        return type_str.split("#")[-1]
+    if ":" in type_str:
+        return type_str.split(":")[-1]
+    return type_str
+
+
+class GraphTypeResolver:
+    """ Resolve the ``@type`` of a ``@graph`` element to the model class used to validate it
+
+    The last entry of a list ``@type`` wins. Resolutions are memoized per raw type string,
+    so a crate with many elements of the same type normalizes each distinct string once.
+    Anything not found in the type map resolves to ``default``.
+    """
+    __slots__ = ("type_map", "default", "_resolved")
+
+    def __init__(self, type_map: Dict[str, Type[BaseModel]], default: Type[BaseModel]):
+        self.type_map = type_map
+        self.default = default
+        self._resolved: Dict[str, Type[BaseModel]] = {}
+
+    def __call__(self, item_type: Any) -> Type[BaseModel]:
+        if isinstance(item_type, list):
+            item_type = item_type[-1] if item_type else None
+        if not isinstance(item_type, str):
+            return self.default
+        model_class = self._resolved.get(item_type)
+        if model_class is None:
+            model_class = self.type_map.get(normalize_graph_type(item_type), self.default)
+            self._resolved[item_type] = model_class
+        return model_class
+
+
+_GRAPH_TYPE_RESOLVERS: Dict[type, GraphTypeResolver] = {}
+_GRAPH_DOCUMENT_ADAPTERS: Dict[type, Tuple[Dict[str, Type[BaseModel]], TypeAdapter]] = {}
+
+
+def _repeatable_keys(model_class: Type[BaseModel]) -> Dict[str, str]:
+    """ Map every input key of the fields readable under several keys (name, alias, alias choices) to the field name
+
+    Only for models keeping extra properties: given a field under two of its keys, pydantic-core
+    keeps the unused one as an extra property when validating Python input but not JSON.
+    """
+    if model_class.model_config.get("extra") != "allow":
+        return {}
+    keys = {}
+    for name, field in model_class.model_fields.items():
+        alias = field.validation_alias or field.alias
+        choices = alias.choices if isinstance(alias, AliasChoices) else [alias]
+        field_keys = {name, *(choice for choice in choices if isinstance(choice, str))}
+        if len(field_keys) > 1:
+            keys.update(dict.fromkeys(field_keys, name))
+    return keys
+
+
+def _graph_document_adapter(crate_class: type) -> TypeAdapter:
+    """ Build the adapter validating a whole crate document from JSON, one per crate class
+
+    ``@graph`` is a list of a union tagged by the crate's ``GraphTypeResolver``, so every
+    element is parsed and validated by pydantic-core with the same ``@type`` dispatch as
+    ``validate_graph_element``.
+    """
+    type_map = crate_class.graphTypeMap
+    cached = _GRAPH_DOCUMENT_ADAPTERS.get(crate_class)
+    if cached is not None and cached[0] is type_map:
+        return cached[1]
+
+    resolver = crate_class.graph_type_resolver()
+    classes = list(dict.fromkeys([*type_map.values(), resolver.default]))
+    tags = {model_class: str(index) for index, model_class in enumerate(classes)}
+    repeatable = {model_class: _repeatable_keys(model_class) for model_class in classes}
+
+    def element_tag(item: Any) -> Optional[str]:
+        # elements matching no tag fail validation, the caller then hands the document to model_validate_graph
+        if not isinstance(item, dict) or "@type" not in item:
+            return None
+        model_class = resolver(item["@type"])
+        keys = repeatable[model_class]
+        if keys:
+            present = item.keys() & keys.keys()
+            if len({keys[key] for key in present}) < len(present):
+                return None
+        return tags[model_class]
+
+    element = Annotated[
+        Union[tuple(Annotated[model_class, Tag(tags[model_class])] for model_class in classes)],
+        Discriminator(element_tag)
+    ]
+    document = TypedDict("GraphDocument", {"@context": Optional[Dict], "@graph": List[element]}, total=False)
+    adapter = TypeAdapter(document)
+    _GRAPH_DOCUMENT_ADAPTERS[crate_class] = (type_map, adapter)
+    return adapter
+
+
+def _validate_graph_chunk(crate_class: type, start: int, items: List[Dict[str, Any]]) -> Tuple[List[BaseModel], List[Dict[str, Any]]]:
+    """ Validate a slice of ``@graph`` items, collecting errors located by their index in the full graph
+
+    Module level so it can be sent to a process pool.
+    """
+    validated = []
+    errors = []
+    for index, item in enumerate(items, start):
+        try:
+            validated.append(crate_class.validate_graph_element(item))
+        except ValidationError as error:
+            for detail in error.errors(include_url=False):
+                detail["loc"] = ("@graph", index, *detail["loc"])
+                errors.append(detail)
+        except ValueError as error:
+            errors.append({
+                "type": "value_error",
+                "loc": ("@graph", index),
+                "msg": f"Value error, {error}",
+                "input": item,
+                "ctx": {"error": error},
+            })
+    return validated, errors
+
+
+def _graph_validation_error(title: str, errors: List[Dict[str, Any]]) -> ValidationError:
+    line_errors = []
+    for detail in errors:
+        line_error = {"type": detail["type"], "loc": detail["loc"], "input": detail["input"]}
+        if "ctx" in detail:
+            line_error["ctx"] = detail["ctx"]
+        try:
+            ValidationError.from_exception_data(title, [line_error])
+        except (KeyError, TypeError):
+            # custom error types are not registered with pydantic-core, keep their message
+            line_error = {
+                "type": PydanticCustomError(detail["type"], "{message}", {"message": detail["msg"]}),
+                "loc": detail["loc"],
+                "input": detail["input"],
+            }
+        line_errors.append(line_error)
+    return ValidationError.from_exception_data(title, line_errors)
+
+
+
+def write_graph(
+    destination: Union[str, os.PathLike, IO],
+    elements: Iterable[BaseModel],
+    context: Optional[Dict] = DEFAULT_CONTEXT,
+    indent: Optional[int] = None,
+    **dump_kwargs: Any
+) -> None:
+    """ Write an ``ro-crate-metadata.json`` document, serializing one ``@graph`` element at a time
+
+    Each element is serialized with ``model_dump_json`` and written straight to the
+    destination, so memory use is bounded by the largest element rather than the crate.
+    The output matches ``ROCrateV1_2.model_dump_json`` for the same context and elements.
+
+    :param destination: path, or an open text or binary file object (e.g. a socket file)
+    :param elements: the ``@graph`` elements, any iterable of models including a generator
+    :param context: the ``@context`` value; omitted from the output when None
+    :param indent: indentation as in ``model_dump_json``, compact output when None
+    :param dump_kwargs: passed to each element's ``model_dump_json``; ``by_alias`` defaults to True
+    """
+    head = {} if context is None else {"@context": context}
+    _write_document(destination, head, elements, indent, **dump_kwargs)
+
+
+def _write_document(
+    destination: Union[str, os.PathLike, IO],
+    head: Dict[str, Any],
+    elements: Iterable[BaseModel],
+    indent: Optional[int] = None,
+    **dump_kwargs: Any
+) -> None:
+    """ Write the members of ``head``, then the ``@graph`` of ``elements``; see ``write_graph`` """
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, "wb") as stream:
+            _write_document(stream, head, elements, indent, **dump_kwargs)
+        return
+
+    if isinstance(destination, io.TextIOBase):
+        write = destination.write
+    else:
+        write = lambda text: destination.write(text.encode("utf-8"))
+    dump_kwargs.setdefault("by_alias", True)
+
+    if indent is None:
+        write("{")
+        for key, value in head.items():
+            write(to_json(key).decode("utf-8") + ":" + to_json(value).decode("utf-8") + ",")
+        write('"@graph":[')
+        for position, element in enumerate(elements):
+            write(("," if position else "") + element.model_dump_json(**dump_kwargs))
+        write("]}")
+        return
+
+    # nest the indented output of every value one or two levels below the document
+    member = "\n" + " " * indent
+    item = member + " " * indent
+    write("{")
+    for key, value in head.items():
+        write(member + to_json(key).decode("utf-8") + ": " + to_json(value, indent=indent).decode("utf-8").replace("\n", member) + ",")
+    write(member + '"@graph": [')
+    position = -1
+    for position, element in enumerate(elements):
+        write(("," if position else "") + item + element.model_dump_json(indent=indent, **dump_kwargs).replace("\n", item))
+    write((member if position >= 0 else "") + "]\n}")
+
+
+def _checksum(value: Any) -> Optional[str]:
+    # several checksums are joined with commas so every column holds scalars
+    return ",".join(value) if isinstance(value, list) else value
+
+
+# column name -> function of (element, graph index) giving the element's value
+COLUMNS: Dict[str, Callable[[BaseModel, GraphIndex], Any]] = {
+    "guid": lambda entity, index: getattr(entity, "guid", None),
+    "type": lambda entity, index: type(entity).__name__,
+    "name": lambda entity, index: getattr(entity, "name", None),
+    "fileFormat": lambda entity, index: getattr(entity, "fileFormat", None),
+    "contentSize": lambda entity, index: content_size_bytes(entity),
+    "md5": lambda entity, index: _checksum(getattr(entity, "md5", None)),
+    "sha256": lambda entity, index: _checksum(getattr(entity, "sha256", None)),
+    "datePublished": lambda entity, index: getattr(entity, "datePublished", None),
+    "references": lambda entity, index: sum(1 for _ in iter_entity_references(entity)),
+    "referencedBy": lambda entity, index: len(index.referenced_by(entity.guid)) if isinstance(getattr(entity, "guid", None), str) else 0,
+}
+
+# numpy dtypes of the numeric columns; the others are object arrays
+_NUMPY_DTYPES = {"contentSize": "float64", "references": "int64", "referencedBy": "int64"}
+
+
+def _column_array(name: str, values: List[Any], array: str) -> Any:
+    if array == "list":
+        return values
+    if array == "numpy":
+        import numpy
+        if name == "contentSize":
+            # missing sizes become NaN
+            values = [float("nan") if value is None else value for value in values]
+        return numpy.array(values, dtype=_NUMPY_DTYPES.get(name, object))
+    if array == "arrow":
+        import pyarrow
+        return pyarrow.array(values)
+    raise ValueError(f"Unknown array type {array!r}, expected 'list', 'numpy' or 'arrow'")
+
+
+def _private_state(crate: BaseModel) -> Dict[str, Any]:
+    # the graph index is a cache: two crates with the same graph are equal whether or not it was built
+    return {name: value for name, value in (crate.__pydantic_private__ or {}).items() if name != "_graph_index"}
+
+
 class ROCrateV1_2(BaseModel):
     context: Optional[Dict] = Field(alias="@context", default=DEFAULT_CONTEXT)
     metadataGraph: List[Union[
@@ -363,183 +671,323 @@ class ROCrateV1_2(BaseModel):
         DefinedTerm,
         GenericMetadataElem
     ]] = Field(alias="@graph")
-    
+    _graph_index: Optional[GraphIndex] = PrivateAttr(default=None)
+
+    graphTypeMap: ClassVar[Dict[str, Type[BaseModel]]] = GRAPH_TYPE_MAP
+
+    @classmethod
+    def graph_type_resolver(cls) -> "GraphTypeResolver":
+        """ Return the memoizing ``@type`` resolver for this crate class, built once per class
+        """
+        resolver = _GRAPH_TYPE_RESOLVERS.get(cls)
+        if resolver is None or resolver.type_map is not cls.graphTypeMap:
+            resolver = GraphTypeResolver(cls.graphTypeMap, GenericMetadataElem)
+            _GRAPH_TYPE_RESOLVERS[cls] = resolver
+        return resolver
+
+    @classmethod
+    def validate_graph_element(cls, item: Dict[str, Any]) -> BaseModel:
+        """ Validate a single ``@graph`` element with the model class its ``@type`` dispatches to
+        """
+        if "@type" not in item:
+            raise ValueError("Metadata element must have @type field")
+        return cls.graph_type_resolver()(item["@type"]).model_validate(item)
+
     @model_validator(mode="before")
     @classmethod
     def validate_metadata_graph(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         if "@graph" not in values:
             return values
-        
-        type_map = {
-            "Dataset": Dataset,
-            "Software": Software,
-            "MLModel": MLModel,
-            "Computation": Computation,
-            "Annotation": Annotation,
-            "Experiment": Experiment,
-            "Activity": Activity,
-            "CreativeWork": ROCrateMetadataFileElem,
-            "Schema": Schema,
-            "BioChemEntity": BioChemEntity,
-            "MedicalCondition": MedicalCondition,
-            "ROCrate": ROCrateMetadataElem,
-            "Person": Person,
-            "Organization": Organization,
-            "DefinedTerm": DefinedTerm,
-        }
-        
-        def normalize_type(type_str):
-            if "#" in type_str:
-                return type_str.split("#")[-1]
-            if ":" in type_str:
-                return type_str.split(":")[-1]
-            return type_str
-        
+
         new_graph = []
         for item in values["@graph"]:
             if not isinstance(item, dict):
                 new_graph.append(item)
                 continue
-                
-            if "@type" not in item:
-                raise ValueError("Metadata element must have @type field")
-                
-            item_type = item["@type"]
-            
-            if isinstance(item_type, list):
-                item_type = item_type[-1]
-            
-            if isinstance(item_type, str):
-                normalized_type = normalize_type(item_type)
-                model_class_to_use = type_map.get(normalized_type)
-
-            # If we found a specific class, use it.
-            if model_class_to_use:
-                new_graph.append(model_class_to_use.model_validate(item))
-            # Only if no specific class was matched, use the generic one.
-            else:
-                new_graph.append(GenericMetadataElem.model_validate(item))
-        
+            new_graph.append(cls.validate_graph_element(item))
+
         values["@graph"] = new_graph
         return values
 
-    def cleanIdentifiers(self):
-        """ Clean metadata guid property from full urls to ark:{NAAN}/{postfix}
+    @model_validator(mode="after")
+    def track_metadata_graph(self):
+        """ Store the graph as a GraphList so the lazily built index notices mutations
         """
+        if not isinstance(self.metadataGraph, GraphList):
+            self.metadataGraph = GraphList(self.metadataGraph)
+        return self
 
-        def cleanGUID(metadata):
-            """ Clean metadata guid property from full urls to ark:{NAAN}/{postfix}
-            """
-            # TODO should be removed 
-
-            if hasattr(metadata, 'guid') and isinstance(metadata.guid, str) and "http" in metadata.guid:
-                # old metadata parsing
-                #metadata.guid = urllib.parse.urlparse(metadata.guid).path.lstrip('/')
-
-                # find ark:NAAN within string
-                try:
-                    match = re.search(
-                        pattern="ark:[0-9]{5}/.+$",
-                        string=metadata.guid
-                    )
-                    metadata.guid = match.group()
-                except AttributeError:
-                    # TODO warm about missing ark in guid
-                    pass
-
-
-        def cleanIdentifierList(identifier_list):
-            """Helper to clean a list of identifiers"""
-            if identifier_list is None:
-                return
-            for item in identifier_list:
-                if hasattr(item, 'guid') and isinstance(item.guid, str) and "ark:" in item.guid:
-                    cleanGUID(item)
-
-        def cleanIdentifierUnion(identifier_union):
-            """Helper to clean a Union[IdentifierValue, List[IdentifierValue]] field"""
-            if identifier_union is None:
-                return
-            if isinstance(identifier_union, list):
-                cleanIdentifierList(identifier_union)
-            elif hasattr(identifier_union, 'guid') and isinstance(identifier_union.guid, str) and "ark:" in identifier_union.guid:
-                cleanGUID(identifier_union)
-
-        #clean ROCrate metadata identifier
-        rocrateMetadata = self.getCrateMetadata()
-        cleanGUID(rocrateMetadata)
+    def __setattr__(self, name: str, value: Any):
+        # a plain list would make every index lookup compare the whole graph against a snapshot
+        if name == "metadataGraph" and isinstance(value, list) and not isinstance(value, GraphList):
+            value = GraphList(value)
+        super().__setattr__(name, value)
 
-        for elem in self.getEVIElements():
+    @classmethod
+    def model_construct(cls, _fields_set: Optional[set] = None, **values: Any) -> "ROCrateV1_2":
+        """ Build a crate without validation, as pydantic does, storing the graph as a GraphList
+        """
+        crate = super().model_construct(_fields_set, **values)
+        graph = crate.__dict__.get("metadataGraph")
+        if isinstance(graph, list) and not isinstance(graph, GraphList):
+            crate.__dict__["metadataGraph"] = GraphList(graph)
+        return crate
 
-            if "ark:" in elem.guid:  
-                cleanGUID(elem)
+    @classmethod
+    def model_validate_graph(cls, data: Dict[str, Any]) -> "ROCrateV1_2":
+        """ Validate a crate dict building every ``@graph`` element exactly once
+
+        Each element is dispatched on its ``@type`` by the cached resolver and validated
+        by that class only; the crate itself is then assembled without passing the
+        elements through the ``metadataGraph`` union again. Input the fast path does not
+        handle (missing ``@graph``, non dict elements, a malformed ``@context``) falls back
+        to ``model_validate`` so the reported errors are unchanged.
+
+        :param data: parsed ``ro-crate-metadata.json`` content
+        :return: the validated crate
+        :rtype fairscape_models.rocrate.ROCrateV1_2
+        """
+        if not isinstance(data, dict):
+            return cls.model_validate(data)
+        graph = data.get("@graph")
+        context = data.get("@context")
+        if (
+            not isinstance(graph, list)
+            or not (context is None or isinstance(context, dict))
+            or not all(isinstance(item, dict) for item in graph)
+        ):
+            return cls.model_validate(data)
+
+        return cls._from_validated_graph(data, [cls.validate_graph_element(item) for item in graph])
 
-            if isinstance(elem, Dataset):
+    @classmethod
+    def model_validate_graph_json(cls, json_data: Union[str, bytes]) -> "ROCrateV1_2":
+        """ Validate a serialized crate, parsing the JSON and building every ``@graph`` element in pydantic-core
+
+        The fast path for reloading ``ro-crate-metadata.json`` files, e.g. those written by
+        ``write``. Elements are dispatched on ``@type`` exactly as in ``model_validate_graph``
+        and fully validated, without ``json.loads`` building the document first. When the
+        document does not validate it is parsed and validated again by ``model_validate_graph``,
+        so errors are reported the same way. So are documents with an element giving a field
+        under several of its keys (e.g. both ``@type`` and ``metadataType``), which pydantic-core
+        would otherwise not keep as an extra property.
+
+        :param json_data: content of an ``ro-crate-metadata.json`` file
+        :return: the validated crate
+        :rtype fairscape_models.rocrate.ROCrateV1_2
+        """
+        try:
+            document = _graph_document_adapter(cls).validate_json(json_data)
+        except ValidationError:
+            return cls.model_validate_graph(json.loads(json_data))
+        if "@graph" not in document:
+            return cls.model_validate_graph(json.loads(json_data))
+        return cls._from_validated_graph(document, document["@graph"])
 
-                cleanIdentifierList(elem.usedByComputation)
+    @classmethod
+    def model_validate_parallel(
+        cls,
+        data: Dict[str, Any],
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None
+    ) -> "ROCrateV1_2":
+        """ Validate the ``@graph`` elements of a crate dict across a process pool
+
+        Items are split into contiguous chunks, validated in worker processes with the
+        same ``@type`` dispatch as ``validate_metadata_graph`` and reassembled in their
+        original order. Errors from all chunks are collected into one ``ValidationError``
+        whose locations start with ``("@graph", index)``. Input the fast path does not
+        handle falls back to ``model_validate`` as in ``model_validate_graph``.
+
+        Worth it for graphs of many thousands of elements; each element and its model
+        are pickled between processes. The crate class must be importable by the workers.
+
+        :param data: parsed ``ro-crate-metadata.json`` content
+        :param workers: number of processes, ``os.cpu_count()`` when None; 1 validates in process
+        :param chunk_size: elements per task, by default about four tasks per worker
+        :return: the validated crate
+        :rtype fairscape_models.rocrate.ROCrateV1_2
+        """
+        if not isinstance(data, dict):
+            return cls.model_validate(data)
+        graph = data.get("@graph")
+        context = data.get("@context")
+        if (
+            not isinstance(graph, list)
+            or not (context is None or isinstance(context, dict))
+            or not all(isinstance(item, dict) for item in graph)
+        ):
+            return cls.model_validate(data)
+
+        workers = workers or os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = max(1, -(-len(graph) // (workers * 4)))
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        starts = range(0, len(graph), chunk_size)
+        chunks = [graph[start:start + chunk_size] for start in starts]
+        if workers <= 1 or len(chunks) <= 1:
+            results = list(map(_validate_graph_chunk, repeat(cls), starts, chunks))
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+                results = list(executor.map(_validate_graph_chunk, repeat(cls), starts, chunks))
+
+        validated = []
+        errors = []
+        for chunk_validated, chunk_errors in results:
+            validated.extend(chunk_validated)
+            errors.extend(chunk_errors)
+        if errors:
+            raise _graph_validation_error(cls.__name__, errors)
+        return cls._from_validated_graph(data, validated)
 
-                cleanIdentifierList(elem.derivedFrom)
+    @classmethod
+    def iter_entities(cls, source: Union[str, os.PathLike, IO], max_value_size: int = MAX_VALUE_SIZE) -> Iterator[BaseModel]:
+        """ Stream the ``@graph`` of an ``ro-crate-metadata.json``, yielding validated elements one at a time
 
-                cleanIdentifierUnion(elem.generatedBy)
+        The file is parsed incrementally, so memory use is bounded by the largest single
+        element instead of the whole crate. Elements are dispatched exactly as in
+        ``validate_metadata_graph``; a validation error stops the iteration at the
+        offending element.
 
-                # Clean PROV fields
-                cleanIdentifierList(elem.wasGeneratedBy)
-                cleanIdentifierList(elem.wasDerivedFrom)
-                cleanIdentifierList(elem.wasAttributedTo)
+        :param source: path to the metadata file, or an open text or binary file object
+        :param max_value_size: characters a single element may span, see ``fairscape_models.json_stream.iter_json_array``
+        :return: iterator over ``Dataset``, ``Software``, ``Computation``, ... instances
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as stream:
+                yield from cls.iter_entities(stream, max_value_size)
+            return
 
-            if isinstance(elem, Software):
-                cleanIdentifierList(elem.usedByComputation)
+        for item in iter_json_array(source, "@graph", max_value_size=max_value_size):
+            if not isinstance(item, dict):
+                raise ValueError("Metadata element must be a JSON object")
+            yield cls.validate_graph_element(item)
 
-                # Clean PROV fields
-                cleanIdentifierList(elem.wasAttributedTo)
+    @classmethod
+    def _from_validated_graph(cls, data: Dict[str, Any], graph: List[BaseModel]) -> "ROCrateV1_2":
+        values = {"metadataGraph": GraphList(graph)}
+        if "@context" in data:
+            values["context"] = data["@context"]
+        return cls.model_construct(**values)
 
-            if isinstance(elem, MLModel):
-                cleanIdentifierList(elem.usedByComputation)
+    def write(self, destination: Union[str, os.PathLike, IO], indent: Optional[int] = None, **dump_kwargs: Any):
+        """ Serialize the crate as JSON to a path or file object, one ``@graph`` element at a time
 
-                cleanIdentifierList(elem.trainedOn)
+        Produces the same document as ``model_dump_json(by_alias=True)`` without building it
+        in memory first; see ``fairscape_models.rocrate.write_graph``.
 
-                # Clean PROV fields
-                cleanIdentifierList(elem.wasAttributedTo)
+        :param self
+        :param destination: path, or an open text or binary file object
+        :param indent: indentation as in ``model_dump_json``, compact output when None
+        :param dump_kwargs: serialization options such as ``exclude_none``, applied to every element
+        """
+        dump_kwargs.setdefault("by_alias", True)
+        exclusions = {
+            key: dump_kwargs[key] for key in ("exclude_unset", "exclude_defaults", "exclude_none") if key in dump_kwargs
+        }
+        # whether and how @context appears, null included, follows the crate's own serializer
+        head = self.model_dump(include={"context"}, by_alias=True, mode="json", **exclusions)
+        _write_document(destination, head, self.metadataGraph, indent, **dump_kwargs)
 
-            if isinstance(elem, Computation):
+    def cleanIdentifiers(self):
+        """ Clean metadata guid property from full urls to ark:{NAAN}/{postfix}
 
-                cleanIdentifierList(elem.usedDataset)
+        Rewrites the guid of the crate metadata element and of every EVI element, along with
+        the identifier references listed for its class in ``IDENTIFIER_FIELDS``
+        (``usedDataset``, ``generatedBy``, ``prov:used``, ...). Other nested models, such as
+        authors or ``hasPart`` entries, keep their identifiers.
+        """
+        # raises when the crate has no metadata element describing it
+        rocrateMetadata = self.getCrateMetadata()
 
-                cleanIdentifierList(elem.generated)
+        normalizeIdentifiers([rocrateMetadata], {})
+        normalizeIdentifiers(self.getEVIElements(), IDENTIFIER_FIELDS)
 
-                cleanIdentifierList(elem.usedSoftware)
+        # guids were rewritten in place
+        self.invalidateIndex()
 
-                cleanIdentifierList(elem.usedMLModel)
+    def __eq__(self, other: Any) -> bool:
+        """ Compare crates as pydantic does, leaving out the lazily built graph index
+        """
+        if not isinstance(other, ROCrateV1_2):
+            return super().__eq__(other)
+        return (
+            type(self) is type(other)
+            and self.__dict__ == other.__dict__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+            and _private_state(self) == _private_state(other)
+        )
+
+    def getGraphIndex(self) -> GraphIndex:
+        """ Return the lookup index over the metadata graph, building it on first use
 
-                # Clean PROV fields
-                cleanIdentifierList(elem.used)
-                cleanIdentifierList(elem.wasAssociatedWith)
+        The index is rebuilt automatically after the ``metadataGraph`` list is mutated
+        or replaced. Call ``invalidateIndex`` after editing an element in place.
 
-            if isinstance(elem, Annotation):
+        :param self
+        :return: index of the metadata graph by guid, type and reverse references
+        :rtype fairscape_models.graph_index.GraphIndex
+        """
+        index = self._graph_index
+        if index is None or not index.matches(self.metadataGraph):
+            index = GraphIndex(self.metadataGraph)
+            self._graph_index = index
+        return index
+
+    def invalidateIndex(self):
+        """ Discard the metadata graph index, e.g. after changing an element's guid in place
+        """
+        self._graph_index = None
 
-                cleanIdentifierList(elem.usedDataset)
+    def getEntity(self, guid: str) -> Optional[BaseModel]:
+        """ Look up a metadata graph element by its guid
 
-                cleanIdentifierList(elem.generated)
+        :param self
+        :param guid: the ``@id`` of the element
+        :return: the first element with that guid, or None
+        """
+        return self.getGraphIndex().get(guid)
 
-                # Clean PROV fields
-                cleanIdentifierList(elem.used)
-                cleanIdentifierList(elem.wasAssociatedWith)
+    def getEntitiesByType(self, model_class: Type[BaseModel]) -> List[BaseModel]:
+        """ Filter the Metadata Graph for instances of a model class, in graph order
 
-            if isinstance(elem, Experiment):
+        :param self
+        :param model_class: e.g. ``Dataset``; subclasses are included
+        :return: all matching metadata records within the ROCrate
+        """
+        return list(self.getGraphIndex().instances_of(model_class))
 
-                cleanIdentifierList(elem.usedInstrument)
+    def getReferencingEntities(self, guid: str) -> List[BaseModel]:
+        """ Query the metadata graph for elements holding a reference to ``guid``
 
-                cleanIdentifierList(elem.usedSample)
+        References given as full URLs are matched against the bare ARK. Use
+        ``getGraphIndex().referenced_by`` to also get the referencing property.
 
-                cleanIdentifierList(elem.usedTreatment)
+        :param self
+        :param guid: the ``@id`` being referenced
+        :return: referencing metadata records, in graph order, without duplicates
+        """
+        referencing = []
+        seen = set()
+        for entity, _ in self.getGraphIndex().referenced_by(guid):
+            if id(entity) not in seen:
+                seen.add(id(entity))
+                referencing.append(entity)
+        return referencing
 
-                cleanIdentifierList(elem.usedStain)
+    def getProvenanceIndex(self) -> ProvenanceIndex:
+        """ Return the provenance adjacency over the metadata graph, building it on first use
 
-                cleanIdentifierList(elem.generated)
+        Shares the lifetime of ``getGraphIndex``: it is rebuilt after the graph list is
+        mutated, or after ``invalidateIndex``.
 
-                # Clean PROV fields
-                cleanIdentifierList(elem.used)
-                cleanIdentifierList(elem.wasAssociatedWith)
+        :param self
+        :return: index answering ``upstream`` / ``downstream`` lineage queries by guid
+        :rtype fairscape_models.provenance.ProvenanceIndex
+        """
+        return self.getGraphIndex().provenance()
 
     def getCrateMetadata(self)-> ROCrateMetadataElem:
         """ Filter the Metadata Graph for the Metadata Element Describing the Toplevel ROCrate
@@ -548,10 +996,7 @@ class ROCrateV1_2(BaseModel):
         :return: The RO Crate Metadata Elem describing the toplevel ROCrate
         :rtype fairscape_mds.models.rocrate.ROCrateMetadataElem
         """
-        filterResults = list(filter(
-            lambda x: isinstance(x, ROCrateMetadataElem),
-            self.metadataGraph
-        ))
+        filterResults = self.getGraphIndex().instances_of(ROCrateMetadataElem)
 
         # TODO support for nested crates 
         # must find the ROCrateMetadataElem with '@id' == 'ro-crate-metadata.json'
@@ -563,12 +1008,7 @@ class ROCrateV1_2(BaseModel):
 
     def getSchemas(self) -> List[Schema]:
         # TODO filter schemas
-        filterResults = list(filter(
-            lambda x: isinstance(x, Schema), 
-            self.metadataGraph
-        ))
-
-        return filterResults
+        return self.getEntitiesByType(Schema)
 
     def getDatasets(self) -> List[Dataset]:
         """ Filter the Metadata Graph for Dataset Elements
@@ -577,12 +1017,7 @@ class ROCrateV1_2(BaseModel):
         :return: All dataset metadata records within the ROCrate
         :rtype List[fairscape_mds.models.rocrate.Dataset]
         """
-        filterResults = list(filter(
-            lambda x: isinstance(x, Dataset) and not isinstance(x, ROCrateMetadataElem), 
-            self.metadataGraph
-        ))
-
-        return filterResults
+        return self.getEntitiesByType(Dataset)
 
 
     def getSoftware(self) -> List[Software]:
@@ -592,12 +1027,7 @@ class ROCrateV1_2(BaseModel):
         :return: All Software metadata records within the ROCrate
         :rtype List[fairscape_mds.models.rocrate.Software]
         """
-        filterResults = list(filter(
-            lambda x: isinstance(x, Software), 
-            self.metadataGraph
-        ))
-
-        return filterResults
+        return self.getEntitiesByType(Software)
 
 
     def getComputations(self) -> List[Computation]:
@@ -607,12 +1037,7 @@ class ROCrateV1_2(BaseModel):
         :return: All Computation metadata records within the ROCrate
         :rtype List[fairscape_mds.models.rocrate.Computation]
         """
-        filterResults = list(filter(
-            lambda x: isinstance(x, Computation),
-            self.metadataGraph
-        ))
-
-        return filterResults
+        return self.getEntitiesByType(Computation)
 
     def getAnnotations(self) -> List[Annotation]:
         """ Filter the Metadata Graph for Annotation Elements
@@ -621,12 +1046,7 @@ class ROCrateV1_2(BaseModel):
         :return: All Annotation metadata records within the ROCrate
         :rtype List[fairscape_mds.models.rocrate.Annotation]
         """
-        filterResults = list(filter(
-            lambda x: isinstance(x, Annotation),
-            self.metadataGraph
-        ))
-
-        return filterResults
+        return self.getEntitiesByType(Annotation)
 
     def getExperiments(self) -> List[Experiment]:
         """ Filter the Metadata Graph for Experiment Elements
@@ -635,12 +1055,7 @@ class ROCrateV1_2(BaseModel):
         :return: All Experiment metadata records within the ROCrate
         :rtype List[fairscape_mds.models.rocrate.Experiment]
         """
-        filterResults = list(filter(
-            lambda x: isinstance(x, Experiment),
-            self.metadataGraph
-        ))
-
-        return filterResults
+        return self.getEntitiesByType(Experiment)
 
     def getMLModels(self) -> List[MLModel]:
         """ Filter the Metadata Graph for MLModel Elements
@@ -649,12 +1064,7 @@ class ROCrateV1_2(BaseModel):
         :return: All MLModel metadata records within the ROCrate
         :rtype List[fairscape_mds.models.rocrate.MLModel]
         """
-        filterResults = list(filter(
-            lambda x: isinstance(x, MLModel),
-            self.metadataGraph
-        ))
-
-        return filterResults
+        return self.getEntitiesByType(MLModel)
 
 
     def getBioChemEntities(self) -> List[BioChemEntity]:
@@ -664,12 +1074,7 @@ class ROCrateV1_2(BaseModel):
         :return: All BioChemEntity metadata records within the ROCrate
         :rtype List[fairscape_mds.models.rocrate.BioChemEntity]
         """
-        filterResults = list(filter(
-            lambda x: isinstance(x, BioChemEntity), 
-            self.metadataGraph
-        ))
-
-        return filterResults
+        return self.getEntitiesByType(BioChemEntity)
 
 
     def getMedicalConditions(self) -> List[MedicalCondition]:
@@ -679,12 +1084,7 @@ class ROCrateV1_2(BaseModel):
         :return: All MedicalCondition metadata records within the ROCrate
         :rtype List[fairscape_mds.models.rocrate.MedicalCondition]
         """
-        filterResults = list(filter(
-            lambda x: isinstance(x, MedicalCondition), 
-            self.metadataGraph
-        ))
-
-        return filterResults
+        return self.getEntitiesByType(MedicalCondition)
 
 
     def getEVIElements(self) -> List[Union[
@@ -700,6 +1100,44 @@ class ROCrateV1_2(BaseModel):
         ]]:
         """ Query the metadata graph for elements which require minting identifiers
         """
-        return (self.getDatasets() + self.getSoftware() + self.getMLModels() +
-                self.getComputations() + self.getAnnotations() + self.getExperiments() +
-                self.getSchemas())
+        index = self.getGraphIndex()
+        elements = []
+        for model_class in (Dataset, Software, MLModel, Computation, Annotation, Experiment, Schema):
+            elements.extend(index.instances_of(model_class))
+        return elements
+
+    def to_columns(
+        self,
+        types: Optional[Iterable[Type[BaseModel]]] = None,
+        fields: Optional[Iterable[str]] = None,
+        array: str = "list",
+    ) -> Dict[str, Any]:
+        """ Export the metadata graph as columns, one row per element in graph order
+
+        Columns are ``guid``, ``type`` (the model class name), ``name``, ``fileFormat``,
+        ``contentSize`` (parsed to bytes), ``md5``, ``sha256``, ``datePublished``,
+        ``references`` (identifier references the element holds) and ``referencedBy``
+        (references to the element from the graph). Values an element lacks are None.
+
+        :param self
+        :param types: model classes to include, e.g. ``[Dataset, Software]``; subclasses are included, all elements when None
+        :param fields: columns to export, all of ``COLUMNS`` when None
+        :param array: ``"list"``, ``"numpy"`` or ``"arrow"``; the last two need numpy or pyarrow installed
+        :return: column arrays by column name
+        """
+        names = list(COLUMNS) if fields is None else list(fields)
+        unknown = [name for name in names if name not in COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown columns {unknown}, expected any of {list(COLUMNS)}")
+
+        index = self.getGraphIndex()
+        if types is None:
+            entities = list(self.metadataGraph)
+        else:
+            types = tuple(types)
+            entities = [entity for entity in self.metadataGraph if isinstance(entity, types)]
+
+        return {
+            name: _column_array(name, [COLUMNS[name](entity, index) for entity in entities], array)
+            for name in names
+        }
@@ -0,0 +1,65 @@
+from typing import Any, Dict, FrozenSet, Iterable, Tuple, Type
+from pydantic import BaseModel
+
+
+class DumpPlan:
+    """ Fields of one model class to serialize for a fixed set of output keys
+
+    ``keys`` are the keys of ``model_dump(by_alias=True)``: serialization aliases such as
+    ``@id`` or ``evi:Schema`` for declared fields, and the raw key for extra properties.
+    """
+    __slots__ = ("fields", "extra_keys", "needs_filter")
+
+    def __init__(self, model_class: Type[BaseModel], keys: FrozenSet[str]):
+        serialized = {
+            name: field.serialization_alias or field.alias or name
+            for name, field in model_class.model_fields.items()
+        }
+        # a plain set: pydantic-core converts any other include container on every call
+        self.fields = {name for name, key in serialized.items() if key in keys}
+        self.extra_keys = keys.difference(serialized.values())
+        # an extra key equal to a field name selects that field too, whose output key may differ
+        self.needs_filter = bool(self.extra_keys.intersection(serialized))
+
+
+_DUMP_PLANS: Dict[Tuple[type, FrozenSet[str]], DumpPlan] = {}
+
+
+def dump_plan(model_class: Type[BaseModel], keys: Iterable[str]) -> DumpPlan:
+    """ Return the cached ``DumpPlan`` of ``model_class`` for ``keys``
+    """
+    keys = keys if isinstance(keys, frozenset) else frozenset(keys)
+    plan = _DUMP_PLANS.get((model_class, keys))
+    if plan is None:
+        plan = DumpPlan(model_class, keys)
+        _DUMP_PLANS[(model_class, keys)] = plan
+    return plan
+
+
+def dump_subset(model: BaseModel, keys: Iterable[str], **dump_kwargs: Any) -> Dict[str, Any]:
+    """ Serialize only the given keys of a model
+
+    Equivalent to ``{k: v for k, v in model.model_dump(by_alias=True).items() if k in keys}``,
+    but fields that are not requested are never serialized. Converters reading a handful of
+    properties of ``ROCrateMetadataElem`` skip its dozens of optional ``rai:`` / ``evi:`` /
+    ``d4d:`` fields this way. Pass ``keys`` as a ``frozenset`` to reuse the cached plan
+    without rebuilding the key set.
+
+    :param model: the model to serialize
+    :param keys: serialized keys to keep, e.g. ``{"@id", "name", "contentUrl"}``
+    :param dump_kwargs: further ``model_dump`` options, e.g. ``exclude_none``
+    :return: the selected part of ``model.model_dump(by_alias=True)``
+    """
+    keys = keys if isinstance(keys, frozenset) else frozenset(keys)
+    plan = dump_plan(type(model), keys)
+    include = plan.fields
+    extra = model.__pydantic_extra__
+    if extra and plan.extra_keys:
+        include = include.union([key for key in plan.extra_keys if key in extra])
+    if not include:
+        return {}
+    dumped = model.model_dump(by_alias=True, include=include, **dump_kwargs)
+    # include matches extra properties by key, which may shadow a selected field's name
+    if plan.needs_filter or (extra and not plan.fields.isdisjoint(extra)):
+        dumped = {key: value for key, value in dumped.items() if key in keys}
+    return dumped
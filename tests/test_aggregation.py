@@ -0,0 +1,74 @@
+import json
+import pathlib
+
+import pytest
+
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.conversion.aggregation import aggregate_release, write_release_aggregates
+from fairscape_models.conversion.mapping.AIReady import score_rocrate, score_rocrate_with_errors, root_guid
+from fairscape_models.conversion.subcrate_loader import SubcrateLoader
+
+TEST_ROCRATES_PATH = pathlib.Path(__file__).parent / "test_rocrates"
+RELEASE = TEST_ROCRATES_PATH / "release" / "ro-crate-metadata.json"
+SUBCRATE = TEST_ROCRATES_PATH / "LakeDB" / "ro-crate-metadata.json"
+
+
+@pytest.fixture
+def release(tmp_path, monkeypatch):
+    """The release fixture without roll-ups, its first two sub-crates in tmp_path."""
+    data = json.loads(RELEASE.read_text(encoding="utf-8"))
+    for item in data["@graph"]:
+        for key in [key for key in item if key.startswith("evi:")]:
+            del item[key]
+    (tmp_path / "a.json").write_text(SUBCRATE.read_text(encoding="utf-8"), encoding="utf-8")
+    subcrates = [item for item in data["@graph"] if "ro-crate-metadata" in item]
+    for item in subcrates[:2]:
+        item["ro-crate-metadata"] = "a.json"
+    for item in subcrates[2:]:
+        del item["ro-crate-metadata"]
+    monkeypatch.chdir(tmp_path)
+    return ROCrateV1_2.model_validate(data)
+
+
+def test_aggregate_release_counts_subcrates(release):
+    aggregates, errors = aggregate_release(release, SubcrateLoader(workers=2))
+    release_only, missing = aggregate_release(release, base_dir="elsewhere")
+
+    subcrate = ROCrateV1_2.model_validate_json(SUBCRATE.read_text())
+    assert aggregates["evi:datasetCount"] == release_only["evi:datasetCount"] + 2 * len(subcrate.getDatasets())
+    assert aggregates["evi:formats"] == sorted(aggregates["evi:formats"])
+    assert aggregates["evi:processed"] is True
+    assert errors == []
+    assert [error.error_type for error in missing] == ["FileNotFoundError"] * 2
+    assert "evi:processed" not in release_only
+
+
+def test_partial_load_is_not_marked_processed(release):
+    write_release_aggregates(release, SubcrateLoader(workers=1))
+    root = release.getEntity(root_guid(release))
+    assert root.evi_proccesed is True
+
+    aggregates, errors = write_release_aggregates(release, SubcrateLoader(workers=1), base_dir="elsewhere")
+    assert len(errors) == 2
+    assert root.evi_dataset_count == aggregates["evi:datasetCount"]
+    assert root.evi_proccesed is None
+    assert "evi:processed" not in root.model_dump(by_alias=True, exclude_none=True)
+
+
+def test_aggregated_release_scores_without_subcrates(release, tmp_path):
+    expected = score_rocrate(release, loader=SubcrateLoader(workers=1)).model_dump()
+    aggregates, errors = write_release_aggregates(release, SubcrateLoader(workers=2))
+    assert errors == []
+
+    root = release.getEntity(root_guid(release))
+    assert root.evi_dataset_count == aggregates["evi:datasetCount"]
+    assert root.evi_proccesed is True
+
+    (tmp_path / "a.json").unlink()
+    loader = SubcrateLoader(workers=1)
+    score, errors = score_rocrate_with_errors(release, loader)
+    assert score.model_dump() == expected
+    assert loader.misses == 0 and errors == []
+
+    reloaded = ROCrateV1_2.model_validate_json(release.model_dump_json(by_alias=True))
+    assert score_rocrate(reloaded, loader=loader).model_dump() == expected
@@ -0,0 +1,77 @@
+import pathlib
+
+import pytest
+
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.conversion.mapping.AIReady import (
+    ScoringAccumulator, score_metadata_graph, score_rocrate_file,
+    score_rocrate_file_with_errors, score_rocrate_with_errors,
+)
+from fairscape_models.conversion.subcrate_loader import SubcrateLoader
+
+TEST_ROCRATES_PATH = pathlib.Path(__file__).parent / "test_rocrates"
+test_files = sorted(TEST_ROCRATES_PATH.rglob("ro-crate-metadata.json"))
+test_ids = [str(p.relative_to(TEST_ROCRATES_PATH)) for p in test_files]
+
+DESCRIPTOR = {"@id": "ro-crate-metadata.json", "@type": "CreativeWork", "about": {"@id": "ark:59852/root"}}
+ROOT = {"@id": "ark:59852/root", "@type": ["Dataset", "https://w3id.org/EVI#ROCrate"], "name": "Root", "contentSize": "2 GB"}
+GRAPH = [
+    {"@id": "ark:59852/a", "@type": ["prov:Entity", "https://w3id.org/EVI#Dataset"], "format": "csv",
+     "contentSize": "500 MB", "md5": "abc", "hasSummaryStatistics": {"@id": "ark:59852/stats"}},
+    {"@id": "ark:59852/b", "@type": "https://w3id.org/EVI#Dataset", "format": "tsv", "contentSize": "1.5 TB"},
+    {"@id": "ark:59852/s", "@type": "https://w3id.org/EVI#Software", "format": "py", "sha256": "def"},
+    {"@id": "ark:59852/c", "@type": "https://w3id.org/EVI#Computation"},
+    {"@id": "ark:59852/e", "@type": "https://w3id.org/EVI#Experiment"},
+    {"@id": "ark:59852/schema", "@type": "https://w3id.org/EVI#Schema"},
+]
+
+
+def test_accumulator_totals():
+    accumulator = ScoringAccumulator()
+    accumulator.update([DESCRIPTOR, ROOT, *GRAPH])
+
+    assert accumulator.root_data is ROOT
+    assert (accumulator.datasets, accumulator.transformations, accumulator.software, accumulator.schemas) == (2, 2, 1, 1)
+    assert accumulator.total_size == 2 * 1024**3 + 500 * 1024**2 + round(1.5 * 1024**4)
+    assert accumulator.with_summary_stats == 1
+    assert (accumulator.checksum_candidates, accumulator.with_checksum) == (4, 2)
+    assert accumulator.formats == {"csv", "tsv", "py"}
+
+    score = accumulator.score()
+    assert score.name == "AI-Ready Score for Root"
+    assert score.pre_model_explainability.verifiable.details == "50% of files have checksums (2/4)"
+    assert score.computability.standardized.details == "Formats: csv, py, tsv"
+
+
+def test_root_before_descriptor():
+    assert score_metadata_graph([ROOT, *GRAPH, DESCRIPTOR]).model_dump() == \
+        score_metadata_graph([DESCRIPTOR, ROOT, *GRAPH]).model_dump()
+    with pytest.raises(ValueError, match="Root entity not found"):
+        score_metadata_graph(iter(GRAPH))
+
+
+def test_aggregates_take_precedence():
+    root = dict(ROOT, **{"evi:datasetCount": 10, "evi:computationCount": 0, "evi:softwareCount": 0, "evi:formats": ["h5"]})
+    score = score_metadata_graph([DESCRIPTOR, root, *GRAPH])
+    assert score.provenance.transparent.details == "10 dataset(s) documented"
+    assert score.computability.standardized.details == "Formats: h5"
+
+
+def test_content_size_bytes_take_precedence():
+    root = dict(ROOT, contentSizeBytes=1024**4)
+    accumulator = ScoringAccumulator()
+    accumulator.update([DESCRIPTOR, root])
+    assert accumulator.total_size == 1024**4
+    assert accumulator.score().characterization.statistics.details == "Total size: 1.0 TB"
+
+
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+def test_streamed_file_scores_like_the_crate(rocrate_file_path):
+    crate = ROCrateV1_2.model_validate_json(rocrate_file_path.read_text(encoding="utf-8"))
+    loader = SubcrateLoader(workers=1)
+    expected = score_rocrate_with_errors(crate, loader)
+
+    streamed = score_rocrate_file_with_errors(rocrate_file_path, loader)
+    assert streamed.score.model_dump() == expected.score.model_dump()
+    assert streamed.errors == expected.errors
+    assert score_rocrate_file(rocrate_file_path).model_dump() == expected.score.model_dump()
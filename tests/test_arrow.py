@@ -0,0 +1,93 @@
+import json
+import pathlib
+import sys
+
+import pytest
+
+from fairscape_models.rocrate import ROCrateV1_2
+
+pa = pytest.importorskip("pyarrow")
+
+from fairscape_models.arrow import EDGES_TABLE, POSITION_COLUMN, from_arrow, read_parquet, to_arrow, write_parquet
+
+TEST_ROCRATES_PATH = pathlib.Path(__file__).parent / "test_rocrates"
+test_files = sorted(TEST_ROCRATES_PATH.rglob("ro-crate-metadata.json"))
+test_ids = [str(p.relative_to(TEST_ROCRATES_PATH)) for p in test_files]
+
+
+def _load(path):
+    return ROCrateV1_2.model_validate_json(path.read_text(encoding="utf-8"))
+
+
+def _document(crate):
+    return json.loads(crate.model_dump_json(by_alias=True))
+
+
+def _rows(table):
+    """ Rows of a class table with null cells left out and JSON columns decoded """
+    json_columns = set(json.loads(table.schema.metadata[b"fairscape.json_columns"]))
+    return [
+        {key: json.loads(value) if key in json_columns else value for key, value in row.items() if value is not None}
+        for row in table.to_pylist()
+    ]
+
+
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+def test_tables_hold_every_element(rocrate_file_path):
+    crate = _load(rocrate_file_path)
+    tables = to_arrow(crate)
+    context = json.loads(crate.model_dump_json(by_alias=True, include={"context"})).get("@context")
+
+    elements = {}
+    for name, table in tables.items():
+        assert json.loads(table.schema.metadata[b"fairscape.context"]) == context
+        if name != EDGES_TABLE:
+            elements.update((row.pop(POSITION_COLUMN), (name, row)) for row in _rows(table))
+    assert sorted(elements) == list(range(len(crate.metadataGraph)))
+    for position, entity in enumerate(crate.metadataGraph):
+        dump = {key: value for key, value in entity.model_dump(by_alias=True, mode="json").items() if value is not None}
+        assert elements[position] == (type(entity).__name__, dump)
+
+
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+def test_tables_round_trip(rocrate_file_path):
+    crate = _load(rocrate_file_path)
+    rebuilt = from_arrow(to_arrow(crate))
+
+    assert [type(entity) for entity in rebuilt.metadataGraph] == [type(entity) for entity in crate.metadataGraph]
+    assert _document(rebuilt) == _document(crate)
+
+
+def test_edges_table():
+    crate = _load(test_files[0])
+    edges = to_arrow(crate)[EDGES_TABLE].to_pylist()
+    index = crate.getGraphIndex()
+    assert edges
+    for edge in edges:
+        assert (index.get(edge["source"]), edge["key"]) in index.referenced_by(edge["target"])
+
+
+def test_write_parquet(tmp_path):
+    import pyarrow.parquet as pq
+    crate = _load(test_files[0])
+    write_parquet(crate, tmp_path / "crate")
+
+    written = {path.stem: pq.read_table(path) for path in (tmp_path / "crate").glob("*.parquet")}
+    tables = to_arrow(crate)
+    assert set(written) == set(tables)
+    for name, table in tables.items():
+        assert written[name].to_pylist() == table.to_pylist()
+    assert _document(read_parquet(tmp_path / "crate")) == _document(crate)
+
+
+def test_unknown_table():
+    tables = to_arrow(_load(test_files[0]))
+    tables["Spreadsheet"] = tables.pop("Dataset")
+    with pytest.raises(ValueError, match="Spreadsheet"):
+        from_arrow(tables)
+
+
+def test_missing_pyarrow(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match="fairscape-models\\[arrow\\]"):
+        to_arrow(_load(test_files[0]))
@@ -0,0 +1,59 @@
+import pathlib
+import shutil
+
+import pytest
+import yaml
+
+from fairscape_models.conversion.batch import BATCH_TARGETS, convert_batch, convert_crate
+from fairscape_models.conversion.models.croissant import CroissantDataset
+from fairscape_models.conversion.models.FairscapeDatasheet import Preview
+
+TEST_ROCRATES_PATH = pathlib.Path(__file__).parent / "test_rocrates"
+test_files = sorted(TEST_ROCRATES_PATH.rglob("ro-crate-metadata.json"))
+
+
+@pytest.fixture
+def crate_copies(tmp_path):
+    paths = []
+    for n, path in enumerate(test_files):
+        directory = tmp_path / f"crate-{n}"
+        directory.mkdir()
+        paths.append(pathlib.Path(shutil.copy(path, directory / path.name)))
+    return paths
+
+
+@pytest.mark.parametrize("target, result_type", [("croissant", CroissantDataset), ("datasheet", Preview), ("d4d", dict)])
+def test_convert_crate(target, result_type):
+    assert isinstance(convert_crate(test_files[0], target), result_type)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_convert_batch_yields_every_crate(workers):
+    results = dict(convert_batch(test_files, "croissant", workers=workers, max_pending=1))
+    assert set(results) == set(test_files)
+    assert all(isinstance(result, CroissantDataset) for result in results.values())
+
+
+def test_convert_batch_writes_outputs(crate_copies):
+    results = dict(convert_batch(crate_copies, "d4d", workers=2, write=True))
+    for path in crate_copies:
+        output = path.parent / BATCH_TARGETS["d4d"].filename
+        assert results[path] == output
+        with output.open("r", encoding="utf-8") as f:
+            assert yaml.safe_load(f)
+
+
+def test_convert_batch_reports_errors(tmp_path):
+    broken = tmp_path / "ro-crate-metadata.json"
+    broken.write_text('{"@context": {}, "@graph": [{"@id": "x"}]}', encoding="utf-8")
+    missing = tmp_path / "missing" / "ro-crate-metadata.json"
+
+    results = dict(convert_batch([broken, missing, test_files[0]], "datasheet", workers=2))
+    assert isinstance(results[broken], ValueError)
+    assert isinstance(results[missing], FileNotFoundError)
+    assert isinstance(results[test_files[0]], Preview)
+
+
+def test_convert_batch_unknown_target():
+    with pytest.raises(ValueError, match="Unknown batch target"):
+        list(convert_batch(test_files, "html"))
@@ -0,0 +1,104 @@
+import copy
+import json
+import pathlib
+import sys
+
+import pytest
+
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.dataset import Dataset
+from fairscape_models.computation import Computation
+from fairscape_models.compact import CompactCrate, CompactReference, compact_class
+
+TEST_ROCRATES_PATH = pathlib.Path(__file__).parent / "test_rocrates"
+test_files = sorted(TEST_ROCRATES_PATH.rglob("ro-crate-metadata.json"))
+test_ids = [str(p.relative_to(TEST_ROCRATES_PATH)) for p in test_files]
+
+
+def _load(path):
+    return ROCrateV1_2.model_validate_json(path.read_text(encoding="utf-8"))
+
+
+def _guids(entities):
+    return [entity.guid for entity in entities]
+
+
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+def test_queries_match_the_crate(rocrate_file_path):
+    crate = _load(rocrate_file_path)
+    compact = CompactCrate.from_crate(crate)
+
+    assert _guids(compact.metadataGraph) == _guids(crate.metadataGraph)
+    assert compact.getCrateMetadata().guid == crate.getCrateMetadata().guid
+    for query in (
+        "getDatasets", "getSoftware", "getComputations", "getSchemas", "getAnnotations", "getExperiments",
+        "getMLModels", "getBioChemEntities", "getMedicalConditions", "getEVIElements",
+    ):
+        assert _guids(getattr(compact, query)()) == _guids(getattr(crate, query)())
+    for entity in crate.metadataGraph:
+        assert compact.getEntity(entity.guid).guid == entity.guid
+        assert _guids(compact.getReferencingEntities(entity.guid)) == _guids(crate.getReferencingEntities(entity.guid))
+
+
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+def test_round_trip(rocrate_file_path):
+    crate = _load(rocrate_file_path)
+    compact = CompactCrate.from_crate(crate)
+    assert compact.to_crate().model_dump_json(by_alias=True) == crate.model_dump_json(by_alias=True)
+
+    loaded = CompactCrate.load(rocrate_file_path)
+    assert [json.loads(e.to_model().model_dump_json(by_alias=True)) for e in loaded.metadataGraph] == \
+        json.loads(crate.model_dump_json(by_alias=True))["@graph"]
+
+
+def test_compact_entities_are_slotted_and_read_only():
+    crate = _load(test_files[0])
+    compact = CompactCrate.from_crate(crate)
+    computation = compact.getComputations()[0]
+
+    assert type(computation) is compact_class(Computation)
+    assert not hasattr(computation, "__dict__")
+    assert computation.usedDataset == tuple(CompactReference(ref.guid) for ref in crate.getComputations()[0].usedDataset)
+    assert computation.usedDataset[0].guid == crate.getComputations()[0].usedDataset[0].guid
+    with pytest.raises(AttributeError, match="read-only"):
+        computation.name = "renamed"
+    with pytest.raises(AttributeError, match="read-only"):
+        del computation.name
+    with pytest.raises(AttributeError):
+        computation.undefined_property
+    with pytest.raises(AttributeError, match="read-only"):
+        copy.copy(computation)
+    assert computation.keywords == tuple(crate.getComputations()[0].keywords)
+    assert dict(computation.values())["name"] == computation.name
+    assert dict(computation.values())["keywords"] == computation.keywords
+
+    dataset = compact.getDatasets()[0]
+    assert dataset.fileFormat is sys.intern(dataset.fileFormat)
+    assert isinstance(dataset.to_model(), Dataset)
+
+
+def test_string_references_match_the_crate():
+    data = json.loads(test_files[0].read_text(encoding="utf-8"))
+    crate = ROCrateV1_2.model_validate(data)
+    target = crate.getDatasets()[0].guid
+    data["@graph"].append({
+        "@id": "ark:59852/string-activity", "@type": "Activity", "name": "Strings",
+        "description": "String references.", "prov:used": [target],
+    })
+    crate = ROCrateV1_2.model_validate(data)
+    compact = CompactCrate.from_crate(crate)
+
+    assert "ark:59852/string-activity" in _guids(crate.getReferencingEntities(target))
+    assert _guids(compact.getReferencingEntities(target)) == _guids(crate.getReferencingEntities(target))
+
+
+def test_extra_references_and_empty_crates():
+    data = json.loads(test_files[0].read_text(encoding="utf-8"))
+    target = data["@graph"][2]["@id"]
+    data["@graph"][2]["evi:annotatedBy"] = {"@id": "ark:59852/annotation"}
+    compact = CompactCrate.from_crate(ROCrateV1_2.model_validate(data))
+
+    assert compact.getEntity(target).extra["evi:annotatedBy"] == CompactReference("ark:59852/annotation")
+    assert _guids(compact.getReferencingEntities("ark:59852/annotation")) == [target]
+    with pytest.raises(Exception):
+        CompactCrate([]).getCrateMetadata()
@@ -0,0 +1,104 @@
+import pytest
+
+from fairscape_models.content_size import content_size_bytes, format_content_size, parse_content_size, _parse_size_string
+from fairscape_models.dataset import Dataset
+
+
+@pytest.mark.parametrize("size, expected", [
+    ("2 GB", 2 * 1024**3),
+    ("150MB", 150 * 1024**2),
+    ("1.5 tb", round(1.5 * 1024**4)),
+    ("2 KiB", 2048),
+    ("3 megabytes", 3 * 1024**2),
+    ("1,024 bytes", 1024),
+    ("512", 512),
+    (" 1e3 B ", 1000),
+    (2048, 2048),
+    (10.4, 10),
+])
+def test_parse_content_size(size, expected):
+    assert parse_content_size(size) == expected
+
+
+@pytest.mark.parametrize("size", [
+    None, "", "large", "2 XB", "-1 MB", "1.2.3 GB", True, ["1 MB"],
+    "1e400 GB", "9" * 400, "1e999999999", "1e308 PB", float("inf"), float("nan"),
+])
+def test_parse_content_size_rejects(size):
+    assert parse_content_size(size) is None
+
+
+def test_parse_content_size_is_cached():
+    _parse_size_string.cache_clear()
+    parse_content_size("7 MB")
+    parse_content_size("7 MB")
+    assert _parse_size_string.cache_info().hits == 1
+
+
+def test_format_content_size_round_trips():
+    assert format_content_size(500) == "500 B"
+    assert format_content_size(2048) == "2.0 KB"
+    assert format_content_size(1536, precision=2) == "1.50 KB"
+    assert format_content_size(5 * 1024**5) == "5120.0 TB"
+    for size in (2048, 5 * 1024**2, 3 * 1024**3):
+        assert parse_content_size(format_content_size(size)) == size
+
+
+def test_dataset_content_size_bytes(dataset_minimal_data):
+    dataset = Dataset.model_validate({**dataset_minimal_data, "contentSize": "2 MB"})
+    assert dataset.contentSizeBytes == 2 * 1024**2
+
+    given = Dataset.model_validate({**dataset_minimal_data, "contentSize": "2 MB", "contentSizeBytes": 2000000})
+    assert given.contentSizeBytes == 2000000
+    # the parsed size is not part of the serialized element
+    assert "contentSizeBytes" not in given.model_dump(by_alias=True)
+    assert "contentSizeBytes" not in given.model_dump_json(by_alias=True)
+    assert content_size_bytes(given) == 2000000
+
+    constructed = Dataset.model_construct(contentSize="1 KB")
+    assert content_size_bytes(constructed) == 1024
+
+
+def test_content_size_bytes_follows_content_size(dataset_minimal_data):
+    dataset = Dataset.model_validate({**dataset_minimal_data, "contentSize": "2 MB"})
+    dataset.contentSize = "3 KB"
+    assert dataset.contentSizeBytes == 3072
+
+    given = Dataset.model_validate({**dataset_minimal_data, "contentSize": "2 MB", "contentSizeBytes": 2000000})
+    given.contentSize = "1 GB"
+    assert given.contentSizeBytes == 1024**3
+
+    given.contentSizeBytes = 1000000000
+    assert given.contentSizeBytes == 1000000000
+    assert "contentSizeBytes" not in given.model_dump(by_alias=True)
+
+
+def test_scoring_reads_content_size_bytes(dataset_minimal_data):
+    from fairscape_models.conversion.mapping.AIReady import ScoringAccumulator, dump_for_scoring
+    dataset = Dataset.model_validate({**dataset_minimal_data, "contentSize": "2 MB", "contentSizeBytes": 2000000})
+    assert dump_for_scoring(dataset, None)["contentSizeBytes"] == 2000000
+
+    accumulator = ScoringAccumulator(root_id="ark:59852/root")
+    accumulator.add_entity(dataset)
+    assert accumulator.total_size == 2000000
+
+
+def test_d4d_sizes_below_a_kilobyte_are_bytes():
+    from fairscape_models.conversion.mapping.d4d_to_rocrate import _parse_bytes_to_size_string
+    assert _parse_bytes_to_size_string(512) == "512 bytes"
+    assert _parse_bytes_to_size_string(2048) == "2.00 KB"
+
+
+def test_release_content_size_bytes_follows_content_size():
+    from fairscape_models.rocrate import ROCrateMetadataElem
+    release = ROCrateMetadataElem.model_validate({
+        "@id": "ark:59852/release", "@type": ["Dataset", "https://w3id.org/EVI#ROCrate"],
+        "name": "Release", "description": "A release.", "keywords": [], "version": "1.0",
+        "hasPart": [], "author": "tester", "license": None, "contentSize": "2 MB", "contentSizeBytes": 2000000,
+    })
+    assert release.contentSizeBytes == 2000000
+
+    release.contentSize = "4 KB"
+    assert release.contentSizeBytes == 4096
+    release.contentSizeBytes = 4000
+    assert release.contentSizeBytes == 4000
@@ -0,0 +1,113 @@
+import pathlib
+import pickle
+
+import pytest
+from pydantic import BaseModel
+
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.conversion.cache import CACHE_FORMAT, ConversionCache
+from fairscape_models.conversion.converter import ROCToTargetConverter
+from fairscape_models.conversion.mapping.croissant import MAPPING_CONFIGURATION
+from fairscape_models.conversion.mapping.FairscapeDatasheet import PREVIEW_MAPPING_CONFIGURATION
+
+TEST_ROCRATES_PATH = pathlib.Path(__file__).parent / "test_rocrates"
+test_files = sorted(TEST_ROCRATES_PATH.rglob("ro-crate-metadata.json"))
+test_ids = [str(p.relative_to(TEST_ROCRATES_PATH)) for p in test_files]
+
+
+def _load(path):
+    return ROCrateV1_2.model_validate_json(path.read_text(encoding="utf-8"))
+
+
+def _convert(crate, configuration, cache):
+    return ROCToTargetConverter(crate, configuration, cache=cache).convert().model_dump_json(by_alias=True)
+
+
+@pytest.mark.parametrize("configuration", [MAPPING_CONFIGURATION, PREVIEW_MAPPING_CONFIGURATION], ids=["croissant", "preview"])
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+def test_cached_conversion_matches(rocrate_file_path, configuration, tmp_path):
+    expected = _convert(_load(rocrate_file_path), configuration, None)
+
+    cache = ConversionCache()
+    assert _convert(_load(rocrate_file_path), configuration, cache) == expected
+    cache.save(tmp_path / "cache.pickle")
+
+    reloaded = ConversionCache.load(tmp_path / "cache.pickle")
+    assert _convert(_load(rocrate_file_path), configuration, reloaded) == expected
+    assert reloaded.misses == 0
+    assert reloaded.hits == cache.misses
+
+
+def test_only_changed_entities_are_remapped():
+    cache = ConversionCache()
+    _convert(_load(test_files[0]), MAPPING_CONFIGURATION, cache)
+    stored = len(cache.entries)
+
+    crate = _load(test_files[0])
+    dataset = crate.getDatasets()[0]
+    dataset.name = "Renamed dataset"
+    # properties the mapping does not read do not invalidate the entry
+    crate.getDatasets()[1].keywords = ["not", "mapped"]
+    cache.hits = cache.misses = 0
+    croissant = ROCToTargetConverter(crate, MAPPING_CONFIGURATION, cache=cache).convert()
+
+    assert cache.misses == 1
+    assert cache.hits == stored - 1
+    assert "Renamed" in croissant.distribution[0].name
+    assert croissant.model_dump_json(by_alias=True) == _convert(crate, MAPPING_CONFIGURATION, None)
+
+
+def test_changing_the_output_leaves_the_cache_intact():
+    crate = _load(test_files[0])
+    expected = _convert(crate, MAPPING_CONFIGURATION, None)
+    cache = ConversionCache()
+    first = ROCToTargetConverter(crate, MAPPING_CONFIGURATION, cache=cache)
+    croissant = first.convert()
+    croissant.distribution[0].name = "Changed"
+    for args in first.target_args_cache.values():
+        args["name"] = "Changed"
+
+    cache.hits = 0
+    second = ROCToTargetConverter(crate, MAPPING_CONFIGURATION, cache=cache).convert()
+    assert cache.hits == len(croissant.distribution)
+    assert second.distribution[0] is not croissant.distribution[0]
+    assert second.model_dump_json(by_alias=True) == expected
+
+
+def test_save_prunes_and_load_checks_namespace(tmp_path):
+    cache = ConversionCache()
+    _convert(_load(test_files[0]), MAPPING_CONFIGURATION, cache)
+    cache.save(tmp_path / "cache.pickle")
+
+    reloaded = ConversionCache.load(tmp_path / "cache.pickle")
+    reloaded.save(tmp_path / "pruned.pickle")
+    assert ConversionCache.load(tmp_path / "pruned.pickle").entries == {}
+    assert ConversionCache.load(tmp_path / "cache.pickle", namespace="other").entries == {}
+    assert ConversionCache.load(tmp_path / "missing.pickle").entries == {}
+
+
+def _target_class(fields):
+    # the same qualified name for every definition, as after editing the class
+    return type("Target", (BaseModel,), {"__annotations__": fields, "__qualname__": "Target"})
+
+
+def test_target_class_fields_are_part_of_the_key():
+    cache = ConversionCache()
+    converter = ROCToTargetConverter(_load(test_files[0]), MAPPING_CONFIGURATION)
+    compiled = converter._compile_mapping({"name": {"source_key": "name"}})
+
+    old = cache.rule_key({"target_class": _target_class({"name": str})}, compiled)
+    assert old == cache.rule_key({"target_class": _target_class({"name": str})}, compiled)
+    assert old != cache.rule_key({"target_class": _target_class({"name": str, "size": int})}, compiled)
+
+
+def test_load_checks_the_cache_format(tmp_path):
+    cache = ConversionCache()
+    _convert(_load(test_files[0]), MAPPING_CONFIGURATION, cache)
+    cache.save(tmp_path / "cache.pickle")
+
+    stored = pickle.loads((tmp_path / "cache.pickle").read_bytes())
+    assert stored["format"] == CACHE_FORMAT
+    stored["format"] = CACHE_FORMAT - 1
+    (tmp_path / "stale.pickle").write_bytes(pickle.dumps(stored))
+    assert ConversionCache.load(tmp_path / "stale.pickle").entries == {}
@@ -0,0 +1,224 @@
+import io
+import json
+import pathlib
+import types
+from typing import Any, List, Optional
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.conversion.converter import CompiledMapping, ROCToTargetConverter, TargetToROCrateConverter
+from fairscape_models.conversion.mapping.croissant import MAPPING_CONFIGURATION
+from fairscape_models.conversion.mapping.FairscapeDatasheet import PREVIEW_MAPPING_CONFIGURATION
+from fairscape_models.conversion.mapping.d4d_to_rocrate import (
+    DATASET_COLLECTION_TO_RELEASE_MAPPING, DATASET_TO_SUBCRATE_MAPPING,
+)
+from fairscape_models.conversion.models.croissant import CroissantFileObject
+
+TEST_ROCRATES_PATH = pathlib.Path(__file__).parent / "test_rocrates"
+test_files = sorted(TEST_ROCRATES_PATH.rglob("ro-crate-metadata.json"))
+test_ids = [str(p.relative_to(TEST_ROCRATES_PATH)) for p in test_files]
+
+
+def test_compiled_mapping_extractors():
+    mapping_def = {
+        "@type": {"fixed_value": "cr:FileObject"},
+        "name": {"source_key": "name", "parser": str.upper},
+        "size": {"source_key": "contentSize", "fallback_source_key": "additionalProperty", "fallback_parser": len},
+        "url": {"source_key": "contentUrl", "fallback_source_key": "url"},
+        "details": {"builder_func": lambda **kwargs: None},
+    }
+    compiled = CompiledMapping(mapping_def)
+    assert compiled.source_keys == {"name", "contentSize", "additionalProperty", "contentUrl", "url"}
+    assert [key for key, _ in compiled.builders] == ["details"]
+
+    assert compiled.apply({"name": "file", "additionalProperty": [1, 2], "url": "https://example.org"}) == {
+        "@type": "cr:FileObject", "name": "FILE", "size": 2, "url": "https://example.org"
+    }
+    # missing values are left out; the fallback is only read when the source key is empty
+    assert compiled.apply({"contentSize": "1 MB", "additionalProperty": [1]}) == {"@type": "cr:FileObject", "size": "1 MB"}
+
+
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+def test_croissant_conversion_maps_every_dataset(rocrate_file_path):
+    crate = ROCrateV1_2.model_validate_json(rocrate_file_path.read_text(encoding="utf-8"))
+    converter = ROCToTargetConverter(crate, MAPPING_CONFIGURATION)
+    croissant = converter.convert()
+
+    assert converter.root_entity is crate.getEntity(crate.getCrateMetadata().guid)
+    datasets = {dataset.guid for dataset in crate.getDatasets()}
+    assert {guid for guid, rule in converter.target_rules.items() if rule["target_class"] is CroissantFileObject} == datasets
+    assert len(croissant.distribution) == len(datasets)
+
+
+def test_mappings_are_compiled_once():
+    crate = ROCrateV1_2.model_validate_json(test_files[0].read_text(encoding="utf-8"))
+    converter = ROCToTargetConverter(crate, MAPPING_CONFIGURATION)
+    converter.convert()
+    mapping_def = MAPPING_CONFIGURATION["sub_mappings"]["field_mapping"]
+    assert converter._compile_mapping(mapping_def) is converter._compile_mapping(mapping_def)
+    assert converter._compile_mapping(dict(mapping_def)) is not converter._compile_mapping(mapping_def)
+
+
+def test_source_keys_follow_the_matched_rule():
+    crate = ROCrateV1_2.model_validate_json(test_files[0].read_text(encoding="utf-8"))
+    converter = ROCToTargetConverter(crate, MAPPING_CONFIGURATION)
+    dataset = crate.getDatasets()[0]
+    assert "name" in converter.source_keys(dataset)
+    assert converter.source_keys(dataset) is converter.source_keys(dataset)
+    assert converter.source_keys(crate.getEntity("ro-crate-metadata.json")) == frozenset()
+
+
+class _Parent(BaseModel):
+    name: Optional[str] = None
+    items: Optional[List[Any]] = None
+    sets: Optional[List[Any]] = None
+    names: Optional[List[str]] = None
+
+
+class _Item(BaseModel):
+    name: Optional[str] = None
+    kind: Optional[str] = None
+
+
+class _SpecialItem(_Item):
+    pass
+
+
+def _assembly_crate():
+    return ROCrateV1_2.model_validate({
+        "@context": {},
+        "@graph": [
+            {"@id": "ro-crate-metadata.json", "@type": "CreativeWork",
+             "conformsTo": {"@id": "https://w3id.org/ro/crate/1.2"}, "about": {"@id": "ark:59852/crate"}},
+            {"@id": "ark:59852/crate", "@type": ["Dataset", "https://w3id.org/EVI#ROCrate"],
+             "name": "Crate", "description": "A crate for testing.", "keywords": [], "version": "1.0",
+             "author": "tester", "license": "MIT", "hasPart": []},
+            *[
+                {"@id": f"ark:59852/{n}", "@type": "https://w3id.org/EVI#Dataset", "name": f"Dataset {n}",
+                 "author": "tester", "datePublished": "2024-01-01", "description": "A dataset.",
+                 "keywords": [], "format": "csv" if n % 2 else "tsv"}
+                for n in range(4)
+            ],
+            {"@id": "ark:59852/software", "@type": "https://w3id.org/EVI#Software", "name": "Software",
+             "author": "tester", "dateModified": "2024-01-01", "description": "Some software.", "format": "py"},
+        ]
+    })
+
+
+def _assembly_configuration(instructions):
+    item_mapping = {"name": {"source_key": "name"}, "kind": {"source_key": "format"}}
+    return {
+        "entity_map": {
+            ("ROCrateMetadataElem", "ROOT"): {"target_class": _Parent, "mapping_def": {"name": {"source_key": "name"}}},
+            ("Dataset", "COMPONENT"): {"target_class": _Item, "mapping_def": item_mapping},
+            ("Software", "COMPONENT"): {"target_class": _SpecialItem, "mapping_def": item_mapping},
+        },
+        "assembly_instructions": [dict(instruction, parent_type=_Parent) for instruction in instructions],
+    }
+
+
+def test_assembly_by_type_partition_and_filter():
+    converter = ROCToTargetConverter(_assembly_crate(), _assembly_configuration([
+        # _Item matches both classes, in instantiation order
+        {"parent_attribute": "items", "child_type": _Item},
+        {"parent_attribute": "sets", "child_type": _Item, "partition_by": "kind", "partition_value": "csv"},
+        {"parent_attribute": "names", "child_type": _Item, "child_attribute_to_link": "name",
+         "child_filter": lambda o: o.kind != "csv"},
+    ]))
+    parent = converter.convert()
+
+    assert [item.name for item in parent.items] == ["Dataset 0", "Dataset 1", "Dataset 2", "Dataset 3", "Software"]
+    assert [item.name for item in parent.sets] == ["Dataset 1", "Dataset 3"]
+    assert parent.names == ["Dataset 0", "Dataset 2", "Software"]
+    assert list(converter.target_objects_by_type) == [_Parent, _Item, _SpecialItem]
+
+
+def _with_validate(configuration, mode):
+    entity_map = {key: dict(rule, validate=mode) if rule else rule for key, rule in configuration["entity_map"].items()}
+    return dict(configuration, entity_map=entity_map)
+
+
+@pytest.mark.parametrize("configuration", [MAPPING_CONFIGURATION, PREVIEW_MAPPING_CONFIGURATION], ids=["croissant", "preview"])
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+def test_validate_at_end_matches_validating_each_object(rocrate_file_path, configuration):
+    crate = ROCrateV1_2.model_validate_json(rocrate_file_path.read_text(encoding="utf-8"))
+    expected = ROCToTargetConverter(crate, _with_validate(configuration, "each")).convert()
+    converter = ROCToTargetConverter(crate, _with_validate(configuration, "end"))
+    assert converter.convert().model_dump_json(by_alias=True) == expected.model_dump_json(by_alias=True)
+    assert list(converter.target_objects_cache) == list(converter.target_args_cache)
+    assert None not in converter.target_objects_cache.values()
+
+
+def test_validate_at_end_reports_the_first_invalid_object(capsys):
+    configuration = _assembly_configuration([])
+    configuration["entity_map"][("Dataset", "COMPONENT")]["mapping_def"] = {"name": {"source_key": "keywords"}}
+    converter = ROCToTargetConverter(_assembly_crate(), _with_validate(configuration, "end"))
+    with pytest.raises(ValidationError):
+        converter.convert()
+    assert "_Item for source GUID ark:59852/0" in capsys.readouterr().out
+
+
+def _d4d_collection(count):
+    resources = []
+    for n in range(count):
+        resource = {"title": f"Dataset {n}", "description": "A dataset.", "creators": ["tester"],
+                    "bytes": 1024 * n, "keywords": ["test"]}
+        if n % 3:
+            resource["id"] = f"ark:59852/dataset-{n}"
+        resources.append(resource)
+    return types.SimpleNamespace(id="ark:59852/collection", title="Collection", description="A collection.", resources=resources)
+
+
+def _to_rocrate(collection):
+    return TargetToROCrateConverter(collection, DATASET_TO_SUBCRATE_MAPPING, DATASET_COLLECTION_TO_RELEASE_MAPPING)
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("workers, chunk_size", [(1, 1), (1, 4), (2, 3)])
+def test_subcrates_in_chunks_match_one_chunk(workers, chunk_size):
+    collection = _d4d_collection(10)
+    expected = _to_rocrate(collection).convert(chunk_size=len(collection.resources))
+    crate = _to_rocrate(collection).convert(workers=workers, chunk_size=chunk_size)
+
+    assert crate.model_dump_json(by_alias=True) == expected.model_dump_json(by_alias=True)
+    subcrates = crate.metadataGraph[2:]
+    assert [subcrate.guid for subcrate in subcrates[:3]] == ["subcrate-0", "ark:59852/dataset-1", "ark:59852/dataset-2"]
+    assert subcrates[9].guid == "subcrate-9"
+
+
+def test_subcrates_validate_with_empty_required_fields():
+    collection = _d4d_collection(2)
+    del collection.resources[0]["description"]
+    collection.resources[1]["conforms_to"] = "https://w3id.org/ro/crate/1.2"
+    first, second = _to_rocrate(collection).iter_subcrates()
+
+    assert first.description == "" and first.version == "" and first.dataLicense is None
+    # a value the model rejects is kept as mapped
+    assert second.conformsTo == "https://w3id.org/ro/crate/1.2"
+
+
+def test_iter_subcrates_reads_resources_lazily():
+    collection = _d4d_collection(0)
+    read = []
+
+    def resources():
+        for resource in _d4d_collection(5).resources:
+            read.append(resource["title"])
+            yield resource
+
+    subcrates = _to_rocrate(collection).iter_subcrates(resources(), chunk_size=2)
+    assert next(subcrates).name == "Dataset 0"
+    assert read == ["Dataset 0", "Dataset 1"]
+    assert len(list(subcrates)) == 4
+
+
+@pytest.mark.filterwarnings("error")
+def test_write_streams_the_converted_crate():
+    collection = _d4d_collection(5)
+    destination = io.StringIO()
+    _to_rocrate(collection).write(destination, chunk_size=2)
+
+    expected = _to_rocrate(collection).convert()
+    assert json.loads(destination.getvalue()) == json.loads(expected.model_dump_json(by_alias=True))
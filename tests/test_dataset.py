@@ -1,14 +1,13 @@
 import pytest
-from pathlib import Path
 from pydantic import ValidationError
 from fairscape_models.dataset import (
     Dataset,
     Split,
     SplitType,
     _count_csv,
-    _human_size,
 )
 from fairscape_models.fairscape_base import IdentifierValue
+from fairscape_models.content_size import format_content_size
 
 def test_dataset_instantiation(dataset_minimal_data):
     """Test successful instantiation of a Dataset model."""
@@ -160,22 +159,22 @@ def test_count_csv_tsv(tmp_path):
     assert cols == 2
 
 
-def test_human_size_bytes():
-    assert _human_size(500) == "500 B"
+def test_format_content_size_bytes():
+    assert format_content_size(500) == "500 B"
 
 
-def test_human_size_kb():
-    assert _human_size(2048) == "2.0 KB"
+def test_format_content_size_kb():
+    assert format_content_size(2048) == "2.0 KB"
 
 
-def test_human_size_mb():
-    assert _human_size(5 * 1024 * 1024) == "5.0 MB"
+def test_format_content_size_mb():
+    assert format_content_size(5 * 1024 * 1024) == "5.0 MB"
 
 
-def test_human_size_terabytes_clamps():
+def test_format_content_size_terabytes_clamps():
     # Forces the `unit == "TB"` early-return branch
     big = 5 * 1024 ** 4
-    assert _human_size(big).endswith("TB")
+    assert format_content_size(big).endswith("TB")
 
 
 def test_split_model_defaults():
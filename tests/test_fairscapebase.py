@@ -5,8 +5,12 @@ from fairscape_models.fairscape_base import (
     IdentifierValue,
     IdentifierPropertyValue,
     ClassType,
-    normalize_class_type
+    normalize_class_type,
+    extractGUID,
+    cleanGUID,
+    normalizeIdentifiers
 )
+from fairscape_models.computation import Computation
 
 def test_identifier_value():
     iv = IdentifierValue.model_validate({"@id": "test-id"})
@@ -46,4 +50,57 @@ def test_normalize_class_type_valid(input_val, expected):
 def test_normalize_class_type_invalid():
     """Test that an invalid class type string raises a ValueError."""
     with pytest.raises(ValueError, match="Invalid class type: InvalidType"):
-        normalize_class_type("InvalidType")
\ No newline at end of file
+        normalize_class_type("InvalidType")
+
+
+@pytest.mark.parametrize("input_val, expected", [
+    ("https://fairscape.net/ark:59852/test-id", "ark:59852/test-id"),
+    ("ark:59852/test-id", "ark:59852/test-id"),
+    ("not-an-ark", "not-an-ark"),
+])
+def test_extract_guid(input_val, expected):
+    assert extractGUID(input_val) == expected
+    # memoized path returns the same value on repeat calls
+    assert extractGUID(input_val) == expected
+
+def test_extract_guid_non_string():
+    with pytest.raises(TypeError):
+        extractGUID(None)
+
+def test_clean_guid_only_trims_urls():
+    assert cleanGUID("https://fairscape.net/ark:59852/x") == "ark:59852/x"
+    assert cleanGUID("see ark:59852/x") == "see ark:59852/x"
+    assert cleanGUID(None) is None
+
+COMPUTATION_FIELDS = {Computation: ("usedDataset", "generated", "used")}
+
+def test_normalize_identifiers_listed_fields():
+    computation = Computation.model_validate({
+        "@id": "https://fairscape.net/ark:59852/computation",
+        "@type": "https://w3id.org/EVI#Computation",
+        "name": "Computation", "runBy": "tester", "dateCreated": "2024-01-01",
+        "description": "A computation.",
+        "usedDataset": [{"@id": "https://fairscape.net/ark:59852/input"}],
+        "generated": [{"@id": "http://n2t.net/ark:59852/output"}, {"@id": "local-id"}]
+    })
+    normalizeIdentifiers([computation], COMPUTATION_FIELDS)
+    assert computation.guid == "ark:59852/computation"
+    assert computation.usedDataset[0].guid == "ark:59852/input"
+    assert computation.used[0].guid == "ark:59852/input"
+    assert [item.guid for item in computation.generated] == ["ark:59852/output", "local-id"]
+
+def test_normalize_identifiers_skips_unlisted_fields():
+    computation = Computation.model_validate({
+        "@id": "ark:59852/computation",
+        "@type": "https://w3id.org/EVI#Computation",
+        "name": "Computation", "runBy": "tester", "dateCreated": "2024-01-01",
+        "description": "A computation.",
+        "isPartOf": [{"@id": "https://fairscape.net/ark:59852/crate"}]
+    })
+    normalizeIdentifiers([computation], COMPUTATION_FIELDS)
+    assert computation.isPartOf[0].guid == "https://fairscape.net/ark:59852/crate"
+
+    # elements of classes missing from the table only have their own guid cleaned
+    computation.usedDataset = [IdentifierValue.model_validate({"@id": "https://fairscape.net/ark:59852/input"})]
+    normalizeIdentifiers([computation], {})
+    assert computation.usedDataset[0].guid == "https://fairscape.net/ark:59852/input"
@@ -0,0 +1,178 @@
+import json
+import os
+import pathlib
+import types
+
+import pytest
+
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.conversion.converter import ROCToTargetConverter
+from fairscape_models.conversion.global_index import GlobalIndex, index_entry, crate_entries
+from fairscape_models.conversion.mapping.FairscapeDatasheet import DISTRIBUTION_MAPPING_CONFIGURATION
+from fairscape_models.conversion.mapping.subcrate_utils import build_composition_details, _calculate_input_datasets, _normalize_type, _normalize_type_name
+
+TEST_ROCRATES_PATH = pathlib.Path(__file__).parent / "test_rocrates"
+RELEASE = TEST_ROCRATES_PATH / "release" / "ro-crate-metadata.json"
+SUBCRATE = TEST_ROCRATES_PATH / "LakeDB" / "ro-crate-metadata.json"
+
+
+@pytest.fixture
+def release(tmp_path):
+    """The release fixture with two sub-crate files in tmp_path and one missing."""
+    data = json.loads(RELEASE.read_text(encoding="utf-8"))
+    subcrate = json.loads(SUBCRATE.read_text(encoding="utf-8"))
+    (tmp_path / "a.json").write_text(json.dumps(subcrate), encoding="utf-8")
+    for item in subcrate["@graph"]:
+        if item["@id"] != "ro-crate-metadata.json":
+            item["@id"] += "-b"
+    subcrate["@graph"][0]["about"]["@id"] += "-b"
+    (tmp_path / "b.json").write_text(json.dumps(subcrate), encoding="utf-8")
+
+    subcrates = [item for item in data["@graph"] if "ro-crate-metadata" in item]
+    for item, path in zip(subcrates, ["a.json", "b.json", "missing.json"]):
+        item["ro-crate-metadata"] = path
+    for item in subcrates[3:]:
+        del item["ro-crate-metadata"]
+    return ROCrateV1_2.model_validate(data), tmp_path
+
+
+@pytest.mark.parametrize("workers, processes", [(1, False), (2, False), (2, True)])
+def test_build_indexes_subcrates(release, workers, processes):
+    crate, base_dir = release
+    index = GlobalIndex.build(crate, base_dir, workers=workers, processes=processes)
+
+    subcrate = ROCrateV1_2.model_validate_json(SUBCRATE.read_text())
+    dataset = subcrate.getDatasets()[0]
+    info = index[dataset.guid]
+    assert info["@type"] == list(dataset.metadataType)
+    assert info["fileFormat"] == dataset.fileFormat
+    assert info["rocrateName"] == subcrate.getCrateMetadata().name
+    assert dataset.guid + "-b" in index
+    assert len(index) == 2 * (len(subcrate.metadataGraph) - 1)
+    assert [error.error_type for error in index.errors] == ["FileNotFoundError"]
+
+
+def test_update_reads_changed_subcrates(release):
+    crate, base_dir = release
+    index = GlobalIndex.build(crate, base_dir, workers=1)
+    first = dict(index.entries)
+
+    path = base_dir / "b.json"
+    data = json.loads(path.read_text())
+    data["@graph"] = data["@graph"][:2]
+    path.write_text(json.dumps(data))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    index.update(crate, base_dir, workers=1)
+
+    b_guids = {guid for guid in first if guid.endswith("-b")}
+    assert {guid for guid in index if guid.endswith("-b")} == {item["@id"] for item in data["@graph"][1:]}
+    assert all(index.entries[guid] is entry for guid, entry in first.items() if guid not in b_guids)
+
+
+def test_save_and_load(release, tmp_path):
+    crate, base_dir = release
+    index = GlobalIndex.build(crate, base_dir, workers=1)
+    index.save(tmp_path / "index.pickle")
+
+    loaded = GlobalIndex.load(tmp_path / "index.pickle")
+    assert loaded.entries == index.entries
+    assert not [path for path in loaded.sources if loaded._changed(path)]
+    assert loaded.owners == index.owners
+    assert len(GlobalIndex.load(tmp_path / "absent.pickle")) == 0
+
+
+def test_load_ignores_other_format(release, tmp_path, monkeypatch):
+    crate, base_dir = release
+    GlobalIndex.build(crate, base_dir, workers=1).save(tmp_path / "index.pickle")
+
+    monkeypatch.setattr("fairscape_models.conversion.global_index.INDEX_FORMAT", 0)
+    assert len(GlobalIndex.load(tmp_path / "index.pickle")) == 0
+
+
+def test_drop_keeps_elements_of_other_subcrates(release):
+    crate, base_dir = release
+    (base_dir / "b.json").write_text((base_dir / "a.json").read_text())
+    index = GlobalIndex.build(crate, base_dir, workers=1)
+    guids = {guid for guid, _ in crate_entries(ROCrateV1_2.model_validate_json(SUBCRATE.read_text()))}
+    assert set(index) == guids
+
+    a, b = sorted(index.sources)
+    index._drop(b)
+    assert set(index) == guids
+    index._drop(a)
+    assert len(index) == 0 and index.owners == {}
+
+
+def test_drop_keeps_added_crates(release):
+    crate, base_dir = release
+    index = GlobalIndex.build(crate, base_dir, workers=1)
+    subcrate = ROCrateV1_2.model_validate_json(SUBCRATE.read_text())
+    index.add_crate(subcrate)
+
+    index._drop(sorted(index.sources)[0])
+    assert subcrate.getDatasets()[0].guid in index
+
+
+def test_composition_details_read_the_index(release):
+    crate, base_dir = release
+    index = GlobalIndex.build(crate, base_dir, workers=1)
+    subcrate = ROCrateV1_2.model_validate_json(SUBCRATE.read_text())
+
+    with_index = ROCToTargetConverter(subcrate, DISTRIBUTION_MAPPING_CONFIGURATION, global_index=index)
+    with_dicts = ROCToTargetConverter(subcrate, DISTRIBUTION_MAPPING_CONFIGURATION, global_index={guid: index[guid] for guid in index})
+    root = subcrate.getCrateMetadata()
+    assert build_composition_details(with_index, root) == build_composition_details(with_dicts, root)
+
+
+def test_index_entry_reads_extras():
+    entity = ROCrateV1_2.validate_graph_element({
+        "@id": "ark:59852/line", "@type": "BioChemEntity", "name": "HEK293",
+        "organism": {"name": "Homo sapiens"}, "EVI:outputs": [{"@id": "ark:59852/out"}],
+    })
+    info = index_entry(entity, "Crate").info()
+    assert info["organism"] == {"name": "Homo sapiens"}
+    assert info["outputs"] == [{"@id": "ark:59852/out"}]
+    assert "fileFormat" not in info
+    assert info["normalizedType"] == "Other"
+
+
+def test_inputs_without_format_are_labelled_by_type():
+    instrument = ROCrateV1_2.validate_graph_element({
+        "@id": "ark:59852/scope", "@type": "https://w3id.org/EVI#Instrument", "name": "Scope",
+        "manufacturer": "Acme", "model": "S1", "description": "A microscope.",
+    })
+    global_index = {
+        "ark:59852/scope": index_entry(instrument).info(),
+        "ark:59852/line": {"@type": ["BioChemEntity"], "name": "HEK293"},
+        # entries assembled by callers carry no normalizedType
+        "ark:59852/tool": {"@type": "SoftwareSourceCode", "name": "Tool"},
+    }
+    assert global_index["ark:59852/scope"]["normalizedType"] == "Instrument"
+    root = types.SimpleNamespace(name="Release", inputs=[{"@id": "ark:59852/scope"}, {"@id": "ark:59852/line"}, {"@id": "ark:59852/tool"}])
+
+    assert _calculate_input_datasets(root, global_index) == {"Instrument": 1, "Sample": 1, "Software": 1}
+
+
+@pytest.mark.parametrize("types, expected", [
+    (["prov:Entity", "https://w3id.org/EVI#Dataset"], "Dataset"),
+    ("SoftwareSourceCode", "Software"),
+    ("EVI:Computation", "Computation"),
+    (["Thing"], "Other"),
+    (None, "Other"),
+])
+def test_normalize_type(types, expected):
+    class Item:
+        metadataType = types
+
+    assert _normalize_type(Item()) == expected
+
+
+def test_normalize_type_is_cached():
+    _normalize_type_name.cache_clear()
+    class Item:
+        metadataType = ["prov:Entity", "https://w3id.org/EVI#Dataset"]
+
+    _normalize_type(Item())
+    _normalize_type(Item())
+    assert _normalize_type_name.cache_info().hits == 1
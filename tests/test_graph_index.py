@@ -0,0 +1,295 @@
+import pytest
+
+from fairscape_models.rocrate import ROCrateV1_2, ROCrateMetadataElem
+from fairscape_models.dataset import Dataset
+from fairscape_models.software import Software
+from fairscape_models.computation import Computation
+from fairscape_models.activity import Activity
+from fairscape_models.graph_index import GraphIndex, GraphList
+
+
+@pytest.fixture
+def crate_data():
+    return {
+        "@context": {},
+        "@graph": [
+            {
+                "@id": "ro-crate-metadata.json",
+                "@type": "CreativeWork",
+                "conformsTo": {"@id": "https://w3id.org/ro/crate/1.2"},
+                "about": {"@id": "ark:59852/crate"}
+            },
+            {
+                "@id": "ark:59852/crate",
+                "@type": ["Dataset", "https://w3id.org/EVI#ROCrate"],
+                "name": "Crate", "description": "A crate for testing.", "keywords": [],
+                "version": "1.0", "author": "tester", "license": "MIT",
+                "hasPart": [{"@id": "ark:59852/input"}, {"@id": "ark:59852/output"}]
+            },
+            {
+                "@id": "ark:59852/input",
+                "@type": "https://w3id.org/EVI#Dataset",
+                "name": "Input", "author": "tester", "datePublished": "2024-01-01",
+                "description": "Input dataset.", "keywords": [], "format": "csv"
+            },
+            {
+                "@id": "ark:59852/software",
+                "@type": "https://w3id.org/EVI#Software",
+                "name": "Software", "author": "tester", "dateModified": "2024-01-01",
+                "description": "Some software.", "format": "py"
+            },
+            {
+                "@id": "ark:59852/computation",
+                "@type": "https://w3id.org/EVI#Computation",
+                "name": "Computation", "runBy": "tester", "dateCreated": "2024-01-01",
+                "description": "A computation.",
+                "usedSoftware": [{"@id": "ark:59852/software"}],
+                "usedDataset": [{"@id": "https://fairscape.net/ark:59852/input"}],
+                "generated": [{"@id": "ark:59852/output"}]
+            },
+            {
+                "@id": "ark:59852/output",
+                "@type": "https://w3id.org/EVI#Dataset",
+                "name": "Output", "author": "tester", "datePublished": "2024-01-01",
+                "description": "Output dataset.", "keywords": [], "format": "csv",
+                "generatedBy": [{"@id": "ark:59852/computation"}]
+            },
+            {
+                "@id": "ark:59852/activity",
+                "@type": "Activity",
+                "name": "Activity", "description": "A generic activity."
+            },
+        ]
+    }
+
+
+def _dataset(guid):
+    return Dataset.model_validate({
+        "@id": guid, "name": "New", "author": "tester", "datePublished": "2024-01-01",
+        "description": "A new dataset.", "keywords": [], "format": "csv"
+    })
+
+
+def test_graph_is_tracked(crate_data):
+    crate = ROCrateV1_2.model_validate(crate_data)
+    assert isinstance(crate.metadataGraph, GraphList)
+    assert isinstance(ROCrateV1_2.model_validate_graph(crate_data).metadataGraph, GraphList)
+
+
+def test_lookup_by_guid_and_type(crate_data):
+    crate = ROCrateV1_2.model_validate(crate_data)
+    assert crate.getEntity("ark:59852/computation") is crate.metadataGraph[4]
+    assert crate.getEntity("ark:59852/missing") is None
+    assert [d.guid for d in crate.getDatasets()] == ["ark:59852/input", "ark:59852/output"]
+    assert isinstance(crate.getCrateMetadata(), ROCrateMetadataElem)
+
+    # isinstance semantics across subclasses, in graph order
+    activities = crate.getEntitiesByType(Activity)
+    assert [a.guid for a in activities] == ["ark:59852/computation", "ark:59852/activity"]
+    assert [type(e) for e in crate.getEVIElements()] == [Dataset, Dataset, Software, Computation]
+
+
+def test_getters_return_copies(crate_data):
+    crate = ROCrateV1_2.model_validate(crate_data)
+    crate.getDatasets().clear()
+    assert len(crate.getDatasets()) == 2
+
+
+def test_index_is_reused_until_graph_mutates(crate_data):
+    crate = ROCrateV1_2.model_validate(crate_data)
+    index = crate.getGraphIndex()
+    assert crate.getGraphIndex() is index
+
+    crate.metadataGraph.append(_dataset("ark:59852/appended"))
+    assert crate.getGraphIndex() is not index
+    assert crate.getEntity("ark:59852/appended") is not None
+    assert len(crate.getDatasets()) == 3
+
+    crate.metadataGraph[2] = _dataset("ark:59852/replaced")
+    assert crate.getEntity("ark:59852/input") is None
+    assert crate.getEntity("ark:59852/replaced") is not None
+
+    del crate.metadataGraph[-1]
+    assert crate.getEntity("ark:59852/appended") is None
+
+
+def _index_state(crate):
+    index = crate.getGraphIndex()
+    return set(index.by_guid), {t: len(es) for t, es in index.by_type.items()}, [e.guid for e, _ in index.referenced_by("ark:59852/input")]
+
+
+def _fresh_state(crate):
+    index = GraphIndex(list(crate.metadataGraph))
+    return set(index.by_guid), {t: len(es) for t, es in index.by_type.items()}, [e.guid for e, _ in index.referenced_by("ark:59852/input")]
+
+
+def _referencing_input(guid):
+    return Activity.model_validate({"@id": guid, "@type": "Activity", "name": "Uses input", "description": "Uses the input.", "prov:used": [{"@id": "ark:59852/input"}]})
+
+
+@pytest.mark.parametrize("mutate", [
+    lambda graph: graph.append(_referencing_input("ark:59852/appended")),
+    lambda graph: graph.extend([_referencing_input("ark:59852/extended")]),
+    lambda graph: graph.insert(0, _referencing_input("ark:59852/inserted")),
+    lambda graph: graph.pop(4),
+    lambda graph: graph.remove(graph[2]),
+    lambda graph: graph.clear(),
+    lambda graph: graph.sort(key=lambda entity: entity.guid),
+    lambda graph: graph.reverse(),
+    lambda graph: graph.__setitem__(4, _referencing_input("ark:59852/set")),
+    lambda graph: graph.__setitem__(slice(0, 2), []),
+    lambda graph: graph.__delitem__(2),
+    lambda graph: graph.__iadd__([_referencing_input("ark:59852/added")]),
+    lambda graph: graph.__imul__(1),
+], ids=[
+    "append", "extend", "insert", "pop", "remove", "clear", "sort", "reverse",
+    "setitem", "setslice", "delitem", "iadd", "imul",
+])
+def test_graph_list_mutations_refresh_the_index(crate_data, mutate):
+    crate = ROCrateV1_2.model_validate(crate_data)
+    index = crate.getGraphIndex()
+    index.referenced_by("ark:59852/input")
+    version = crate.metadataGraph.version
+
+    mutate(crate.metadataGraph)
+    assert crate.metadataGraph.version == version + 1
+    assert crate.getGraphIndex() is not index
+    assert _index_state(crate) == _fresh_state(crate)
+
+
+def test_equality_ignores_the_index(crate_data):
+    a = ROCrateV1_2.model_validate(crate_data)
+    b = ROCrateV1_2.model_validate(crate_data)
+    a.getDatasets()
+    assert a == b
+    assert b == a
+    assert a != ROCrateV1_2.model_validate({**crate_data, "@graph": crate_data["@graph"][:3]})
+    assert a != a.metadataGraph[1]
+
+
+def test_string_references(crate_data):
+    crate_data["@graph"].append({
+        "@id": "ark:59852/string-activity", "@type": "Activity", "name": "Strings", "description": "String references.",
+        "prov:used": ["ark:59852/input"], "extra": "ark:59852/input",
+        "extraReference": {"@id": "ark:59852/input"}, "extraReferences": [{"@id": "ark:59852/input"}, "ark:59852/input"],
+    })
+    crate = ROCrateV1_2.model_validate(crate_data)
+    referencing = crate.getGraphIndex().referenced_by("ark:59852/input")
+    assert ("ark:59852/string-activity", "prov:used") in {(e.guid, key) for e, key in referencing}
+    # strings in extra properties and other fields are not references
+    assert ("ark:59852/string-activity", "extra") not in {(e.guid, key) for e, key in referencing}
+    assert [key for e, key in referencing if e.guid == "ark:59852/string-activity"].count("extraReferences") == 1
+    assert ("ark:59852/string-activity", "extraReference") in {(e.guid, key) for e, key in referencing}
+    assert crate.getGraphIndex().referenced_by("Strings") == []
+
+
+def test_index_follows_reassigned_plain_list(crate_data):
+    crate = ROCrateV1_2.model_validate(crate_data)
+    crate.getGraphIndex()
+    crate.metadataGraph = list(crate.metadataGraph[:3])
+    assert isinstance(crate.metadataGraph, GraphList)
+    assert crate.getEntity("ark:59852/computation") is None
+
+    crate.metadataGraph.append(_dataset("ark:59852/plain"))
+    assert crate.getEntity("ark:59852/plain") is not None
+
+
+def test_constructed_crate_keeps_a_graph_list(crate_data):
+    crate = ROCrateV1_2.model_validate(crate_data)
+    constructed = ROCrateV1_2.model_construct(context={}, metadataGraph=list(crate.metadataGraph))
+    assert isinstance(constructed.metadataGraph, GraphList)
+    assert constructed.getEntity("ark:59852/input") is crate.getEntity("ark:59852/input")
+    assert ROCrateV1_2.model_construct().context == ROCrateV1_2.model_fields["context"].default
+
+
+def test_index_over_a_plain_list_compares_a_snapshot(crate_data):
+    graph = list(ROCrateV1_2.model_validate(crate_data).metadataGraph)
+    index = GraphIndex(graph)
+    assert index.matches(graph)
+    graph.append(_dataset("ark:59852/plain"))
+    assert not index.matches(graph)
+
+
+def test_index_after_clean_identifiers(crate_data):
+    crate_data["@graph"][2]["@id"] = "https://fairscape.net/ark:59852/input"
+    crate = ROCrateV1_2.model_validate(crate_data)
+    crate.getGraphIndex()
+    crate.cleanIdentifiers()
+    assert crate.getEntity("ark:59852/input") is not None
+
+
+def test_referencing_entities(crate_data):
+    crate = ROCrateV1_2.model_validate(crate_data)
+    referencing = crate.getGraphIndex().referenced_by("ark:59852/input")
+    assert {(e.guid, key) for e, key in referencing} == {
+        ("ark:59852/crate", "hasPart"),
+        ("ark:59852/computation", "usedDataset"),
+        ("ark:59852/computation", "prov:used"),
+    }
+    assert [e.guid for e in crate.getReferencingEntities("ark:59852/input")] == [
+        "ark:59852/crate", "ark:59852/computation"
+    ]
+    assert crate.getReferencingEntities("ark:59852/nothing-points-here") == []
+
+
+def test_graph_index_on_plain_list(crate_data):
+    crate = ROCrateV1_2.model_validate(crate_data)
+    graph = list(crate.metadataGraph)
+    index = GraphIndex(graph)
+    assert index.matches(graph)
+    graph.pop()
+    assert not index.matches(graph)
+
+
+def test_to_columns(crate_data):
+    crate_data["@graph"][2].update({"contentSize": "2 KB", "md5": ["a", "b"]})
+    crate = ROCrateV1_2.model_validate(crate_data)
+
+    columns = crate.to_columns()
+    assert list(columns["guid"]) == [e.guid for e in crate.metadataGraph]
+    assert all(len(values) == len(crate.metadataGraph) for values in columns.values())
+    row = columns["guid"].index("ark:59852/input")
+    assert {name: values[row] for name, values in columns.items()} == {
+        "guid": "ark:59852/input", "type": "Dataset", "name": "Input", "fileFormat": "csv",
+        "contentSize": 2048, "md5": "a,b", "sha256": None, "datePublished": "2024-01-01",
+        "references": 2, "referencedBy": 3,  # author "tester" and its prov:wasAttributedTo mirror
+    }
+
+    datasets = crate.to_columns(types=[Dataset, Software], fields=["guid", "references"])
+    assert datasets == {
+        "guid": ["ark:59852/input", "ark:59852/software", "ark:59852/output"],
+        # author strings, plus generatedBy and its prov:wasGeneratedBy mirror on the output
+        "references": [2, 2, 4],
+    }
+    with pytest.raises(ValueError, match="Unknown columns"):
+        crate.to_columns(fields=["guid", "size"])
+
+
+def test_to_columns_as_numpy(crate_data):
+    numpy = pytest.importorskip("numpy")
+    crate = ROCrateV1_2.model_validate(crate_data)
+    columns = crate.to_columns(types=[Dataset], array="numpy")
+    assert columns["referencedBy"].dtype == numpy.int64
+    assert numpy.isnan(columns["contentSize"]).all()
+
+
+def test_to_columns_as_arrow(crate_data):
+    pa = pytest.importorskip("pyarrow")
+    crate = ROCrateV1_2.model_validate(crate_data)
+    columns = crate.to_columns(fields=["guid", "referencedBy"], array="arrow")
+    assert columns["referencedBy"].type == pa.int64()
+    assert columns["guid"].to_pylist() == [e.guid for e in crate.metadataGraph]
+
+
+def test_to_columns_unknown_array(crate_data):
+    crate = ROCrateV1_2.model_validate(crate_data)
+    with pytest.raises(ValueError, match="Unknown array type 'pandas'"):
+        crate.to_columns(array="pandas")
+
+
+def test_graph_list_pickles(crate_data):
+    import pickle
+    crate = ROCrateV1_2.model_validate(crate_data)
+    copy = pickle.loads(pickle.dumps(crate))
+    assert isinstance(copy.metadataGraph, GraphList)
+    assert copy.getEntity("ark:59852/input").name == "Input"
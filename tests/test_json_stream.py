@@ -0,0 +1,99 @@
+import io
+import json
+import pytest
+
+from fairscape_models.json_stream import ValueTooLargeError, iter_json_array
+
+
+DOCUMENT = {
+    "@context": {"@vocab": "https://schema.org/", "nested": {"a": [1, 2, {"b": "]}"}]}},
+    "@graph": [
+        {"@id": "ark:59852/one", "name": "café ☃", "size": 12345},
+        {"@id": "ark:59852/two", "values": [1.5, -2e3, True, None, "a,b"]},
+        [],
+        42,
+    ],
+    "after": "never read",
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 1 << 16])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_json_array_matches_json_load(chunk_size, indent):
+    text = json.dumps(DOCUMENT, indent=indent, ensure_ascii=False)
+    items = list(iter_json_array(io.StringIO(text), "@graph", chunk_size=chunk_size))
+    assert items == DOCUMENT["@graph"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5])
+def test_iter_json_array_binary_stream(chunk_size):
+    raw = json.dumps(DOCUMENT, ensure_ascii=False).encode("utf-8")
+    stream = io.BytesIO(raw)
+    items = list(iter_json_array(stream, "@graph", chunk_size=chunk_size))
+    assert items == DOCUMENT["@graph"]
+    assert not stream.closed
+
+
+def test_iter_json_array_is_lazy():
+    stream = io.StringIO('{"@graph": [{"@id": "a"}, {"@id": "b"}, oops')
+    items = iter_json_array(stream, "@graph", chunk_size=4)
+    assert next(items) == {"@id": "a"}
+    assert next(items) == {"@id": "b"}
+    with pytest.raises(ValueError):
+        next(items)
+
+
+def test_iter_json_array_empty_array():
+    assert list(iter_json_array(io.StringIO('{"@graph": [ ]}'), "@graph")) == []
+
+
+@pytest.mark.parametrize("text", ['{}', '{"@context": {}}', '[]', '{"@graph": {}}'])
+def test_iter_json_array_missing_or_invalid_key(text):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO(text), "@graph"))
+
+
+@pytest.mark.parametrize("text", ['{', '{"@graph": [', '{1: []}'])
+def test_iter_json_array_truncated_or_malformed(text):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO(text), "@graph"))
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self, text):
+        super().__init__(text)
+        self.consumed = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.consumed += len(chunk)
+        return chunk
+
+
+def test_iter_json_array_stops_early_on_malformed_value():
+    stream = _CountingStream('{"@graph": [{"@id": "a"}, {"@id": "b" "broken": ' + " " * 100_000 + "1}]}")
+    items = iter_json_array(stream, "@graph", chunk_size=16, max_value_size=64)
+    assert next(items) == {"@id": "a"}
+    with pytest.raises(ValueError, match="Malformed JSON value"):
+        next(items)
+    assert stream.consumed < 1000
+
+
+def test_iter_json_array_reports_values_over_the_limit():
+    value = {"@id": "a", "text": "x" * 100_000}
+    stream = _CountingStream(json.dumps({"@graph": [value, {"@id": "b"}]}))
+    with pytest.raises(ValueTooLargeError, match="longer than max_value_size"):
+        list(iter_json_array(stream, "@graph", chunk_size=16, max_value_size=1000))
+    assert stream.consumed < 10_000
+
+    stream = io.StringIO(json.dumps({"@graph": [value]}))
+    assert list(iter_json_array(stream, "@graph", chunk_size=16, max_value_size=200_000)) == [value]
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 13))
+def test_iter_json_array_reads_on_for_tokens_cut_by_a_chunk(chunk_size):
+    text = '{"@graph": [{"a": true, "b": false}, null, -Infinity, "\\u2603 snow", 12345.5e-3]}'
+    items = list(iter_json_array(io.StringIO(text), "@graph", chunk_size=chunk_size))
+    assert items[:2] == [{"a": True, "b": False}, None]
+    assert items[2] == float("-inf")
+    assert items[3:] == ["\u2603 snow", 12345.5e-3]
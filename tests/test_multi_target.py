@@ -0,0 +1,52 @@
+import pathlib
+
+import pytest
+
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.conversion.converter import ROCToTargetConverter
+from fairscape_models.conversion.d4d_converter import D4DConverter
+from fairscape_models.conversion.mapping.AIReady import score_rocrate_with_errors
+from fairscape_models.conversion.multi_target import MAPPING_TARGETS, MULTI_TARGETS, convert_targets, dump_graph
+
+TEST_ROCRATES_PATH = pathlib.Path(__file__).parent / "test_rocrates"
+test_files = sorted(TEST_ROCRATES_PATH.rglob("ro-crate-metadata.json"))
+test_ids = [str(p.relative_to(TEST_ROCRATES_PATH)) for p in test_files]
+
+
+def _load(path):
+    return ROCrateV1_2.model_validate_json(path.read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+def test_outputs_match_separate_conversions(rocrate_file_path):
+    outputs = convert_targets(_load(rocrate_file_path))
+    assert set(outputs) == set(MULTI_TARGETS)
+
+    for target, configuration in MAPPING_TARGETS.items():
+        expected = ROCToTargetConverter(_load(rocrate_file_path), configuration).convert()
+        assert outputs[target].model_dump() == expected.model_dump()
+    expected = score_rocrate_with_errors(_load(rocrate_file_path))
+    assert outputs["ai_ready"].score.model_dump() == expected.score.model_dump()
+    assert outputs["ai_ready"].errors == expected.errors
+    d4d = D4DConverter(_load(rocrate_file_path))
+    d4d.convert()
+    assert outputs["d4d"] == d4d.d4dOutput
+
+
+def test_requested_targets_only():
+    outputs = convert_targets(_load(test_files[0]), ["croissant"])
+    assert list(outputs) == ["croissant"]
+    with pytest.raises(ValueError, match="Unknown conversion targets"):
+        convert_targets(_load(test_files[0]), ["croissant", "html"])
+
+
+def test_dump_graph_reads_each_element_once():
+    crate = _load(test_files[0])
+    converter = ROCToTargetConverter(crate, MAPPING_TARGETS["croissant"])
+    root = converter.root_entity
+    dumps = dump_graph(crate, [converter], root_id=root.guid)
+
+    assert len(dumps) == len(crate.metadataGraph)
+    assert dumps[crate.metadataGraph.index(root)] == root.model_dump(by_alias=True)
+    dataset = crate.getDatasets()[0]
+    assert set(dumps[crate.metadataGraph.index(dataset)]) <= converter.source_keys(dataset)
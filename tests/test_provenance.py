@@ -0,0 +1,145 @@
+import pytest
+
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.dataset import Dataset
+from fairscape_models.provenance import ProvenanceIndex
+
+
+def _dataset(guid, **extra):
+    return {
+        "@id": guid, "@type": "https://w3id.org/EVI#Dataset",
+        "name": guid, "author": "tester", "datePublished": "2024-01-01",
+        "description": "A dataset.", "keywords": [], "format": "csv", **extra
+    }
+
+
+def _computation(guid, **extra):
+    return {
+        "@id": guid, "@type": "https://w3id.org/EVI#Computation",
+        "name": guid, "runBy": "tester", "dateCreated": "2024-01-01",
+        "description": "A computation.", **extra
+    }
+
+
+@pytest.fixture
+def crate():
+    return ROCrateV1_2.model_validate({
+        "@context": {},
+        "@graph": [
+            {
+                "@id": "ro-crate-metadata.json",
+                "@type": "CreativeWork",
+                "conformsTo": {"@id": "https://w3id.org/ro/crate/1.2"},
+                "about": {"@id": "ark:59852/crate"}
+            },
+            {
+                "@id": "ark:59852/crate",
+                "@type": ["Dataset", "https://w3id.org/EVI#ROCrate"],
+                "name": "Crate", "description": "A crate for testing.", "keywords": [],
+                "version": "1.0", "author": "tester", "license": "MIT", "hasPart": []
+            },
+            _dataset("ark:59852/raw"),
+            {
+                "@id": "ark:59852/software", "@type": "https://w3id.org/EVI#Software",
+                "name": "Software", "author": "tester", "dateModified": "2024-01-01",
+                "description": "Some software.", "format": "py"
+            },
+            _computation(
+                "ark:59852/clean",
+                usedDataset=[{"@id": "https://fairscape.net/ark:59852/raw"}],
+                usedSoftware=[{"@id": "ark:59852/software"}],
+                generated=[{"@id": "ark:59852/cleaned"}]
+            ),
+            _dataset("ark:59852/cleaned", generatedBy=[{"@id": "ark:59852/clean"}]),
+            _computation(
+                "ark:59852/train",
+                usedDataset=[{"@id": "ark:59852/cleaned"}]
+            ),
+            {
+                "@id": "ark:59852/model", "@type": "https://w3id.org/EVI#MLModel",
+                "name": "Model", "author": "tester", "keywords": [],
+                "description": "A trained model.", "format": "onnx",
+                "generatedBy": {"@id": "ark:59852/train"}
+            },
+            _dataset("ark:59852/subset", derivedFrom=[{"@id": "ark:59852/cleaned"}]),
+        ]
+    })
+
+
+def test_upstream_follows_all_provenance_properties(crate):
+    index = crate.getProvenanceIndex()
+    assert index.upstream("ark:59852/model") == [
+        "ark:59852/train", "ark:59852/cleaned", "ark:59852/clean",
+        "ark:59852/raw", "ark:59852/software",
+    ]
+    assert index.parents("ark:59852/subset") == ["ark:59852/cleaned"]
+
+
+def test_downstream_and_depth(crate):
+    index = crate.getProvenanceIndex()
+    assert index.downstream("ark:59852/raw", depth=1) == ["ark:59852/clean"]
+    assert set(index.downstream("ark:59852/raw")) == {
+        "ark:59852/clean", "ark:59852/cleaned", "ark:59852/train",
+        "ark:59852/model", "ark:59852/subset",
+    }
+    assert index.downstream("ark:59852/model") == []
+    assert index.upstream("ark:59852/unknown") == []
+
+
+def test_prov_mirrors_do_not_duplicate_edges(crate):
+    # generatedBy is mirrored into prov:wasGeneratedBy and generated references the same pair
+    index = crate.getProvenanceIndex()
+    assert index.parents("ark:59852/cleaned") == ["ark:59852/clean"]
+    assert index.children("ark:59852/clean") == ["ark:59852/cleaned"]
+
+
+def test_guids_are_normalized(crate):
+    index = crate.getProvenanceIndex()
+    assert index.upstream("https://fairscape.net/ark:59852/clean", depth=1) == [
+        "ark:59852/raw", "ark:59852/software"
+    ]
+
+
+def test_cycles_terminate():
+    first = Dataset.model_validate(_dataset("ark:59852/a", derivedFrom=[{"@id": "ark:59852/b"}]))
+    second = Dataset.model_validate(_dataset("ark:59852/b", derivedFrom=[{"@id": "ark:59852/a"}]))
+    index = ProvenanceIndex([first, second])
+    assert index.upstream("ark:59852/a") == ["ark:59852/b"]
+    assert index.downstream("ark:59852/a") == ["ark:59852/b"]
+
+
+def test_prefixed_extra_properties_are_indexed():
+    annotation = {
+        "@id": "ark:59852/note", "@type": "https://w3id.org/EVI#Annotation",
+        "name": "Note", "createdBy": "tester", "dateCreated": "2024-01-01",
+        "description": "An annotation.",
+        "evi:annotates": {"@id": "ark:59852/raw"},
+    }
+    crate = ROCrateV1_2.model_validate({"@context": {}, "@graph": [_dataset("ark:59852/raw"), annotation]})
+    assert crate.getProvenanceIndex().downstream("ark:59852/raw") == ["ark:59852/note"]
+
+
+def test_index_is_cached_and_rebuilt_on_mutation(crate):
+    index = crate.getProvenanceIndex()
+    assert crate.getProvenanceIndex() is index
+
+    crate.metadataGraph.append(
+        Dataset.model_validate(_dataset("ark:59852/report", derivedFrom=[{"@id": "ark:59852/model"}]))
+    )
+    rebuilt = crate.getProvenanceIndex()
+    assert rebuilt is not index
+    assert rebuilt.downstream("ark:59852/model") == ["ark:59852/report"]
+
+
+def test_plain_string_references_and_self_loops():
+    annotation = {
+        "@id": "ark:59852/note", "@type": "https://w3id.org/EVI#Annotation",
+        "name": "Note", "createdBy": "tester", "dateCreated": "2024-01-01",
+        "description": "An annotation.",
+        "evi:annotates": ["ark:59852/raw", ""],
+    }
+    looped = _dataset("ark:59852/raw", derivedFrom=[{"@id": "ark:59852/raw"}])
+    crate = ROCrateV1_2.model_validate({"@context": {}, "@graph": [looped, annotation]})
+    index = crate.getProvenanceIndex()
+    assert index.downstream("ark:59852/raw") == ["ark:59852/note"]
+    assert index.upstream("ark:59852/raw") == []
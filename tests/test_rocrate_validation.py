@@ -1,5 +1,7 @@
 # tests/test_rocrate_validation.py
 
+import copy
+import json
 import pytest
 import pathlib
 from pydantic import ValidationError
@@ -233,6 +235,44 @@ def test_clean_identifiers_with_none_fields():
     assert True
 
 
+def test_clean_identifiers_keeps_other_references():
+    """cleanIdentifiers only rewrites guids and the provenance reference fields."""
+    data = {
+        "@context": {},
+        "@graph": [
+            {
+                "@id": "ro-crate-metadata.json",
+                "@type": "CreativeWork",
+                "conformsTo": {"@id": "https://w3id.org/ro/crate/1.1"},
+                "about": {"@id": "ark:59852/test-crate"}
+            },
+            {
+                "@id": "ark:59852/test-crate",
+                "@type": ["Dataset", "https://w3id.org/EVI#ROCrate"],
+                "name": "Test Crate", "description": "A test crate for validation", "keywords": [],
+                "version": "1.0", "author": "tester", "license": "MIT",
+                "hasPart": [{"@id": "https://fairscape.net/ark:59852/test-dataset"}]
+            },
+            {
+                "@id": "https://fairscape.net/ark:59852/test-dataset",
+                "@type": "https://w3id.org/EVI#Dataset",
+                "name": "Test Dataset", "author": "tester", "datePublished": "2024-01-01",
+                "description": "A test dataset", "keywords": [], "format": "text/plain",
+                "isPartOf": [{"@id": "https://fairscape.net/ark:59852/test-crate"}],
+                "derivedFrom": [{"@id": "https://fairscape.net/ark:59852/source"}]
+            }
+        ]
+    }
+    rocrate = ROCrateV1_2.model_validate(data)
+    rocrate.cleanIdentifiers()
+
+    dataset = rocrate.getDatasets()[0]
+    assert dataset.guid == "ark:59852/test-dataset"
+    assert dataset.derivedFrom[0].guid == "ark:59852/source"
+    assert dataset.isPartOf[0].guid == "https://fairscape.net/ark:59852/test-crate"
+    assert rocrate.getCrateMetadata().hasPart[0].guid == "https://fairscape.net/ark:59852/test-dataset"
+
+
 def test_clean_identifiers_with_single_identifier():
     """Test cleanIdentifiers with single IdentifierValue (not a list) in generatedBy."""
     data = {
@@ -772,4 +812,290 @@ def test_root_conforms_to_fairscape_profile():
     if isinstance(elem.conformsTo, list):
         assert any(c.guid == target for c in elem.conformsTo)
     else:
-        assert elem.conformsTo.guid == target
\ No newline at end of file
+        assert elem.conformsTo.guid == target
+
+# ── single-pass graph validation ────────────────────────────────────────
+
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+def test_model_validate_graph_matches_model_validate(rocrate_file_path: pathlib.Path):
+    """The single-pass path builds the same crate as the regular validator."""
+    import json
+    data = json.loads(rocrate_file_path.read_text(encoding="utf-8"))
+    expected = ROCrateV1_2.model_validate(json.loads(rocrate_file_path.read_text(encoding="utf-8")))
+    crate = ROCrateV1_2.model_validate_graph(data)
+
+    assert [type(e) for e in crate.metadataGraph] == [type(e) for e in expected.metadataGraph]
+    assert crate.model_dump(by_alias=True) == expected.model_dump(by_alias=True)
+
+
+def test_model_validate_graph_dispatch(comprehensive_rocrate_data):
+    crate = ROCrateV1_2.model_validate_graph(comprehensive_rocrate_data)
+    types = [type(e) for e in crate.metadataGraph]
+    assert Computation in types  # "EVI:Computation" prefixed type
+    assert types[-1] is GenericMetadataElem  # unknown "OtherEntity"
+
+
+def test_model_validate_graph_errors():
+    with pytest.raises(ValueError, match="Metadata element must have @type field"):
+        ROCrateV1_2.model_validate_graph({"@context": {}, "@graph": [{"@id": "test"}]})
+    with pytest.raises(ValidationError, match="Input should be a valid dictionary"):
+        ROCrateV1_2.model_validate_graph({"@context": {}, "@graph": ["a-string-in-the-graph"]})
+    with pytest.raises(ValidationError):
+        ROCrateV1_2.model_validate_graph({
+            "@context": {},
+            "@graph": [{"@id": "ark:59852/invalid-dataset", "@type": "Dataset", "name": "Invalid"}]
+        })
+    with pytest.raises(ValidationError) as excinfo:
+        ROCrateV1_2.model_validate_graph(["not", "a", "crate"])
+    assert excinfo.value.errors()[0]["type"] == "model_type"
+
+
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+def test_model_validate_graph_json_matches_model_validate_graph(rocrate_file_path: pathlib.Path):
+    """Validating from JSON text builds the same crate, before and after a write round trip."""
+    text = rocrate_file_path.read_text(encoding="utf-8")
+    expected = ROCrateV1_2.model_validate_graph(json.loads(text))
+    for document in (text, expected.model_dump_json(by_alias=True)):
+        crate = ROCrateV1_2.model_validate_graph_json(document)
+        assert [type(e) for e in crate.metadataGraph] == [type(e) for e in expected.metadataGraph]
+        assert crate == expected
+        assert crate.model_dump(by_alias=True) == expected.model_dump(by_alias=True)
+
+
+def test_model_validate_graph_json_keeps_repeated_keys():
+    element = {
+        "@id": "ark:59852/thing", "@type": "Thing", "metadataType": "Thing", "name": "Thing"
+    }
+    crate = ROCrateV1_2.model_validate_graph_json(json.dumps({"@context": {}, "@graph": [element]}))
+    assert crate.metadataGraph[0].model_extra == {"metadataType": "Thing", "name": "Thing"}
+
+
+def test_model_validate_graph_json_errors():
+    with pytest.raises(ValueError, match="Metadata element must have @type field"):
+        ROCrateV1_2.model_validate_graph_json('{"@context": {}, "@graph": [{"@id": "test"}]}')
+    with pytest.raises(ValidationError, match="Input should be a valid dictionary"):
+        ROCrateV1_2.model_validate_graph_json('{"@context": {}, "@graph": ["a-string-in-the-graph"]}')
+    with pytest.raises(ValidationError) as excinfo:
+        ROCrateV1_2.model_validate_graph_json('{"@context": {}}')
+    assert excinfo.value.errors()[0]["loc"] == ("@graph",)
+    with pytest.raises(json.JSONDecodeError):
+        ROCrateV1_2.model_validate_graph_json('{"@graph": [')
+
+
+def test_model_validate_graph_json_follows_the_type_map():
+    class ShortCrate(ROCrateV1_2):
+        graphTypeMap = {"Dataset": Dataset}
+
+    text = json.dumps({"@graph": [{"@id": "ark:59852/software", "@type": "Software", "name": "Software"}]})
+    crate = ShortCrate.model_validate_graph_json(text)
+    assert type(crate.metadataGraph[0]) is GenericMetadataElem
+    assert crate.context == ROCrateV1_2.model_fields["context"].default
+    # the default type map validates it as an incomplete Software element
+    with pytest.raises(ValidationError, match="Software"):
+        ROCrateV1_2.model_validate_graph_json(text)
+
+
+def test_graph_type_resolver_is_cached_per_class():
+    resolver = ROCrateV1_2.graph_type_resolver()
+    assert resolver is ROCrateV1_2.graph_type_resolver()
+    assert resolver("https://w3id.org/EVI#Dataset") is Dataset
+    assert resolver(["Dataset", "https://w3id.org/EVI#ROCrate"]) is ROCrateMetadataElem
+    assert resolver("evi:Software") is Software
+    assert resolver("SomethingElse") is GenericMetadataElem
+    assert resolver([]) is GenericMetadataElem
+
+
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+def test_iter_entities_matches_model_validate(rocrate_file_path: pathlib.Path):
+    """Streaming yields the same typed elements as full validation."""
+    expected = ROCrateV1_2.model_validate_json(rocrate_file_path.read_text(encoding="utf-8"))
+
+    streamed = list(ROCrateV1_2.iter_entities(rocrate_file_path))
+    assert [type(e) for e in streamed] == [type(e) for e in expected.metadataGraph]
+    assert [e.model_dump(by_alias=True) for e in streamed] == [
+        e.model_dump(by_alias=True) for e in expected.metadataGraph
+    ]
+
+    with open(rocrate_file_path, "r", encoding="utf-8") as f:
+        assert len(list(ROCrateV1_2.iter_entities(f))) == len(streamed)
+
+
+def test_iter_entities_errors():
+    import io
+    with pytest.raises(ValueError, match="Metadata element must have @type field"):
+        list(ROCrateV1_2.iter_entities(io.StringIO('{"@graph": [{"@id": "test"}]}')))
+    with pytest.raises(ValueError, match="must be a JSON object"):
+        list(ROCrateV1_2.iter_entities(io.StringIO('{"@graph": ["a-string-in-the-graph"]}')))
+
+
+def test_iter_entities_max_value_size(tmp_path):
+    from fairscape_models.json_stream import ValueTooLargeError
+    path = tmp_path / "ro-crate-metadata.json"
+    path.write_text(json.dumps({"@graph": [{"@id": "ark:59852/big", "@type": "Thing", "name": "x" * 200_000}]}))
+    with pytest.raises(ValueTooLargeError, match="max_value_size"):
+        list(ROCrateV1_2.iter_entities(path, max_value_size=100_000))
+    assert next(ROCrateV1_2.iter_entities(path, max_value_size=300_000)).name == "x" * 200_000
+
+
+# ── parallel graph validation ───────────────────────────────────────────
+
+def _spy_on_parallel_path(monkeypatch):
+    """ Record the crates assembled from validated chunks and the process pools started """
+    import fairscape_models.rocrate as rocrate_module
+    calls = {"assembled": 0, "pools": 0}
+    from_validated_graph = ROCrateV1_2._from_validated_graph.__func__
+
+    def assembled(cls, data, validated):
+        calls["assembled"] += 1
+        return from_validated_graph(cls, data, validated)
+
+    class Pool(rocrate_module.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            calls["pools"] += 1
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(ROCrateV1_2, "_from_validated_graph", classmethod(assembled))
+    monkeypatch.setattr(rocrate_module, "ProcessPoolExecutor", Pool)
+    return calls
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_model_validate_parallel_matches_model_validate(comprehensive_rocrate_data, workers, monkeypatch):
+    # model_validate replaces the @graph dicts of its input with models
+    expected = ROCrateV1_2.model_validate(copy.deepcopy(comprehensive_rocrate_data))
+    calls = _spy_on_parallel_path(monkeypatch)
+    crate = ROCrateV1_2.model_validate_parallel(comprehensive_rocrate_data, workers=workers, chunk_size=2)
+
+    assert calls == {"assembled": 1, "pools": int(workers > 1)}
+    assert [type(e) for e in crate.metadataGraph] == [type(e) for e in expected.metadataGraph]
+    assert crate.model_dump(by_alias=True) == expected.model_dump(by_alias=True)
+
+
+def test_model_validate_parallel_default_chunks(comprehensive_rocrate_data, monkeypatch):
+    calls = _spy_on_parallel_path(monkeypatch)
+    crate = ROCrateV1_2.model_validate_parallel(comprehensive_rocrate_data, workers=1)
+    assert calls == {"assembled": 1, "pools": 0}
+    assert len(crate.metadataGraph) == len(comprehensive_rocrate_data["@graph"])
+
+
+def test_model_validate_parallel_falls_back(comprehensive_rocrate_data, monkeypatch):
+    calls = _spy_on_parallel_path(monkeypatch)
+    with pytest.raises(ValidationError):
+        ROCrateV1_2.model_validate_parallel(["not", "a", "crate"])
+    data = dict(comprehensive_rocrate_data, **{"@context": "https://w3id.org/ro/crate/1.2/context"})
+    with pytest.raises(ValidationError) as parallel:
+        ROCrateV1_2.model_validate_parallel(data)
+    with pytest.raises(ValidationError) as serial:
+        ROCrateV1_2.model_validate(data)
+    assert parallel.value.errors() == serial.value.errors()
+    assert calls["assembled"] == 0
+
+
+def test_model_validate_parallel_rejects_empty_chunks(comprehensive_rocrate_data):
+    with pytest.raises(ValueError, match="chunk_size"):
+        ROCrateV1_2.model_validate_parallel(comprehensive_rocrate_data, chunk_size=0)
+
+
+_PARALLEL_DATASET = {
+    "@id": "ark:59852/dataset", "@type": "Dataset", "name": "Dataset", "author": "tester",
+    "datePublished": "2024-01-01", "description": "A valid dataset.", "keywords": [], "format": "csv"
+}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("invalid", [
+    {"@id": "ark:59852/invalid-dataset", "@type": "Dataset", "name": "Invalid"},
+    {"@id": "ark:59852/untyped"},
+], ids=["missing-fields", "untyped"])
+def test_model_validate_parallel_errors_match_serial(invalid, workers):
+    data = {"@context": {}, "@graph": [_PARALLEL_DATASET, _PARALLEL_DATASET, invalid]}
+    with pytest.raises(ValidationError) as serial:
+        ROCrateV1_2.model_validate(copy.deepcopy(data))
+    with pytest.raises(ValidationError) as parallel:
+        ROCrateV1_2.model_validate_parallel(data, workers=workers, chunk_size=1)
+
+    # the serial path reports the element's errors without its position in the graph
+    assert [error["loc"][:2] for error in parallel.value.errors()] == [("@graph", 2)] * serial.value.error_count()
+    assert [(error["loc"][2:], error["type"], error["msg"]) for error in parallel.value.errors()] == [
+        (error["loc"], error["type"], error["msg"]) for error in serial.value.errors()
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_model_validate_parallel_aggregates_errors(workers):
+    data = {
+        "@context": {},
+        "@graph": [
+            _PARALLEL_DATASET,
+            {"@id": "ark:59852/untyped"},
+            _PARALLEL_DATASET,
+            {"@id": "ark:59852/invalid-dataset", "@type": "Dataset", "name": "Invalid"},
+        ]
+    }
+    with pytest.raises(ValidationError) as excinfo:
+        ROCrateV1_2.model_validate_parallel(data, workers=workers, chunk_size=1)
+
+    locations = [error["loc"] for error in excinfo.value.errors()]
+    assert locations[0] == ("@graph", 1)
+    assert "Metadata element must have @type field" in excinfo.value.errors()[0]["msg"]
+    assert all(loc[:2] == ("@graph", 3) for loc in locations[1:])
+    assert ("@graph", 3, "author") in locations
+
+
+def test_graph_validation_error_keeps_custom_messages():
+    from fairscape_models.rocrate import _graph_validation_error
+    error = _graph_validation_error("ROCrateV1_2", [
+        {"type": "custom_check", "loc": ("@graph", 0, "name"), "msg": "Name is reserved", "input": "x"},
+    ])
+    assert error.errors()[0]["type"] == "custom_check"
+    assert error.errors()[0]["msg"] == "Name is reserved"
+    assert error.errors()[0]["loc"] == ("@graph", 0, "name")
+
+
+# ── streaming writer ────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+@pytest.mark.parametrize("dump_kwargs", [{}, {"indent": 2}, {"exclude_none": True}], ids=["compact", "indent", "exclude_none"])
+def test_write_matches_model_dump_json(rocrate_file_path: pathlib.Path, dump_kwargs):
+    import io
+    crate = ROCrateV1_2.model_validate_json(rocrate_file_path.read_text(encoding="utf-8"))
+    stream = io.StringIO()
+    crate.write(stream, **dump_kwargs)
+    assert stream.getvalue() == crate.model_dump_json(by_alias=True, **dump_kwargs)
+
+    # a null @context is written as null, or left out with exclude_none
+    crate.context = None
+    stream = io.StringIO()
+    crate.write(stream, **dump_kwargs)
+    assert stream.getvalue() == crate.model_dump_json(by_alias=True, **dump_kwargs)
+
+
+def test_write_to_path_and_binary_stream(comprehensive_rocrate_data, tmp_path):
+    import io
+    crate = ROCrateV1_2.model_validate(comprehensive_rocrate_data)
+    expected = crate.model_dump_json(by_alias=True, indent=2)
+
+    path = tmp_path / "ro-crate-metadata.json"
+    crate.write(path, indent=2)
+    assert path.read_text(encoding="utf-8") == expected
+
+    stream = io.BytesIO()
+    crate.write(stream, indent=2)
+    assert stream.getvalue().decode("utf-8") == expected
+
+
+def test_write_graph_from_generator(comprehensive_rocrate_data):
+    import io
+    import json
+    from fairscape_models.rocrate import write_graph
+    crate = ROCrateV1_2.model_validate(comprehensive_rocrate_data)
+
+    stream = io.StringIO()
+    write_graph(stream, (element for element in crate.metadataGraph), context=None)
+    written = json.loads(stream.getvalue())
+    assert "@context" not in written
+    assert written["@graph"] == json.loads(crate.model_dump_json(by_alias=True))["@graph"]
+
+    stream = io.StringIO()
+    write_graph(stream, [], indent=2)
+    assert json.loads(stream.getvalue())["@graph"] == []
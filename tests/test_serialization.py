@@ -0,0 +1,56 @@
+import pathlib
+import random
+
+import pytest
+
+from fairscape_models.serialization import dump_plan, dump_subset
+from fairscape_models.rocrate import ROCrateV1_2, ROCrateMetadataElem
+from fairscape_models.dataset import Dataset
+
+TEST_ROCRATES_PATH = pathlib.Path(__file__).parent / "test_rocrates"
+test_files = sorted(TEST_ROCRATES_PATH.rglob("ro-crate-metadata.json"))
+test_ids = [str(p.relative_to(TEST_ROCRATES_PATH)) for p in test_files]
+
+
+def _dataset(**extra):
+    return Dataset.model_validate({
+        "@id": "ark:59852/dataset", "@type": "https://w3id.org/EVI#Dataset",
+        "name": "Dataset", "author": "tester", "datePublished": "2024-01-01",
+        "description": "A dataset for testing.", "keywords": [], "format": "csv", **extra
+    })
+
+
+@pytest.mark.parametrize("rocrate_file_path", test_files, ids=test_ids)
+def test_subset_matches_full_dump(rocrate_file_path):
+    """Every subset equals the full dump restricted to the same keys."""
+    crate = ROCrateV1_2.model_validate_json(rocrate_file_path.read_text(encoding="utf-8"))
+    rng = random.Random(0)
+    for entity in crate.metadataGraph:
+        full = entity.model_dump(by_alias=True)
+        candidates = sorted(full) + ["missing", "name", "contentUrl", "@type"]
+        for _ in range(5):
+            keys = set(rng.sample(candidates, min(4, len(candidates))))
+            assert dump_subset(entity, keys) == {k: v for k, v in full.items() if k in keys}
+
+
+def test_extra_key_named_like_a_field():
+    """An extra property named like a field's attribute does not leak the field's alias."""
+    dataset = _dataset(metadataType="extra value")
+    assert dataset.__pydantic_extra__["metadataType"] == "extra value"
+
+    assert dump_subset(dataset, {"metadataType"}) == {"metadataType": "extra value"}
+    assert dump_subset(dataset, {"@type"}) == {"@type": dataset.model_dump(by_alias=True)["@type"]}
+
+
+def test_subset_options_and_empty_selection():
+    dataset = _dataset()
+    assert dump_subset(dataset, {"@id", "contentUrl"}) == {"@id": "ark:59852/dataset", "contentUrl": None}
+    assert dump_subset(dataset, {"@id", "contentUrl"}, exclude_none=True) == {"@id": "ark:59852/dataset"}
+    assert dump_subset(dataset, {"not-a-key"}) == {}
+
+
+def test_plans_are_cached_per_class_and_keys():
+    plan = dump_plan(ROCrateMetadataElem, ["@id", "name"])
+    assert dump_plan(ROCrateMetadataElem, frozenset({"name", "@id"})) is plan
+    assert plan.fields == {"guid", "name"}
+    assert dump_plan(Dataset, ["@id", "name"]) is not plan
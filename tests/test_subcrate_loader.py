@@ -0,0 +1,93 @@
+import json
+import os
+import pathlib
+
+import pytest
+
+from fairscape_models.rocrate import ROCrateV1_2
+from fairscape_models.conversion.mapping.AIReady import (
+    score_metadata_graph, score_rocrate, score_rocrate_with_errors, dump_for_scoring, root_guid,
+)
+from fairscape_models.conversion.subcrate_loader import SubcrateLoader, subcrate_paths
+
+TEST_ROCRATES_PATH = pathlib.Path(__file__).parent / "test_rocrates"
+RELEASE = TEST_ROCRATES_PATH / "release" / "ro-crate-metadata.json"
+SUBCRATE = TEST_ROCRATES_PATH / "LakeDB" / "ro-crate-metadata.json"
+
+
+@pytest.fixture
+def release(tmp_path):
+    """The release fixture with sub-crates in tmp_path: two valid, one invalid JSON, one missing."""
+    data = json.loads(RELEASE.read_text(encoding="utf-8"))
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "ro-crate-metadata.json").write_text(SUBCRATE.read_text(encoding="utf-8"), encoding="utf-8")
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+    paths = ["a/ro-crate-metadata.json", "a/ro-crate-metadata.json", "broken.json", "missing.json"]
+    subcrates = [item for item in data["@graph"] if "ro-crate-metadata" in item]
+    for item, path in zip(subcrates, paths):
+        item["ro-crate-metadata"] = path
+    for item in subcrates[len(paths):]:
+        del item["ro-crate-metadata"]
+    return ROCrateV1_2.model_validate(data), tmp_path
+
+
+@pytest.mark.parametrize("workers, processes", [(1, False), (4, False), (2, True)])
+def test_load_subcrates(release, workers, processes):
+    crate, base_dir = release
+    loader = SubcrateLoader(workers=workers, processes=processes)
+    loaded, errors = loader.load_subcrates(crate, base_dir)
+
+    guids = [guid for guid, _ in subcrate_paths(crate)]
+    assert [subcrate.guid for subcrate in loaded] == guids[:2]
+    assert loaded[0].crate is loaded[1].crate
+    assert len(loaded[0].crate.metadataGraph) == len(ROCrateV1_2.model_validate_json(SUBCRATE.read_text()).metadataGraph)
+    assert [(error.guid, error.error_type) for error in errors] == [
+        (guids[2], "JSONDecodeError"), (guids[3], "FileNotFoundError"),
+    ]
+    assert errors[1].path == str(base_dir / "missing.json")
+
+
+def test_cache_follows_mtime(release):
+    crate, base_dir = release
+    loader = SubcrateLoader(workers=1)
+    first = loader.load_subcrates(crate, base_dir).subcrates[0].crate
+    assert loader.load_subcrates(crate, base_dir).subcrates[0].crate is first
+    assert loader.hits == 1
+
+    path = base_dir / "a" / "ro-crate-metadata.json"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert loader.load_subcrates(crate, base_dir).subcrates[0].crate is not first
+
+    small = SubcrateLoader(workers=1, max_entries=0)
+    small.load_subcrates(crate, base_dir)
+    assert not small.cache
+
+
+def test_score_rocrate_reads_subcrates(release, monkeypatch):
+    crate, base_dir = release
+    monkeypatch.chdir(base_dir)
+    score, errors = score_rocrate_with_errors(crate, SubcrateLoader(workers=2))
+
+    root_id = root_guid(crate)
+    graph = [dump_for_scoring(entity, root_id) for entity in crate.metadataGraph]
+    for _ in range(2):
+        graph.extend(dump_for_scoring(entity, root_id) for entity in ROCrateV1_2.model_validate_json(SUBCRATE.read_text()).metadataGraph)
+    assert score.model_dump() == score_metadata_graph(graph).model_dump()
+    assert len(errors) == 2
+    assert score_rocrate(crate).model_dump() == score.model_dump()
+
+
+def test_concurrent_loads_keep_their_own_errors(release):
+    from concurrent.futures import ThreadPoolExecutor
+    crate, base_dir = release
+    loader = SubcrateLoader(workers=2)
+    good = [(None, str(base_dir / "a" / "ro-crate-metadata.json"))]
+    bad = [(None, str(base_dir / "missing.json"))]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        loads = list(executor.map(loader.load_paths, [good, bad] * 8))
+    for load in loads[::2]:
+        assert len(load.subcrates) == 1 and load.errors == []
+    for load in loads[1::2]:
+        assert load.subcrates == [] and [error.error_type for error in load.errors] == ["FileNotFoundError"]